@@ -38,7 +38,8 @@ setup(name='cfchecker',
       packages=find_packages('src'),
 
       include_package_data=True,
+      package_data={'cfchecker': ['data/*.pkl']},
       zip_safe=False,
-      install_requires=['netCDF4', 'numpy>=1.7', 'cfunits>=3.0.0', 'future'],
+      install_requires=['netCDF4', 'numpy>=1.7', 'cfunits>=3.0.0'],
       entry_points={'console_scripts': ['cfchecks = cfchecker.cfchecks:main']},
       )
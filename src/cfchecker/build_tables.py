@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""python -m cfchecker.build_tables [OPTIONS]
+
+Description:
+ Build snapshots of the CF standard name, area type and region name tables
+ for shipping in cfchecker/data.  When checking against the default (current)
+ tables, cfchecks uses these instead of downloading and parsing the tables.
+
+Options:
+ -a or --area_types:
+       the location of the CF area types table (xml)
+
+ -h or --help: Prints this help text
+
+ -o or --output_dir:
+       directory in which to write the snapshots [default cfchecker/data]
+
+ -r or --region_names:
+       the location of the CF standardized region names table (xml)
+
+ -s or --cf_standard_names:
+       the location of the CF standard name table (xml)
+"""
+import os
+import pickle
+import sys
+
+from cfchecker.cfchecks import (ConstructDict, ConstructList, STANDARDNAME, AREATYPES, REGIONNAMES,
+                                BUNDLED_TABLES)
+
+
+def build(source, default, handler, outputDir):
+    """Parse the table at source and pickle it to the bundled file for the default table"""
+    handler.parse(source, bundled=False)
+    entries = handler.dict if isinstance(handler, ConstructDict) else handler.list
+    data = {'entries': entries,
+            'version_number': handler.version_number,
+            'last_modified': handler.last_modified}
+
+    outFile = os.path.join(outputDir, BUNDLED_TABLES[default])
+    with open(outFile, 'wb') as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    print("Wrote %s (version %s, %d entries)" % (outFile, handler.version_number, len(entries)))
+
+
+def main():
+    from getopt import getopt, GetoptError
+
+    standardname = STANDARDNAME
+    areatypes = AREATYPES
+    regionnames = REGIONNAMES
+    outputDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+    try:
+        (opts, args) = getopt(sys.argv[1:], 'a:ho:r:s:',
+                              ['area_types=', 'help', 'output_dir=', 'region_names=', 'cf_standard_names='])
+    except GetoptError:
+        sys.stderr.write('%s\n' % __doc__)
+        sys.exit(1)
+
+    for a, v in opts:
+        if a in ('-a', '--area_types'):
+            areatypes = v.strip()
+        elif a in ('-h', '--help'):
+            print(__doc__)
+            sys.exit(0)
+        elif a in ('-o', '--output_dir'):
+            outputDir = v.strip()
+        elif a in ('-r', '--region_names'):
+            regionnames = v.strip()
+        elif a in ('-s', '--cf_standard_names'):
+            standardname = v.strip()
+
+    if not os.path.isdir(outputDir):
+        os.makedirs(outputDir)
+
+    build(standardname, STANDARDNAME, ConstructDict(), outputDir)
+    build(areatypes, AREATYPES, ConstructList(), outputDir)
+    build(regionnames, REGIONNAMES, ConstructList(), outputDir)
+
+
+if __name__ == '__main__':
+    main()
@@ -42,37 +42,39 @@ Options:
  --cache_dir:
        directory in which to store cached tables
 
-"""
-from __future__ import print_function
-
-from builtins import str
-from builtins import next
-from builtins import map
+ --full_bounds_check:
+       check every point of a coordinate lies within its cell bounds, rather than a
+       sample of the points of very long coordinates
 
-import numpy as np
-from past.builtins import basestring
-from builtins import object
+ --workers <n>:
+       check up to n files at once in separate processes [default: the number of CPUs].
+       1 checks the files one after another in this process.
 
+"""
+import functools
+import hashlib
 import numpy
 import os
+import pickle
 import re
-import string
 import sys
 import time
 
-if sys.version_info[:2] < (2, 7):
-    from ordereddict import OrderedDict
-else:
-    from collections import OrderedDict
-    from collections import defaultdict
-
-# Ignore Future warnings in numpy for now
+# Ignore Future warnings in numpy for now, unless warnings have been configured
+# explicitly (e.g. via PYTHONWARNINGS or -W)
 import warnings
-warnings.filterwarnings("ignore", category=FutureWarning)
+if not sys.warnoptions:
+    warnings.filterwarnings("ignore", category=FutureWarning)
 
 import netCDF4
 
-from cfunits import Units
+try:
+    from cfunits import Units
+    _CFUNITS_ERROR = None
+except (ImportError, OSError) as err:
+    # cfunits is not installed, or can't load the UDUNITS-2 library.  Reported by main()
+    Units = None
+    _CFUNITS_ERROR = err
 
 # Version is imported from the package module cfchecker/__init__.py
 from cfchecker import __version__
@@ -81,42 +83,152 @@ STANDARDNAME = 'http://cfconventions.org/Data/cf-standard-names/current/src/cf-s
 AREATYPES = 'http://cfconventions.org/Data/area-type-table/current/src/area-type-table.xml'
 REGIONNAMES = 'http://cfconventions.org/Data/standardized-region-list/standardized-region-list.xml'
 
+# Snapshots of the default tables, built by cfchecker.build_tables, that may be shipped in cfchecker/data
+BUNDLED_TABLES = {STANDARDNAME: 'standard_names.pkl',
+                  AREATYPES: 'area_types.pkl',
+                  REGIONNAMES: 'region_names.pkl'}
+
 # -----------------------------------------------------------
-from xml.sax import ContentHandler
-from xml.sax import make_parser
-from xml.sax.handler import feature_namespaces
+try:
+    from lxml import etree
+    _LXML = True
+except ImportError:
+    # lxml not available; fall back to the (slower) ElementTree from the standard library
+    from xml.etree import ElementTree as etree
+    _LXML = False
+
+
+_WS_RE = re.compile(r'\s+')
 
 
 def normalize_whitespace(text):
     """Remove redundant whitespace from a string."""
-    return ' '.join(text.split())
+    return _WS_RE.sub(' ', text).strip()
 
 
-def isnt_str_or_basestring(thing):
-    """
-    check if the passed in thing is a str, or if running under python 2,
-    a basestring
-    """
+_URL_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*://')
 
-    if sys.version_info[:2] < (3,0):
-        return not isinstance(thing, str) and not isinstance(thing, basestring)
-    else:
-        return not isinstance(thing, str)
+# Seconds to wait for a table server to accept the connection and to send more data
+_URL_TIMEOUT = (10, 60)
 
 
-def is_str_or_basestring(thing):
-    """
-    check if the passed in thing is a str, or if running under python 2,
-    a basestring
-    """
+def open_table(source):
+    """Open a CF table given as either a local path or a URL, returning a binary file object.
+    URLs are streamed, so that parsing can proceed while the table is still downloading."""
+    if _URL_RE.match(source):
+        try:
+            import requests
+        except ImportError:
+            from urllib.request import urlopen
+            return urlopen(source, timeout=_URL_TIMEOUT[1])
+        r = requests.get(source, stream=True, timeout=_URL_TIMEOUT)
+        r.raise_for_status()
+        # Let urllib3 undo any gzip/deflate transfer encoding as the body is read
+        r.raw.decode_content = True
+        return r.raw
+    return open(source, 'rb')
+
+
+def iter_table(source, tags):
+    """Parse a CF table, yielding each element whose tag is in tags.
+
+    Local tables are small enough to be parsed into a tree in one go, which is quicker.
+    Tables fetched from a URL are parsed incrementally as they download, and elements
+    are cleared once the caller has processed them to keep memory bounded."""
+    if not _URL_RE.match(source):
+        if _LXML:
+            parser = etree.XMLParser(collect_ids=False, huge_tree=True, remove_blank_text=True)
+            with open(source, 'rb') as f:
+                root = etree.parse(f, parser).getroot()
+            for elem in root.iter(*tags):
+                yield elem
+        else:
+            with open(source, 'rb') as f:
+                root = etree.parse(f).getroot()
+            for elem in root.iter():
+                if elem.tag in tags:
+                    yield elem
+        return
+
+    with open_table(source) as f:
+        if _LXML:
+            for event, elem in etree.iterparse(f, events=('end',), tag=tags):
+                yield elem
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        else:
+            # ElementTree can't filter by tag, or remove elements already seen without
+            # tracking their parents, so just empty the ones yielded
+            for event, elem in etree.iterparse(f, events=('end',)):
+                if elem.tag in tags:
+                    yield elem
+                    elem.clear()
+
+
+def bundled_table(source):
+    """Return the snapshot of the table at source shipped with the package, as a dict with
+    keys 'entries', 'version_number' and 'last_modified', or None if there isn't one."""
+    name = BUNDLED_TABLES.get(source)
+    if name is None:
+        return None
+    try:
+        from importlib.resources import files
+        return pickle.loads(files('cfchecker').joinpath('data').joinpath(name).read_bytes())
+    except Exception:
+        # Not shipped, or unreadable; fall back to parsing the table
+        return None
+
 
-    return not isnt_str_or_basestring(thing)
+def cache_file(cacheDir, name, source=None):
+    """Return the path (without the .pkl suffix) of the cache file for the table at source.
+    The name of the file includes a hash of source, so that different tables are cached separately."""
+    if source is None:
+        return os.path.join(cacheDir, name)
+    return os.path.join(cacheDir, '%s_%s' % (name, hashlib.sha1(source.encode('utf-8')).hexdigest()))
+
+
+def read_cache(cacheFile, cacheTime, source=None):
+    """Return the data pickled to cacheFile.pkl if it is less than cacheTime seconds old and,
+    when source is a local file, was written after the file was last modified.  Otherwise None."""
+    try:
+        with open('%s.pkl' % cacheFile, 'rb') as f:
+            data = pickle.load(f)
+        ctime = data['__ctime__']
+        if time.time() - ctime >= cacheTime:
+            return None
+        if source is not None and not _URL_RE.match(source) and os.path.getmtime(source) > ctime:
+            return None
+        return data
+    except Exception:
+        # No cache file, or one that cannot be read
+        return None
+
+
+def write_cache(cacheFile, data):
+    """Pickle data to cacheFile.pkl, replacing any existing file atomically."""
+    tmpFile = '%s.pkl.%d' % (cacheFile, os.getpid())
+    with open(tmpFile, 'wb') as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmpFile, '%s.pkl' % cacheFile)
+
+
+def isnt_str_or_basestring(thing):
+    """check if the passed in thing is not a str"""
+    return not isinstance(thing, str)
+
+
+def is_str_or_basestring(thing):
+    """check if the passed in thing is a str"""
+    return isinstance(thing, str)
 
 
 class CFVersion(object):
     """A CF version number, stored as a tuple, that can be instantiated with 
     a tuple or a string, written out as a string, and compared with another version"""
 
+    __slots__ = ('tuple',)
+
     def __init__(self, value=()):
         """Instantiate CFVersion with a string or with a tuple of ints"""
         if isinstance(value, str):
@@ -135,39 +247,25 @@ class CFVersion(object):
     def __str__(self):
         return "CF-%s" % ".".join(map(str, self.tuple))
 
-    def __cmp__(self, other):
-
-        # maybe overkill but allow for different lengths in future e.g. 3.2 and 3.2.1
-        pos = 0
-        while True:
-            in_s = (pos < len(self.tuple))
-            in_o = (pos < len(other.tuple))
-            if in_s:
-                if in_o:
-                    c = (self.tuple[pos] > other.tuple[pos]) - (self.tuple[pos] < other.tuple[pos])
-                    if c != 0:
-                        return c  # e.g. 1.x <=> 1.y
-                else:  # in_s and not in_o
-                    return 1  # e.g. 3.2.1 > 3.2
-            else:
-                if in_o:  # and not in_s
-                    return -1  # e.g. 3.2 < 3.2.1
-                else:  # not in_s and not in_o
-                    return 0  # e.g. 3.2 == 3.2
-            pos += 1
-
+    # Tuples compare lexicographically, which also orders versions of different
+    # lengths correctly e.g. 3.2 < 3.2.1
     def __eq__(self, other):
         return self.tuple == other.tuple
 
+    def __lt__(self, other):
+        return self.tuple < other.tuple
+
+    def __le__(self, other):
+        return self.tuple <= other.tuple
+
+    def __gt__(self, other):
+        return self.tuple > other.tuple
+
     def __ge__(self, other):
-        if self.__cmp__(other) >= 0:
-            return True
-        return False
+        return self.tuple >= other.tuple
 
-    def __lt__(self, other):
-        if self.__cmp__(other) < 0:
-            return True
-        return False
+    def __hash__(self):
+        return hash(self.tuple)
 
 
 vn1_0 = CFVersion((1, 0))
@@ -182,231 +280,655 @@ vn1_8 = CFVersion((1, 8))
 cfVersions = [vn1_0, vn1_1, vn1_2, vn1_3, vn1_4, vn1_5, vn1_6, vn1_7, vn1_8]
 newest_version = max(cfVersions)
 
-
-class ConstructDict(ContentHandler):
+# The versions as they appear in the Conventions attribute
+_CF_VERSION_STRS = frozenset(map(str, cfVersions))
+
+# Valid attributes, their corresponding Type; S(tring), N(umeric) D(ata variable type)
+# and Use C(oordinate), D(ata non-coordinate) or G(lobal) variable, for CF-1.0
+_BASE_ATTR_LIST = {'add_offset':                ['N', 'D'],
+                   'ancillary_variables':       ['S', 'D'],
+                   'axis':                      ['S', 'C'],
+                   'bounds':                    ['S', 'C'],
+                   'calendar':                  ['S', 'C'],
+                   'cell_measures':             ['S', 'D'],
+                   'cell_methods':              ['S', 'D'],
+                   'climatology':               ['S', 'C'],
+                   'comment':                   ['S', ('G', 'D')],
+                   'compress':                  ['S', 'C'],
+                   'Conventions':               ['S', 'G'],
+                   'coordinates':               ['S', 'D'],
+                   '_FillValue':                ['D', 'D'],
+                   'flag_meanings':             ['S', 'D'],
+                   'flag_values':               ['D', 'D'],
+                   'formula_terms':             ['S', 'C'],
+                   'grid_mapping':              ['S', 'D'],
+                   'history':                   ['S', 'G'],
+                   'institution':               ['S', ('G', 'D')],
+                   'leap_month':                ['N', 'C'],
+                   'leap_year':                 ['N', 'C'],
+                   'long_name':                 ['S', ('C', 'D')],
+                   'missing_value':             ['D', 'D'],
+                   'month_lengths':             ['N', 'C'],
+                   'positive':                  ['S', 'C'],
+                   'references':                ['S', ('G', 'D')],
+                   'scale_factor':              ['N', 'D'],
+                   'source':                    ['S', ('G', 'D')],
+                   'standard_error_multiplier': ['N', 'D'],
+                   'standard_name':             ['S', ('C', 'D')],
+                   'title':                     ['S', 'G'],
+                   'units':                     ['S', ('C', 'D')],
+                   'valid_max':                 ['N', ('C', 'D')],
+                   'valid_min':                 ['N', ('C', 'D')],
+                   'valid_range':               ['N', ('C', 'D')]}
+
+# Changes to _BASE_ATTR_LIST made by later versions of CF
+_ATTR_PATCHES = {vn1_3: {'flag_masks': ['D', 'D']},
+                 vn1_6: {'cf_role':            ['S', 'C'],
+                         '_FillValue':         ['D', ('C', 'D')],
+                         'featureType':        ['S', 'G'],
+                         'instance_dimension': ['S', 'D'],
+                         'missing_value':      ['D', ('C', 'D')],
+                         'sample_dimension':   ['S', 'D']},
+                 vn1_7: {'actual_range':           ['N', ('C', 'D')],
+                         'add_offset':             ['N', ('C', 'D')],
+                         'comment':                ['S', ('G', 'C', 'D')],
+                         'computed_standard_name': ['S', 'C'],
+                         'external_variables':     ['S', 'G'],
+                         'instance_dimension':     ['S', '-'],
+                         'sample_dimension':       ['S', '-'],
+                         'scale_factor':           ['N', ('C', 'D')]},
+                 vn1_8: {'coordinates':      ['S', ('D', 'M')],
+                         'geometry':         ['S', ('C', 'D')],
+                         'geometry_type':    ['S', 'M'],
+                         'grid_mapping':     ['S', ('D', 'M')],
+                         'history':          ['S', ('G', 'Gr')],
+                         'interior_ring':    ['S', 'M'],
+                         'node_coordinates': ['S', 'M'],
+                         'node_count':       ['S', 'M'],
+                         'nodes':            ['S', 'C'],
+                         'part_node_count':  ['S', 'M'],
+                         'title':            ['S', ('G', 'Gr')]}}
+
+
+@functools.lru_cache(maxsize=None)
+def _attr_list_for(version):
+    """The dictionary of valid attributes (see _BASE_ATTR_LIST) for the given CF version.
+       This is shared by all checks against the version, so must not be modified."""
+    attrList = dict(_BASE_ATTR_LIST)
+    for vn, patch in _ATTR_PATCHES.items():
+        if version >= vn:
+            attrList.update(patch)
+    return attrList
+
+
+# Valid grid mapping attributes and their types
+_GRID_MAPPING_ATTRS = {'azimuth_of_central_line': 'N',
+                       'crs_wkt': 'S',
+                       'earth_radius': 'N',
+                       'false_easting': 'N',
+                       'false_northing': 'N',
+                       'geographic_crs_name': 'S',
+                       'geoid_name': 'S',
+                       'geopotential_datum_name': 'S',
+                       'grid_mapping_name': 'S',
+                       'grid_north_pole_latitude': 'N',
+                       'grid_north_pole_longitude': 'N',
+                       'horizontal_datum_name': 'S',
+                       'inverse_flattening': 'N',
+                       'latitude_of_projection_origin': 'N',
+                       'longitude_of_central_meridian': 'N',
+                       'longitude_of_prime_meridian': 'N',
+                       'longitude_of_projection_origin': 'N',
+                       'north_pole_grid_longitude': 'N',
+                       'perspective_point_height': 'N',
+                       'prime_meridian_name': 'S',
+                       'projected_crs_name': 'S',
+                       'reference_ellipsoid_name': 'S',
+                       'scale_factor_at_central_meridian': 'N',
+                       'scale_factor_at_projection_origin': 'N',
+                       'semi_major_axis': 'N',
+                       'semi_minor_axis': 'N',
+                       'standard_parallel': 'N',
+                       'straight_vertical_longitude_from_pole': 'N',
+                       'towgs84': 'N'}
+
+# Valid values of grid_mapping_name, and those added at later CF versions
+_GRID_MAPPING_NAMES = ('albers_conical_equal_area',
+                       'azimuthal_equidistant',
+                       'lambert_azimuthal_equal_area',
+                       'lambert_conformal_conic',
+                       'polar_stereographic',
+                       'rotated_latitude_longitude',
+                       'stereographic',
+                       'transverse_mercator')
+_GRID_MAPPING_NAME_PATCHES = {vn1_2: ('latitude_longitude', 'vertical_perspective'),
+                              vn1_4: ('lambert_cylindrical_equal_area', 'mercator', 'orthographic'),
+                              vn1_7: ('geostationary', 'oblique_mercator', 'sinusoidal')}
+
+# From CF-1.7, grid mapping attributes which must all be present if any one is
+_CRS_NAME_ATTRIBUTES = ('reference_ellipsoid_name', 'prime_meridian_name', 'horizontal_datum_name',
+                        'geographic_crs_name')
+
+
+@functools.lru_cache(maxsize=None)
+def _grid_mapping_names_for(version):
+    """The set of valid grid_mapping_name values for the given CF version"""
+    validNames = set(_GRID_MAPPING_NAMES)
+    for vn, names in _GRID_MAPPING_NAME_PATCHES.items():
+        if version >= vn:
+            validNames.update(names)
+    return frozenset(validNames)
+
+
+_BADC_UNITS_FILE = "/usr/local/cf-checker/lib/badc_units.txt"
+
+
+@functools.lru_cache(maxsize=None)
+def _badc_units(path=_BADC_UNITS_FILE):
+    """The set of units allowed by BADC, read from the units file on first use"""
+    with open(path) as f:
+        return frozenset(unit for line in f for unit in line.split())
+
+
+# Standard names of the parametric vertical coordinates with a formula_terms attribute,
+# and the key in _FORMULAS etc. of the formulas they use
+_FORMULA_ALIASES = {'atmosphere_ln_pressure_coordinate': 'atmosphere_ln_pressure_coordinate',
+                    'atmosphere_sigma_coordinate': 'sigma',
+                    'sigma': 'sigma',
+                    'atmosphere_hybrid_sigma_pressure_coordinate': 'hybrid_sigma_pressure',
+                    'hybrid_sigma_pressure': 'hybrid_sigma_pressure',
+                    'atmosphere_hybrid_height_coordinate': 'atmosphere_hybrid_height_coordinate',
+                    'atmosphere_sleve_coordinate': 'atmosphere_sleve_coordinate',
+                    'ocean_sigma_coordinate': 'ocean_sigma_coordinate',
+                    'ocean_s_coordinate': 'ocean_s_coordinate',
+                    'ocean_s_coordinate_g1': 'ocean_s_coordinate_g1',
+                    'ocean_s_coordinate_g2': 'ocean_s_coordinate_g2',
+                    'ocean_sigma_z_coordinate': 'ocean_sigma_z_coordinate',
+                    'ocean_double_sigma_coordinate': 'ocean_double_sigma_coordinate'}
+
+# Valid formulas for each parametric vertical coordinate
+_FORMULAS = {'atmosphere_ln_pressure_coordinate': ['p(k)=p0*exp(-lev(k))'],
+             'sigma': ['p(n,k,j,i)=ptop+sigma(k)*(ps(n,j,i)-ptop)'],
+             'hybrid_sigma_pressure': ['p(n,k,j,i)=a(k)*p0+b(k)*ps(n,j,i)',
+                                       'p(n,k,j,i)=ap(k)+b(k)*ps(n,j,i)'],
+             'atmosphere_hybrid_height_coordinate': ['z(n,k,j,i)=a(k)+b(k)*orog(n,j,i)'],
+             'atmosphere_sleve_coordinate': ['z(n,k,j,i) = a(k)*ztop + b1(k)*zsurf1(n,j,i) + b2(k)*zsurf2(n,j,i)'],
+             'ocean_sigma_coordinate': ['z(n,k,j,i)=eta(n,j,i)+sigma(k)*(depth(j,i)+eta(n,j,i))'],
+             'ocean_s_coordinate': ['z(n,k,j,i)=eta(n,j,i)*(1+s(k))+depth_c*s(k)+(depth(j,i)-depth_c)*C(k)',
+                                    'C(k)=(1-b)*sinh(a*s(k))/sinh(a)+b*[tanh(a*(s(k)+0.5))/(2*tanh(0.5*a))-0.5]'],
+             'ocean_s_coordinate_g1': ['z(n,k,j,i) = S(k,j,i) + eta(n,j,i) * (1 + S(k,j,i) / depth(j,i))',
+                                       'z(n,k,j,i) = S(k,j,i) + eta(n,j,i) * (1 + S(k,j,i) / depth(j,i))'],
+             'ocean_s_coordinate_g2': ['z(n,k,j,i) = eta(n,j,i) + (eta(n,j,i) + depth(j,i)) * S(k,j,i)',
+                                       'S(k,j,i) = (depth_c * s(k) + depth(j,i) * C(k)) / (depth_c + depth(j,i))'],
+             'ocean_sigma_z_coordinate': ['z(n,k,j,i)=eta(n,j,i)+sigma(k)*(min(depth_c,depth(j,i))+eta(n,j,i))',
+                                          'z(n,k,j,i)=zlev(k)'],
+             'ocean_double_sigma_coordinate': ['z(k,j,i)=sigma(k)*f(j,i)',
+                                               'z(k,j,i)=f(j,i)+(sigma(k)-1)*(depth(j,i)-f(j,i))',
+                                               'f(j,i)=0.5*(z1+z2)+0.5*(z1-z2)*tanh(2*a/(z1-z2)*(depth(j,i)-href))']}
+# Names appearing in the formulas for each parametric vertical coordinate
+_FORMULA_NAMES = {stdName: frozenset(name for formula in formulas
+                                     for name in re.findall(r'[A-Za-z_][A-Za-z_0-9]*', formula))
+                  for stdName, formulas in _FORMULAS.items()}
+
+# Valid standard_names for the variables named by the formula_terms attribute of each
+# parametric vertical coordinate, and the valid computed_standard_names (csn) of the
+# coordinate itself.  ['set'] means the names come from one of the _FT_STDNAME_SETS
+_FT_VAR_STDNAMES = {'atmosphere_ln_pressure_coordinate': {'p0': ['reference_air_pressure_for_atmosphere_vertical_coordinate'],
+                                                          'csn': ['air_pressure']},
+                    'sigma': {'ptop': ['air_pressure_at_top_of_atmosphere_model'],
+                              'ps': ['surface_air_pressure'],
+                              'csn': ['air_pressure']},
+                    'hybrid_sigma_pressure': {'p0': ['reference_air_pressure_for_atmosphere_vertical_coordinate'],
+                                              'ps': ['surface_air_pressure'],
+                                              'csn': ['air_pressure']},
+                    'atmosphere_hybrid_height_coordinate': {'orog': ['surface_altitude', 'surface_height_above_geopotential_datum'],
+                                                            'a': ['atmosphere_hybrid_height_coordinate'],
+                                                            'csn': ['altitude', 'height_above_geopotential_datum']},
+                    'atmosphere_sleve_coordinate': {'ztop': ['altitude_at_top_of_atmosphere_model', 'height_above_geopotential_datum_at_top_of_atmosphere_model'],
+                                                    'csn': ['altitude', 'height_above_geopotential_datum']},
+                    'ocean_sigma_coordinate': {'eta': ['set'],
+                                               'depth': ['set'],
+                                               'csn': ['set']},
+                    'ocean_s_coordinate': {'eta': ['set'],
+                                           'depth': ['set'],
+                                           'csn': ['set']},
+                    'ocean_s_coordinate_g1': {'eta': ['set'],
+                                              'depth': ['set'],
+                                              'csn': ['set']},
+                    'ocean_s_coordinate_g2': {'eta': ['set'],
+                                              'depth': ['set'],
+                                              'csn': ['set']},
+                    'ocean_sigma_z_coordinate': {'eta': ['set'],
+                                                 'depth': ['set'],
+                                                 'zlev': ['set'],
+                                                 'csn': ['set']},
+                    'ocean_double_sigma_coordinate': {'depth': ['set'],
+                                                      'csn': ['set']}}
+
+# Consistent sets of standard_names for the ocean parametric vertical coordinates
+_FT_STDNAME_SETS = {0: {'zlev': ['altitude'],
+                        'eta': ['sea_surface_height_above_geoid'],
+                        'depth': ['sea_floor_depth_below_geoid'],
+                        'csn': ['altitude']},
+                    1: {'zlev': ['height_above_geopotential_datum'],
+                        'eta': ['sea_surface_height_above_geopotential_datum'],
+                        'depth': ['sea_floor_depth_below_geopotential_datum'],
+                        'csn': ['height_above_geopotential_datum']},
+                    2: {'zlev': ['height_above_reference_ellipsoid'],
+                        'eta': ['sea_surface_height_above_reference_ellipsoid'],
+                        'depth': ['sea_floor_depth_below_reference_ellipsoid'],
+                        'csn': ['height_above_reference_ellipsoid']},
+                    3: {'zlev': ['height_above_mean_sea_level'],
+                        'eta': ['sea_surface_height_above_mean_ sea_level'],
+                        'depth': ['sea_floor_depth_below_mean_ sea_level'],
+                        'csn': ['height_above_mean_sea_level']}}
+
+
+class ConstructDict(object):
     """Parse the xml standard_name table, reading all entries into a dictionary;
        storing standard_name and units.
 
-       If useShelve is True, a python shelve file will be used. If the file is
-       present and less than 600 seconds old, the existing contents will be used,
-       otherwise the standard name table will be parsed and written to the shelf 
-       file.
+       If useShelve is True, the parsed table is cached in a pickle file in cacheDir.
+       If the file is present and less than cacheTime seconds old (and newer than the
+       table at source, if that is a local file), its contents will be used, otherwise
+       the standard name table will be parsed and written to the cache file.  The name
+       of the cache file depends on source, so that different tables are cached separately.
     """
-    def __init__(self, useShelve=False, shelveFile=None, cacheTime=0, cacheDir='/tmp'):
-        self.inUnitsContent = 0
-        self.inEntryIdContent = 0
-        self.inVersionNoContent = 0
-        self.inLastModifiedContent = 0
+    def __init__(self, useShelve=False, shelveFile=None, cacheTime=0, cacheDir='/tmp', source=None):
+        self._aliases = []
         self.current = False
         self.useShelve = useShelve
+        self.dict = {}
 
         if useShelve:
-            import shelve
-            if shelveFile is None:
-                self.shFile = os.path.join(cacheDir, 'cfexpr_cache')
-            else:
-                self.shFile = os.path.join(cacheDir, shelveFile)
-            now = time.time()
-            exists = os.path.isfile(self.shFile) or os.path.isfile('%s.dat' % self.shFile)
-            self.dict = shelve.open(self.shFile)
-
-            if exists:
-                ctime = self.dict['__contentTime__']
-                self.current = (now-ctime) < cacheTime
-            else:
-                self.current = False
+            self.shFile = cache_file(cacheDir, shelveFile or 'cfexpr_cache', source)
+            self.contentTime = time.time()
+
+            data = read_cache(self.shFile, cacheTime, source)
+            self.current = data is not None
             if self.current:
-                self.version_number, self.last_modified = self.dict['__info__']
-            else:
-                self.dict['__contentTime__'] = now
-        else:
-            self.dict = {}
+                self.dict = data['entries']
+                self.version_number = data['version_number']
+                self.last_modified = data['last_modified']
     
     def close(self):
-        if self.useShelve:
-            self.dict['__info__'] = (self.version_number, self.last_modified)
-            self.dict.close()
-            
-    def startElement(self, name, attrs):
-        # If it's an entry element, save the id
-        if name == 'entry':
-            id = normalize_whitespace(attrs.get('id', ""))
-            self.this_id = str(id)
-
-        # If it's the start of a canonical_units element
-        elif name == 'canonical_units':
-            self.inUnitsContent = 1
-            self.units = ""
-
-        elif name == 'alias':
-            id = normalize_whitespace(attrs.get('id', ""))
-            self.this_id = str(id)
-
-        elif name == 'entry_id':
-            self.inEntryIdContent = 1
-            self.entry_id = ""
-
-        elif name == 'version_number':
-            self.inVersionNoContent = 1
-            self.version_number = ""
-
-        elif name == 'last_modified':
-            self.inLastModifiedContent = 1
-            self.last_modified = ""
-
-    def characters(self, ch):
-        if self.inUnitsContent:
-            self.units = self.units + ch
-
-        elif self.inEntryIdContent:
-            self.entry_id = self.entry_id + ch
-
-        elif self.inVersionNoContent:
-            self.version_number = self.version_number + ch
-
-        elif self.inLastModifiedContent:
-            self.last_modified = self.last_modified + ch
-
-    def endElement(self, name):
-        # If it's the end of the canonical_units element, save the units
-        if name == 'canonical_units':
-            self.inUnitsContent = 0
-            self.units = normalize_whitespace(self.units)
-            self.dict[self.this_id] = self.units
-            
-        # If it's the end of the entry_id element, find the units for the self.alias
-        elif name == 'entry_id':
-            self.inEntryIdContent = 0
-            self.entry_id = str(normalize_whitespace(self.entry_id))
-            try: 
-                self.dict[self.this_id] = self.dict[self.entry_id]
-            except KeyError:
-                self._add_warn("Error in standard_name table:  entry_id '%s' not found. "
-                               "Please contact Rosalyn Hatcher (r.s.hatcher@reading.ac.uk)" %
-                               self.entry_id)
+        if self.useShelve and not self.current:
+            write_cache(self.shFile, {'entries': self.dict,
+                                      '__ctime__': self.contentTime,
+                                      'version_number': self.version_number,
+                                      'last_modified': self.last_modified})
+            # The cache now matches the table, so there is nothing more to write
+            self.current = True
+
+    def parse(self, source, bundled=True):
+        """Parse the standard_name table at source (a path or URL) into self.dict.
+        If bundled is True, a snapshot of the table shipped with the package is used
+        instead where there is one."""
+        data = bundled_table(source) if bundled else None
+        if data is not None:
+            self.dict.update(data['entries'])
+            self.version_number = data['version_number']
+            self.last_modified = data['last_modified']
+            return
+
+        for elem in iter_table(source, ('entry', 'alias', 'version_number', 'last_modified')):
+            if elem.tag == 'entry':
+                units = elem.findtext('canonical_units')
+                if units is not None:
+                    # Many entries share the same units, so intern them (and the names) to
+                    # store each distinct string once
+                    self.dict[sys.intern(normalize_whitespace(elem.get('id', "")))] = \
+                        sys.intern(normalize_whitespace(units))
+
+            elif elem.tag == 'alias':
+                self._aliases.append((sys.intern(normalize_whitespace(elem.get('id', ""))),
+                                      normalize_whitespace(elem.findtext('entry_id', ""))))
 
-        # If it's the end of the version_number element, save it
-        elif name == 'version_number':
-            self.inVersionNoContent = 0
-            self.version_number = normalize_whitespace(self.version_number)
+            elif elem.tag == 'version_number':
+                self.version_number = normalize_whitespace(elem.text or "")
+
+            else:
+                self.last_modified = normalize_whitespace(elem.text or "")
 
-        # If it's the end of the last_modified element, save the last modified date
-        elif name == 'last_modified':
-            self.inLastModifiedContent = 0
-            self.last_modified = normalize_whitespace(self.last_modified)
+        # Resolve the aliases once all the entries are known, so that they don't
+        # depend on the order of the table
+        for alias, entry_id in self._aliases:
+            try:
+                self.dict[alias] = self.dict[entry_id]
+            except KeyError:
+                warnings.warn("Error in standard_name table:  entry_id '%s' not found. "
+                              "Please contact Rosalyn Hatcher (r.s.hatcher@reading.ac.uk)" % entry_id)
+        self._aliases = []
 
 
-class ConstructList(ContentHandler):
+class ConstructList(object):
     """Parse the xml area_type table, reading all area_types 
-       into a list.
+       into a frozenset.
+
+       If useShelve is True, the parsed table is cached in a pickle file in cacheDir,
+       in the same way as for ConstructDict.
     """
-    def __init__(self, useShelve=False, shelveFile=None, cacheTime=0, cacheDir='/tmp'):
-        self.inVersionNoContent = 0
-        self.inLastModifiedContent = 0
+    def __init__(self, useShelve=False, shelveFile=None, cacheTime=0, cacheDir='/tmp', source=None):
         self.current = False
         self.useShelve = useShelve
+        self.list = set()
 
         if useShelve:
-            import shelve
-            if shelveFile is None:
-                self.shFile = os.path.join(cacheDir, 'cfexpr_cachel')
-            else:
-                self.shFile = os.path.join(cacheDir, shelveFile)
-            now = time.time()
-            exists = os.path.isfile(self.shFile) or os.path.isfile('%s.dat' % self.shFile)
-            self.list = shelve.open(self.shFile)
-
-            if exists:
-                ctime = self.list['__contentTime__']
-                self.current = (now-ctime) < cacheTime
-            else:
-                self.current = False
-            if self.current:
-                self.version_number, self.last_modified = self.list['__info__']
-            else:
-                self.list['__contentTime__'] = now
+            self.shFile = cache_file(cacheDir, shelveFile or 'cfexpr_cachel', source)
+            self.contentTime = time.time()
 
-        else:
-            self.list = set()
+            data = read_cache(self.shFile, cacheTime, source)
+            self.current = data is not None
+            if self.current:
+                self.list = data['entries']
+                self.version_number = data['version_number']
+                self.last_modified = data['last_modified']
 
     def close(self):
-        if self.useShelve:
-            self.list['__info__'] = (self.version_number,self.last_modified)
-            self.list.close()
-        
-    def startElement(self, name, attrs):
-        # If it's an entry element, save the id
-        if name == 'entry':
-            id = str( normalize_whitespace(attrs.get('id', "")))
-            if self.useShelve:
-              self.list[id] = id
-            else:
-              self.list.add(id)
-
-        elif name == 'version_number':
-            self.inVersionNoContent = 1
-            self.version_number = ""
-
-        elif name == 'date':
-            self.inLastModifiedContent = 1
-            self.last_modified = ""
-
-    def characters(self, ch):
-        if self.inVersionNoContent:
-            self.version_number = self.version_number + ch
+        if self.useShelve and not self.current:
+            write_cache(self.shFile, {'entries': self.list,
+                                      '__ctime__': self.contentTime,
+                                      'version_number': self.version_number,
+                                      'last_modified': self.last_modified})
+            # The cache now matches the table, so there is nothing more to write
+            self.current = True
+
+    def parse(self, source, bundled=True):
+        """Parse the area_type (or region name) table at source (a path or URL) into self.list.
+        If bundled is True, a snapshot of the table shipped with the package is used
+        instead where there is one."""
+        data = bundled_table(source) if bundled else None
+        if data is not None:
+            self.list = frozenset(data['entries'])
+            self.version_number = data['version_number']
+            self.last_modified = data['last_modified']
+            return
 
-        elif self.inLastModifiedContent:
-            self.last_modified = self.last_modified + ch
+        for elem in iter_table(source, ('entry', 'version_number', 'date')):
+            if elem.tag == 'entry':
+                self.list.add(sys.intern(normalize_whitespace(elem.get('id', ""))))
+            elif elem.tag == 'version_number':
+                self.version_number = normalize_whitespace(elem.text or "")
+            else:
+                self.last_modified = normalize_whitespace(elem.text or "")
+
+        self.list = frozenset(self.list)
+
+
+# Transformation rules for derived standard names (see the CF standard names document).
+# Each rule is a fixed prefix followed by one or more names separated by the given joiners.
+_DERIVED_NAME_RULES = {'direction_of_': (),
+                       'magnitude_of_': (),
+                       'square_of_': (),
+                       'divergence_of_': (),
+                       'rate_of_change_of_': (),
+                       'product_of_': ('_and_',),
+                       'ratio_of_': ('_to_',),
+                       'derivative_of_': ('_wrt_',),
+                       'correlation_over_': ('_of_', '_and_'),
+                       'covariance_over_': ('_of_', '_and_'),
+                       'histogram_over_': ('_of_',),
+                       'probability_distribution_over_': ('_of_',),
+                       'probability_density_function_over_': ('_of_',)}
+for _direction in ('northward', 'southward', 'eastward', 'westward'):
+    _DERIVED_NAME_RULES['%s_derivative_of_' % _direction] = ()
+    _DERIVED_NAME_RULES['grid_%s_derivative_of_' % _direction] = ()
+del _direction
+_DERIVED_NAME_PREFIXES = tuple(_DERIVED_NAME_RULES)
+
+_NAME_START_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_NAME_CHARS = _NAME_START_CHARS | frozenset('0123456789_')
+
+
+def _match_name_slots(text, joiners):
+    """Check that text is a sequence of names (a letter followed by letters, digits
+       or underscores) separated by each of joiners in turn.
+    """
+    if text[:1] not in _NAME_START_CHARS or not _NAME_CHARS.issuperset(text):
+        return False
 
-    def endElement(self, name):
-        # If it's the end of the version_number element, save it
-        if name == 'version_number':
-            self.inVersionNoContent = 0
-            self.version_number = normalize_whitespace(self.version_number)
+    # Any occurrence of a joiner followed by a letter can split the names, since the
+    # names themselves may contain underscores; taking the earliest leaves the most
+    # room for the joiners that follow.
+    start = 1
+    for joiner in joiners:
+        i = text.find(joiner, start)
+        while i != -1 and text[i + len(joiner):i + len(joiner) + 1] not in _NAME_START_CHARS:
+            i = text.find(joiner, i + 1)
+        if i == -1:
+            return False
+        start = i + len(joiner) + 1
+    return True
 
-        # If it's the end of the date element, save the last modified date
-        elif name == 'date':
-            self.inLastModifiedContent = 0
-            self.last_modified = normalize_whitespace(self.last_modified)
 
-            
 def check_derived_name(name):
     """Checks whether name is a derived standard name and adheres
        to the transformation rules. See CF standard names document
        for more information.
     """
-    if re.search("^(direction|magnitude|square|divergence)_of_[a-zA-Z][a-zA-Z0-9_]*$", name):
-        return 0
+    if name.startswith(_DERIVED_NAME_PREFIXES):
+        for prefix, joiners in _DERIVED_NAME_RULES.items():
+            if name.startswith(prefix):
+                if _match_name_slots(name[len(prefix):], joiners):
+                    return 0
+                break
 
-    if re.search("^rate_of_change_of_[a-zA-Z][a-zA-Z0-9_]*$", name):
-        return 0
+    # Not a valid derived name
+    return 1
 
-    if re.search("^(grid_)?(northward|southward|eastward|westward)_derivative_of_[a-zA-Z][a-zA-Z0-9_]*$", name):
-        return 0
 
-    if re.search("^product_of_[a-zA-Z][a-zA-Z0-9_]*_and_[a-zA-Z][a-zA-Z0-9_]*$", name):
-        return 0
+@functools.lru_cache(maxsize=512)
+def _parse_units(spec):
+    return Units(spec)
 
-    if re.search("^ratio_of_[a-zA-Z][a-zA-Z0-9_]*_to_[a-zA-Z][a-zA-Z0-9_]*$", name):
-        return 0
 
-    if re.search("^derivative_of_[a-zA-Z][a-zA-Z0-9_]*_wrt_[a-zA-Z][a-zA-Z0-9_]*$", name):
-        return 0
+def _units(spec):
+    """Return Units(spec).  The same few units strings recur across variables, so
+       they are only parsed once; the Units objects are never modified in place.
+    """
+    if isinstance(spec, str):
+        return _parse_units(spec)
+    return Units(spec)
+
+
+# Valid values of featureType (lower case, as they are matched case-insensitively)
+_FT_SINGLE = frozenset(('timeseries', 'trajectory', 'profile'))
+_FT_PROFILE = frozenset(('timeseriesprofile', 'trajectoryprofile'))
+_FEATURE_TYPES = frozenset(('point',)) | _FT_SINGLE | _FT_PROFILE
+
+# Patterns used when checking attribute values
+_VALID_NAME_RE = re.compile(r'^[a-zA-Z0-9_]*$')
+_NAME_SYNTAX_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9_]*$')
+_RE_BLANK_LIST = re.compile(r'^[a-zA-Z0-9_ ]*$')
+_RE_EXT_LIST = re.compile(r'^[a-zA-Z0-9_ @\-\+\.]*$')
+_RE_COMMA_OR_BLANK = re.compile(r'^[a-zA-Z0-9_ @\-\+\.,]*$')
+_UPDOWN_RE = re.compile(r'(up|down)', re.I)
+_METHOD_RE = re.compile(r'point|sum|maximum|median|mid_range|minimum|mean|mode|standard_deviation|variance')
+# Names of the dimensions in the dimensions part of a cell_methods entry
+_DIM_RE = re.compile(r'([^\s:]+)\s*:')
+_VARIANCE_RE = re.compile(r'(\s+|:)variance')
+# Syntax of the whole of a cell_methods attribute:
+# dim1: [dim2: [dim3: ...]] method [where type1 [over type2]] [within|over days|years] [(comment)] ...
+_CM_VALIDATE_RE = re.compile(r'^'
+                             r'(\s*\S+\s*:\s*(\S+\s*:\s*)*'
+                             r'([a-z_]+)'
+                             r'(\s+where\s+\S+(\s+over\s+\S+)?)?'
+                             r'(\s+(over|within)\s+(days|years))?\s*'
+                             r'(\((interval:\s+\d+\s+\S+\s*)*(comment: .+)?.*\))?)'
+                             r'+$')
+# Each word-list of a cell_methods attribute
+_CM_SUBSTR_RE = re.compile(r'(?P<dimensions>\s*\S+\s*:\s*(\S+\s*:\s*)*'
+                           r'(?P<method>[a-z_]+)'
+                           r'(?:\s+where\s+(?P<type1>\S+)(?:\s+over\s+(?P<type2>\S+))?)?'
+                           r'(?:\s+(?:over|within)\s+(?:days|years))?\s*)'
+                           r'(?P<comment>\([^)]+\))?')
+_CM_INTERVAL_RE = re.compile(r'(?P<interval>interval:\s+\d+\s+(?P<unit>\S+)\s*)')
+_CM_COMMENT_RE = re.compile(r'\([^)]+\)')
+_CELL_MEASURES_RE = re.compile(r'^([a-zA-Z0-9]+: +([a-zA-Z0-9_ ]+:?)*( +[a-zA-Z0-9_]+)?)$')
+_FT_RE = re.compile(r'^([a-zA-Z0-9_]+: +[a-zA-Z0-9_]+( +)?)*$')
+_FT_PAIR_RE = re.compile(r'([a-zA-Z0-9_]+): +([a-zA-Z0-9_]+)')
+_AXIS_RE = re.compile(r'^(X|Y|Z|T)$', re.I)
+_POSITIVE_RE = re.compile(r'^(down|up)$', re.I)
+_CALENDAR_RE = re.compile(r'(gregorian|standard|proleptic_gregorian|noleap|365_day|all_leap|'
+                          r'366_day|360_day|julian|none)', re.I)
+_MONTH_RE = re.compile(r'^(1|2|3|4|5|6|7|8|9|10|11|12)$')
+_HEIGHT_RE = re.compile(r'height', re.I)
+_DEPTH_RE = re.compile(r'depth', re.I)
+_UP_RE = re.compile(r'up', re.I)
+_DOWN_RE = re.compile(r'down', re.I)
+
+
+def _subst(s):
+    """substitute tokens for WORD and SEP (space or end of string)"""
+    return s.replace('WORD', r'[A-Za-z0-9_]+').replace('SEP', r'(\s+|$)')
+
+
+# Syntax of the grid_mapping attribute.  Before CF-1.7, a single variable name; from CF-1.7
+# also of the form: grid_mapping_var: coord_var [coord_var ...] [grid_mapping_var: coord_var [coord_var ...]]
+_GM_SOLE_RE = re.compile(_subst('(?P<sole_mapping>WORD)$'))
+_GM_COORD_RE = re.compile(_subst('(?P<coord>WORD)SEP'))
+_GM_MAPPING_RE = re.compile(_subst('(?P<mapping_name>WORD):SEP(?P<coord_list>({})+)'.format(_GM_COORD_RE.pattern)))
+_GM_ALL_RE = re.compile(_subst('((?P<sole_mapping>WORD)|(?P<mapping_list>({})+))$'.format(_GM_MAPPING_RE.pattern)))
+
+
+@functools.lru_cache(maxsize=4096)
+def _interpret_units(units, positive):
+    """The interpretation of a dimension with the given units and positive attribute,
+       as returned by CFChecker.getInterpretation.  Many variables share the same units,
+       so the result is cached."""
+    try:
+        u = _units(units)
+    except:
+        # Don't catch invalid units here as already caught in a previous check
+        return None
 
-    if re.search("^(correlation|covariance)_over_[a-zA-Z][a-zA-Z0-9_]*_of_[a-zA-Z][a-zA-Z0-9_]*_and_[a-zA-Z][a-zA-Z0-9_]*$", name):
-        return 0
+    if u.islongitude:
+        return "X"
 
-    if re.search("^histogram_over_[a-zA-Z][a-zA-Z0-9_]*_of_[a-zA-Z][a-zA-Z0-9_]*$", name):
-        return 0
+    if u.islatitude:
+        return "Y"
 
-    if re.search("^probability_distribution_over_[a-zA-Z][a-zA-Z0-9_]*_of_[a-zA-Z][a-zA-Z0-9_]*$", name):
-        return 0
+    if u.ispressure:
+        return "Z"
 
-    if re.search("^probability_density_function_over_[a-zA-Z][a-zA-Z0-9_]*_of_[a-zA-Z][a-zA-Z0-9_]*$", name):
-        return 0
-    
-    # Not a valid derived name
-    return 1
+    # Dimensionless vertical coordinate
+    if units in ['level', 'layer', 'sigma_level']:
+        return "Z"
+
+    if positive and _UPDOWN_RE.match(positive):
+        return "Z"
+
+    if u.istime or u.isreftime:
+        return "T"
+
+    # Not possible to deduce interpretation
+    return None
+
+
+# Valid variable types: char, byte, short, int, float and double, plus string from CF-1.8
+_VALID_TYPES = frozenset(numpy.dtype(t) for t in ('S1', 'i1', 'i2', 'i4', 'f4', 'f8'))
+_VALID_TYPES_1_8 = _VALID_TYPES | {str}
+
+
+def _is_numeric_value(value):
+    """Whether an attribute value is a single integer or floating point number (not a boolean)"""
+    return isinstance(value, (int, float, numpy.integer, numpy.floating)) and not isinstance(value, bool)
+
+
+# Attribute names reserved by netCDF, which need not be valid CF names
+# https://www.unidata.ucar.edu/software/netcdf/docs/file_format_specifications.html
+_RESERVED_ATTRIBUTES = frozenset(("_FillValue", "_Encoding", "_Unsigned"))
+
+
+def _split_conventions(conventions):
+    """Split the Conventions attribute into the names of the conventions.  If a comma is
+       present we assume a comma separated list as names cannot contain commas."""
+    if "," in conventions:
+        return [convention.strip() for convention in conventions.split(",")]
+    return conventions.split()
+
+
+# Global attributes that must be of type string, and the extra ones from CF-1.6 and CF-1.7
+_STR_GLOBAL_ATTRS = ('title', 'history', 'institution', 'source', 'references', 'comment')
+_STR_GLOBAL_ATTRS_1_6 = _STR_GLOBAL_ATTRS + ('featureType',)
+_STR_GLOBAL_ATTRS_1_7 = _STR_GLOBAL_ATTRS_1_6 + ('external_variables',)
+
+# Positions of the space/time axes in the order they should appear in a variable's dimensions
+_AXIS_POS = {'T': 0, 'Z': 1, 'Y': 2, 'X': 3}
+
+# Attributes which may only be attached to a time coordinate variable
+_TIME_ATTRIBUTES = frozenset(('calendar', 'month_lengths', 'leap_year', 'leap_month', 'climatology'))
+
+# Attributes of a coordinate variable which its boundary variable should not have (before and
+# from CF-1.7), and which must agree between the two where it does
+_BOUNDS_ATTRIBUTES = ('units', 'standard_name')
+_BOUNDS_ATTRIBUTES_1_7 = _BOUNDS_ATTRIBUTES + ('axis', 'positive', 'calendar', 'leap_month', 'leap_year',
+                                               'month_lengths')
+
+# Descriptions of the attribute types in the attribute list
+_ATTR_TYPE_NAMES = {"D": "Data Variable",
+                    "N": "Numeric",
+                    "S": "String"}
+
+# Descriptions of the message categories, used when showing the counts of each
+_CATEGORY_DESCRIPTIONS = {"FATAL": "FATAL ERRORS",
+                          "ERROR": "ERRORS detected",
+                          "WARN": "WARNINGS given",
+                          "INFO": "INFORMATION messages",
+                          "DEBUG": "DEBUG messages",
+                          "VERSION": "VERSION information"}
+
+# Coordinate variables longer than this are checked against their bounds at a sample of
+# points (the first and last _BOUNDS_SAMPLE_EDGE and _BOUNDS_SAMPLE_RANDOM others)
+# rather than being read in full, unless fullBoundsCheck is set
+_BOUNDS_SAMPLE_LIMIT = 100000
+_BOUNDS_SAMPLE_EDGE = 64
+_BOUNDS_SAMPLE_RANDOM = 128
+
+
+def _bounds_sample(n):
+    """Sorted indices of the points of a coordinate of length n to check against its bounds"""
+    return numpy.unique(numpy.concatenate([
+        numpy.arange(min(n, _BOUNDS_SAMPLE_EDGE)),
+        numpy.arange(max(0, n - _BOUNDS_SAMPLE_EDGE), n),
+        numpy.random.RandomState(0).randint(0, n, size=min(n, _BOUNDS_SAMPLE_RANDOM))]))
+
+
+# Number of values of a variable read at a time when finding its data range
+_RANGE_BLOCK_SIZE = 1000000
+
+
+def _data_range(var):
+    """
+    Minimum and maximum of the non-missing values of netCDF variable var, or None if every value
+    is missing.  The data is read in blocks along the first dimension so that only part of a large
+    variable is held in memory at once.
+    """
+    if var.ndim == 0:
+        blocks = (var[:],)
+    else:
+        step = max(1, _RANGE_BLOCK_SIZE // max(1, int(numpy.prod(var.shape[1:]))))
+        blocks = (var[i:i + step] for i in range(0, var.shape[0], step))
+
+    min_dv = max_dv = None
+    for block in blocks:
+        values = numpy.ma.compressed(block)
+        if values.size == 0:
+            continue
+        lo = values.min()
+        hi = values.max()
+        if min_dv is None or lo < min_dv:
+            min_dv = lo
+        if max_dv is None or hi > max_dv:
+            max_dv = hi
+
+    if min_dv is None:
+        return None
+    return min_dv, max_dv
+
+
+# Tables parsed by CFChecker._get_table, keyed by (ConstructDict or ConstructList, source)
+_TABLE_CACHE = {}
 
 
 class FatalCheckerError(Exception):
@@ -421,7 +943,8 @@ class CFChecker(object):
     def __init__(self, uploader=None, useFileName="yes", badc=None, coards=None,
                  cfStandardNamesXML=STANDARDNAME, cfAreaTypesXML=AREATYPES,
                  cfRegionNamesXML=REGIONNAMES, cacheTables=False, cacheTime=0,
-                 cacheDir='/tmp', version=newest_version, debug=False, silent=False):
+                 cacheDir='/tmp', version=newest_version, debug=False, silent=False,
+                 collectMessages=True, fullBoundsCheck=False):
         self.uploader = uploader
         self.useFileName = useFileName
         self.badc = badc
@@ -433,27 +956,44 @@ class CFChecker(object):
         self.cacheTime = cacheTime
         self.cacheDir = cacheDir
         self.version = version
-        self.all_results = OrderedDict()  # dictionary of results sorted by file and then by globals / variable
+        self.all_results = {}  # dictionary of results sorted by file and then by globals / variable
                                           # and then by category
         self.all_messages = []  # list of all messages in the order they were printed
-        self.cf_roleCount = 0          # Number of occurrences of the cf_role attribute in the file
-        self.raggedArrayFlag = 0       # Flag to indicate if file contains any ragged array representations
         self.debug = debug
         self.silent = silent
+        self.collectMessages = collectMessages  # whether to record messages in all_messages
+        self.fullBoundsCheck = fullBoundsCheck  # whether to check every point of large coordinates lies within its bounds
+        self._out_buf = []  # lines of output not yet written to stdout
 
         self.categories = ("FATAL", "ERROR", "WARN", "INFO", "VERSION")
         if debug:
             self.categories += ("DEBUG",)
+        self._category_set = frozenset(self.categories)
 
         if not isinstance(self.version, CFVersion):
             self.version = CFVersion(self.version)
+        self.requestedVersion = self.version
 
     def checker(self, file):
+        try:
+            return self._check_file(file)
+        finally:
+            self._flush_output()
+
+    def _check_file(self, file):
 
         self._init_results(file)
 
+        # Reset any state left from checking a previous file, so that each file is checked
+        # independently (and the same whether files are checked one after another or in parallel)
+        self.version = self.requestedVersion
+        self.cf_roleCount = 0          # Number of occurrences of the cf_role attribute in the file
+        self.raggedArrayFlag = 0       # Flag to indicate if file contains any ragged array representations
+        self._attr_cache = {}          # Attributes of each variable, read by _attributes
+        self._typecode_cache = {}      # Type code of each variable, worked out by varTypeCode
+
         if self.uploader:
-            realfile = string.split(file, ".nc")[0]+".nc"
+            realfile = file.partition(".nc")[0] + ".nc"
             self._add_version("CHECKING NetCDF FILE: %s" % realfile)
         elif self.useFileName == "no":
             self._add_version("CHECKING NetCDF FILE")
@@ -461,7 +1001,7 @@ class CFChecker(object):
             self._add_version("CHECKING NetCDF FILE: %s" % file)
     
         if not self.silent:
-            print("=====================")
+            self._print("=====================")
 
         # Check for valid filename
         if not file.endswith('.nc'):
@@ -486,29 +1026,14 @@ class CFChecker(object):
         self.validGridMappingAttributes()
 
         # Set up dictionary of standard_names and their assoc. units
-        parser = make_parser()
-        parser.setFeature(feature_namespaces, 0)
-        self.std_name_dh = ConstructDict(useShelve=self.cacheTables, cacheTime=self.cacheTime,
-                                         cacheDir=self.cacheDir)
-
-        if not self.std_name_dh.current:
-            parser.setContentHandler(self.std_name_dh)
-            parser.parse(self.standardNames)
+        self.std_name_dh = self._get_table(ConstructDict, self.standardNames, 'cfexpr_cache')
 
         if self.version >= vn1_4:
             # Set up list of valid area_types
-            self.area_type_lh = ConstructList(useShelve=self.cacheTables, shelveFile='cfarea_cache',
-                                              cacheTime=self.cacheTime, cacheDir=self.cacheDir)
-            if not self.area_type_lh.current:
-                parser.setContentHandler(self.area_type_lh)
-                parser.parse(self.areaTypes)
+            self.area_type_lh = self._get_table(ConstructList, self.areaTypes, 'cfarea_cache')
 
         # Set up list of valid region_names
-        self.region_name_lh = ConstructList(useShelve=self.cacheTables, shelveFile='cfregion_cache',
-                                            cacheTime=self.cacheTime, cacheDir=self.cacheDir)
-        if not self.region_name_lh.current:
-            parser.setContentHandler(self.region_name_lh)
-            parser.parse(self.regionNames)
+        self.region_name_lh = self._get_table(ConstructList, self.regionNames, 'cfregion_cache')
     
         self._add_version("Using CF Checker Version %s" % __version__)
         if not self.version:
@@ -527,16 +1052,84 @@ class CFChecker(object):
                           (self.region_name_lh.version_number, self.region_name_lh.last_modified))
 
         if not self.silent:
-            print("")
+            self._print("")
 
         try:
             return self._checker()
         finally:
             self.f.close()
-            self.std_name_dh.close()
-            self.region_name_lh.close()
-            if self.version >= vn1_4:
-                self.area_type_lh.close()
+
+    def check_files(self, files, workers=None):
+        """
+        Check each of files, in up to workers (default: the number of CPUs) parallel processes,
+        reporting each file's output and results in the order given.  Returns all_results.
+
+        A file whose check is aborted by a FatalCheckerError is reported and the remaining
+        files are still checked.  Any other error aborts the run, whatever the number of
+        workers: it is raised after the output of the files before it and of the failed
+        file so far, and the files after it are not reported.
+        """
+        workers = min(len(files), workers or os.cpu_count() or 1)
+        if workers <= 1:
+            for file in files:
+                try:
+                    self.checker(file)
+                except FatalCheckerError:
+                    print("Checking of file %s aborted due to error" % file)
+            return self.all_results
+
+        # Read the tables before starting the workers so that, where processes are forked,
+        # they inherit them rather than each reading them again
+        self._get_table(ConstructDict, self.standardNames, 'cfexpr_cache')
+        if not self.requestedVersion or self.requestedVersion >= vn1_4:
+            self._get_table(ConstructList, self.areaTypes, 'cfarea_cache')
+        self._get_table(ConstructList, self.regionNames, 'cfregion_cache')
+
+        kwargs = dict(uploader=self.uploader,
+                      useFileName=self.useFileName,
+                      badc=self.badc,
+                      coards=self.coards,
+                      cfStandardNamesXML=self.standardNames,
+                      cfAreaTypesXML=self.areaTypes,
+                      cfRegionNamesXML=self.regionNames,
+                      cacheTables=self.cacheTables,
+                      cacheTime=self.cacheTime,
+                      cacheDir=self.cacheDir,
+                      version=self.requestedVersion,
+                      debug=self.debug,
+                      silent=self.silent,
+                      collectMessages=self.collectMessages,
+                      fullBoundsCheck=self.fullBoundsCheck)
+
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(kwargs,)) as executor:
+            try:
+                for file, (results, messages, output) in zip(files, executor.map(_worker_check_file, files)):
+                    sys.stdout.write(output)
+                    self.results = results
+                    self.all_results[file] = results
+                    self.all_messages.extend(messages)
+            except Exception as e:
+                # Print what was output for the file before the error, as when checking in this process
+                sys.stdout.write(getattr(e, 'checker_output', ''))
+                raise
+        return self.all_results
+
+    def _get_table(self, cls, source, shelveFile):
+        """
+        Get the table at source, parsed by cls (ConstructDict or ConstructList).  Tables are
+        only read once per process, however many files are checked.
+        """
+        key = (cls, source)
+        table = _TABLE_CACHE.get(key)
+        if table is None:
+            table = cls(useShelve=self.cacheTables, shelveFile=shelveFile, cacheTime=self.cacheTime,
+                        cacheDir=self.cacheDir, source=source)
+            if not table.current:
+                table.parse(source)
+            table.close()
+            _TABLE_CACHE[key] = table
+        return table
 
     def _init_results(self, filename):
         """
@@ -545,11 +1138,11 @@ class CFChecker(object):
         results for the current file
         """
         self.results = {"global": self._get_empty_results(),
-                        "variables": OrderedDict()}
+                        "variables": {}}
         self.all_results[filename] = self.results
 
     def _get_empty_results(self):
-        return dict([(cat, []) for cat in self.categories])
+        return {cat: [] for cat in self.categories}
 
     def _init_var_results(self, var):
         vars_dict = self.results["variables"]
@@ -605,7 +1198,7 @@ class CFChecker(object):
         """
         add the message - generic helper for _add_error etc.
         """
-        assert category in self.categories
+        assert category in self._category_set
         if code:
             code_report = "(%s)" % code
         else:
@@ -620,15 +1213,32 @@ class CFChecker(object):
             results_dict = self.results["global"]
             var_report = None
         results_dict[category].append(self._join_strings([code_report, msg]))
-        msg_print = self._join_strings([category, code_report, var_report, msg])
+        if self.silent and not self.collectMessages:
+            return
         if not self.silent:
             #print msg_print
             if category == "VERSION":
-                print(self._join_strings([code_report, msg]))
+                self._print(self._join_strings([code_report, msg]))
             else:
-                print(self._join_strings([category, code_report, msg]))
+                self._print(self._join_strings([category, code_report, msg]))
+
+        if self.collectMessages:
+            self.all_messages.append(self._join_strings([category, code_report, var_report, msg]))
+
+    def _print(self, line):
+        """
+        Buffer a line of output, to be written out by _flush_output
+        """
+        self._out_buf.append(line)
 
-        self.all_messages.append(msg_print)
+    def _flush_output(self):
+        """
+        Write out any buffered output
+        """
+        if self._out_buf:
+            self._out_buf.append("")
+            sys.stdout.write("\n".join(self._out_buf))
+            self._out_buf.clear()
 
     def _join_strings(self, list_):
         """
@@ -648,11 +1258,11 @@ class CFChecker(object):
         return grand_totals
 
     def _get_zero_counts(self):
-        return OrderedDict([(cat, 0) for cat in self.categories])
+        return {cat: 0 for cat in self.categories}
 
     def get_counts(self, results=None):
         """
-        get OrderedDict of number of errors, warnings, info messages
+        get dictionary of number of errors, warnings, info messages
         This will be for most recently checked file, unless 'results' is passed in 
         (in which case, it should be a value from the self.all_results dictionary
         where corresponding key is the filename).
@@ -673,32 +1283,29 @@ class CFChecker(object):
             counts[category] += len(results[category])
 
     def show_counts(self, results=None, append_to_all_messages=False):
-        descriptions = {"FATAL": "FATAL ERRORS",
-                        "ERROR": "ERRORS detected",
-                        "WARN": "WARNINGS given",
-                        "INFO": "INFORMATION messages",
-                        "DEBUG": "DEBUG messages",
-                        "VERSION": "VERSION information"}
-        for category, count in list(self.get_counts(results).items()):
+        for category, count in self.get_counts(results).items():
             # A FATAL error is really the inability of the checker to perform the checks.
             # Only show this if it actually occurred.
             if category == "FATAL" and count == 0:
                 continue
             if category == "VERSION":
                 continue
-            line = "%s: %s" % (descriptions[category], count)
+            line = "%s: %s" % (_CATEGORY_DESCRIPTIONS[category], count)
             if not self.silent:
-                print(line)
+                self._print(line)
 
             if append_to_all_messages:
                 self.all_messages.append(line)
+
+        self._flush_output()
   
     def _checker(self):
         """
         Main implementation of checker assuming self.f exists.
         """
-        lowerVars = []
-        for var in map(str, list(self.f.variables.keys())):
+        lowerVars = set()
+        var_names = list(self.f.variables)
+        for var in var_names:
             self._init_var_results(var)
 
         # Check global attributes
@@ -715,54 +1322,54 @@ class CFChecker(object):
         self.gridMappingVars = gridMappingVars
         self.nodeCoordinateVars = nodeCoordinateVars
 
-        self._add_debug("Auxillary Coordinate Vars: %s" % list(map(str, auxCoordVars)))
-        self._add_debug("Coordinate Vars: %s" % list(map(str, coordVars)))
-        self._add_debug("Boundary Vars: %s" % list(map(str, boundsVars)))
-        self._add_debug("Climatology Vars: %s" % list(map(str, climatologyVars)))
-        self._add_debug("Geometry Container Vars: %s" % list(map(str, geometryContainerVars.keys())))
-        self._add_debug("Grid Mapping Vars: %s" % list(map(str, gridMappingVars)))
+        if self.debug:
+            self._add_debug("Auxillary Coordinate Vars: %s" % list(auxCoordVars))
+            self._add_debug("Coordinate Vars: %s" % list(coordVars))
+            self._add_debug("Boundary Vars: %s" % list(boundsVars))
+            self._add_debug("Climatology Vars: %s" % list(climatologyVars))
+            self._add_debug("Geometry Container Vars: %s" % list(geometryContainerVars))
+            self._add_debug("Grid Mapping Vars: %s" % list(gridMappingVars))
 
-        allCoordVars = coordVars[:]
-        allCoordVars[len(allCoordVars):] = auxCoordVars[:]
+        # Sets of variable names, for the membership tests made for every variable
+        allCoordVars = set(coordVars).union(auxCoordVars)
+        coordVarSet = set(coordVars)
+        gridMappingVarSet = set(gridMappingVars)
 
         self.setUpFormulas()
 
-        axes = list(self.f.dimensions.keys())
+        axes = self.f.dimensions
 
-        self._add_debug("Axes: %s" % axes)
-
-        valid_types = [numpy.character,
-                       numpy.dtype('c'),
-                       numpy.dtype('b'),
-                       numpy.dtype('i4'),
-                       numpy.int32,
-                       numpy.float32,
-                       numpy.double,
-                       'int16',
-                       'float32']
+        if self.debug:
+            self._add_debug("Axes: %s" % list(axes))
 
         if self.version >= vn1_8:
             # String type valid from CF-1.8
-            valid_types.append(str)
+            valid_types = _VALID_TYPES_1_8
+        else:
+            valid_types = _VALID_TYPES
 
         # Check each variable
-        for var in list(self.f.variables.keys()):
+        for var in var_names:
+            v = self.f.variables[var]
+
+            # Write out the messages for the file and the previous variable
+            self._flush_output()
 
             if not self.silent:
-                print("")
-                print("------------------")
-                print("Checking variable: %s" % var)
-                print("------------------")
+                self._print("")
+                self._print("------------------")
+                self._print("Checking variable: %s" % var)
+                self._print("------------------")
 
             if not self.validName(var):
                 self._add_warn("Variable names should begin with a letter and be composed "
                                "of letters, digits and underscores", var, code='2.3')
 
-            dt = self.f.variables[var].dtype
+            dt = v.dtype
             if dt not in valid_types:
                 try:
-                    if isinstance(self.f.variables[var].datatype, netCDF4.VLType):
-                        self._add_error("Invalid variable type: {} (vlen types not supported)".format(self.f.variables[var].datatype),
+                    if isinstance(v.datatype, netCDF4.VLType):
+                        self._add_error("Invalid variable type: {} (vlen types not supported)".format(v.datatype),
                                         var,
                                         code="2.2")
                 except:
@@ -773,15 +1380,15 @@ class CFChecker(object):
             if lowerVar in lowerVars:
                 self._add_warn("variable clash", var, code='2.3')
             else:
-                lowerVars.append(lowerVar)
+                lowerVars.add(lowerVar)
 
-            if var not in axes:
+            if var not in self.f.dimensions:
                 # Non-coordinate variable
                 self.chkDimensions(var, allCoordVars)
 
             self.chkDescription(var)
 
-            for attribute in map(str, self.f.variables[var].ncattrs()):
+            for attribute in v.ncattrs():
                 self.chkAttribute(attribute, var, allCoordVars, boundsVars, geometryContainerVars)
 
             self.chkUnits(var, allCoordVars)
@@ -815,14 +1422,14 @@ class CFChecker(object):
                     self.chkGeometryContainerVar(var)
                 self.chkNodesAttribute(var)
 
-            if var in coordVars:
+            if var in coordVarSet:
                 self.chkMultiDimCoord(var, axes)
                 self.chkValuesMonotonic(var)
 
-            if var in gridMappingVars:
+            if var in gridMappingVarSet:
                 self.chkGridMappingVar(var)
 
-            if var in axes:
+            if var in self.f.dimensions:
                 if self.isTime(var):
                     # Time coordinate variable
                     self._add_debug("Time Axis.....")
@@ -830,7 +1437,7 @@ class CFChecker(object):
 
                 # Github Issue #13
                 if var not in allCoordVars:
-                    dimensions=list(map(str, self.f.variables[var].dimensions))
+                    dimensions = v.dimensions
 
                     if len(dimensions) > 1 and var in dimensions:
                         # Variable name matches a dimension;
@@ -839,130 +1446,79 @@ class CFChecker(object):
 
         if self.version >= vn1_6:
 
-            if self.raggedArrayFlag != 0 and not hasattr(self.f, 'featureType'):
+            featureType = getattr(self.f, 'featureType', None)
+            if self.raggedArrayFlag != 0 and featureType is None:
                 self._add_error("The global attribute 'featureType' must be present "
                                 "(A ragged array representation has been used)",
                                 code="9.4")
 
-            if hasattr(self.f, 'featureType'):
-                featureType = self.f.featureType
-
+            if featureType is not None:
                 if self.cf_roleCount == 0 and featureType != "point":
                     self._add_warn("A variable with the attribute cf_role should be included "
                                    "in a Discrete Geometry CF File",
                                    code="9.5")
 
-                if re.match('^(timeSeries|trajectory|profile)$', featureType, re.I) and self.cf_roleCount != 1:
+                if featureType.lower() in _FT_SINGLE and self.cf_roleCount != 1:
                     # Should only be a single occurrence of a cf_role attribute
                     self._add_warn("CF Files containing {} featureType should only include a single "
                                    "occurrence of a cf_role attribute".format(featureType))
 
-                elif re.match('^(timeSeriesProfile|trajectoryProfile)$',featureType,re.I) and self.cf_roleCount > 2:
+                elif featureType.lower() in _FT_PROFILE and self.cf_roleCount > 2:
                     # May contain up to 2 occurrences of cf_roles attribute
                     self._add_error("CF Files containing {} featureType may contain 2 occurrences "
                                     "of a cf_role attribute".format(featureType))
 
         if not self.silent:
-            print("")
+            self._print("")
 
         self.show_counts(append_to_all_messages=True)
         return self.results
 
+    def _attributes(self, varName):
+        """
+        Get the dictionary of attributes of variable varName.  These are read from the file
+        once, when first asked for, and shared by all the checks on the variable.
+        """
+        attrs = self._attr_cache.get(varName)
+        if attrs is None:
+            var = self.f.variables[varName]
+            try:
+                attrs = var.__dict__
+            except (KeyError, UnicodeDecodeError):
+                # An attribute of a type netCDF4 can't read, or a string which can't be
+                # decoded; leave it out (chkAttribute reports the former)
+                attrs = {}
+                for attribute in var.ncattrs():
+                    try:
+                        attrs[attribute] = var.getncattr(attribute)
+                    except (KeyError, UnicodeDecodeError):
+                        pass
+            self._attr_cache[varName] = attrs
+        return attrs
+
     def setUpAttributeList(self):
         """Set up Dictionary of valid attributes, their corresponding
         Type; S(tring), N(umeric) D(ata variable type)  and Use C(oordinate),
         D(ata non-coordinate) or G(lobal) variable."""
-    
-        self.AttrList={}
-        self.AttrList['add_offset'] = ['N', 'D']
-        self.AttrList['ancillary_variables'] = ['S', 'D']
-        self.AttrList['axis'] = ['S', 'C']
-        self.AttrList['bounds'] = ['S', 'C']
-        self.AttrList['calendar'] = ['S', 'C']
-        self.AttrList['cell_measures'] = ['S', 'D']
-        self.AttrList['cell_methods'] = ['S', 'D']
-        self.AttrList['climatology'] = ['S', 'C']
-        self.AttrList['comment'] = ['S', ('G', 'D')]
-        self.AttrList['compress'] = ['S', 'C']
-        self.AttrList['Conventions'] = ['S', 'G']
-        self.AttrList['coordinates'] = ['S', 'D']
-        self.AttrList['_FillValue'] = ['D', 'D']
-        self.AttrList['flag_meanings'] = ['S', 'D']
-        self.AttrList['flag_values'] = ['D', 'D']
-        self.AttrList['formula_terms'] = ['S', 'C']
-        self.AttrList['grid_mapping'] = ['S', 'D']
-        self.AttrList['history'] = ['S', 'G']
-        self.AttrList['institution'] = ['S', ('G', 'D')]
-        self.AttrList['leap_month'] = ['N', 'C']
-        self.AttrList['leap_year'] = ['N', 'C']
-        self.AttrList['long_name'] = ['S', ('C', 'D')]
-        self.AttrList['missing_value'] = ['D', 'D']
-        self.AttrList['month_lengths'] = ['N', 'C']
-        self.AttrList['positive'] = ['S', 'C']
-        self.AttrList['references'] = ['S', ('G', 'D')]
-        self.AttrList['scale_factor'] = ['N', 'D']
-        self.AttrList['source'] = ['S', ('G', 'D')]
-        self.AttrList['standard_error_multiplier'] = ['N', 'D']
-        self.AttrList['standard_name'] = ['S', ('C', 'D')]
-        self.AttrList['title'] = ['S', 'G']
-        self.AttrList['units'] = ['S', ('C', 'D')]
-        self.AttrList['valid_max'] = ['N', ('C', 'D')]
-        self.AttrList['valid_min'] = ['N', ('C', 'D')]
-        self.AttrList['valid_range'] = ['N', ('C', 'D')]
-
-        if self.version >= vn1_3:
-            self.AttrList['flag_masks'] = ['D', 'D']
-
-        if self.version >= vn1_6:
-            self.AttrList['cf_role'] = ['S', 'C']
-            self.AttrList['_FillValue'] = ['D', ('C', 'D')]
-            self.AttrList['featureType'] = ['S', 'G']
-            self.AttrList['instance_dimension'] = ['S', 'D']
-            self.AttrList['missing_value'] = ['D', ('C', 'D')]
-            self.AttrList['sample_dimension'] = ['S', 'D']
-
-        if self.version >= vn1_7:
-            self.AttrList['actual_range'] = ['N', ('C', 'D')]
-            self.AttrList['add_offset'] = ['N', ('C', 'D')]
-            self.AttrList['comment'] = ['S', ('G', 'C', 'D')]
-            self.AttrList['computed_standard_name'] = ['S', 'C']
-            self.AttrList['external_variables'] = ['S', 'G']
-            self.AttrList['instance_dimension'] = ['S', '-']
-            self.AttrList['sample_dimension'] = ['S', '-']
-            self.AttrList['scale_factor'] = ['N', ('C', 'D')]
-
-        if self.version >= vn1_8:
-            self.AttrList['coordinates'] = ['S', ('D', 'M')]
-            self.AttrList['geometry'] = ['S', ('C', 'D')]
-            self.AttrList['geometry_type'] = ['S', 'M']
-            self.AttrList['grid_mapping'] = ['S', ('D', 'M')]
-            self.AttrList['history'] = ['S', ('G', 'Gr')]
-            self.AttrList['interior_ring'] = ['S', 'M']
-            self.AttrList['node_coordinates'] = ['S', 'M']
-            self.AttrList['node_count'] = ['S', 'M']
-            self.AttrList['nodes'] = ['S', 'C']
-            self.AttrList['part_node_count'] = ['S', 'M']
-            self.AttrList['title'] = ['S', ('G', 'Gr')]
-      
-        return
+        self.AttrList = _attr_list_for(self.version)
 
     def uniqueList(self, list):
         """Determine if list has any repeated elements."""
         # Rewrite to allow list to be either a list or a Numeric array
-        seen = []
+        seen = set()
 
         for x in list:
             if x in seen:
                 return 0
             else:
-                seen.append(x)
+                seen.add(x)
         return 1
 
     def isNumeric(self, var):
         """Determine if variable is of Numeric data type."""
         types = ['i', 'f', 'd']
         rc = 1
-        if self.getTypeCode(self.f.variables[var]) not in types:
+        if self.varTypeCode(var) not in types:
             rc = 0
         return rc
 
@@ -972,12 +1528,13 @@ class CFChecker(object):
         2) Units of reference time
         3) The standard_name attribute is one of 'time' or 'forecast_reference_time'"""
 
-        variable = self.f.variables[var]
+        attrs = self._attributes(var)
 
         # Does it have a reference time?
-        if hasattr(variable, 'units'):
+        units = attrs.get('units')
+        if units is not None:
             try:
-                u = Units(variable.units)
+                u = _units(units)
                 if u.isreftime:
                     return 1
             except TypeError:
@@ -985,27 +1542,22 @@ class CFChecker(object):
                 pass
       
         # Axis attribute has the value 'T'
-        if hasattr(variable, 'axis'):
-            if variable.axis == 'T':
-                return 1
+        if attrs.get('axis') == 'T':
+            return 1
 
         # Standard name is one of 'time' or 'forecast_reference_time'
-        if hasattr(variable, 'standard_name'):
-            if variable.standard_name == 'time' or variable.standard_name == 'forecast_reference_time':
-                return 1
+        if attrs.get('standard_name') in ('time', 'forecast_reference_time'):
+            return 1
 
         return 0
 
-
     def getStdName(self, var):
         """Get standard_name of variable.  Return it as 2 parts - the standard name and the modifier, if present."""
-        attName = 'standard_name'
-        attDict = var.__dict__
-
-        if attName not in list(attDict.keys()):
+        stdName = self._attributes(var.name).get('standard_name')
+        if stdName is None:
             return None
 
-        bits = attDict[attName].split()
+        bits = stdName.split()
       
         if len(bits) == 1:
             # Only standard_name part present
@@ -1023,41 +1575,15 @@ class CFChecker(object):
     def getInterpretation(self, units, positive=None):
         """Determine the interpretation (time - T, height or depth - Z,
         latitude - Y or longitude - X) of a dimension."""
-
-        try:
-            u = Units(units)
-        except:
-            # Don't catch invalid units here as already caught in a previous check
-            return None
-
-        if u.islongitude:
-            return "X"
-
-        if u.islatitude:
-            return "Y"
-
-        if u.ispressure:
-            return "Z"
-
-        # Dimensionless vertical coordinate
-        if units in ['level', 'layer', 'sigma_level']:
-            return "Z"
-
-        if positive and re.match('(up|down)',positive,re.I):
-            return "Z"
-
-        if u.istime or u.isreftime:
-            return "T"
-
-        # Not possible to deduce interpretation
-        return None
+        if isinstance(units, str) and (positive is None or isinstance(positive, str)):
+            return _interpret_units(units, positive)
+        return _interpret_units.__wrapped__(units, positive)
 
     def getCoordinateDataVars(self):
         """Obtain list of coordinate data variables, boundary
         variables, climatology variables and grid_mapping variables."""
 
-        allVariables = list(map(str, self.f.variables))   # List of all vars, including coord vars
-        axes = list(map(str, self.f.dimensions))
+        allVariables = list(self.f.variables)   # List of all vars, including coord vars
 
         coordVars = []
         variables = []
@@ -1076,29 +1602,41 @@ class CFChecker(object):
             else:
                 variables.append(varname)
 
+        # Set of data variable names for membership tests
+        variableSet = frozenset(variables)
+
+        # Attributes a boundary variable should not have, or which must agree with its parent
+        if self.version >= vn1_7:
+            boundsAttributes = _BOUNDS_ATTRIBUTES_1_7
+        else:
+            boundsAttributes = _BOUNDS_ATTRIBUTES
+
         for var in allVariables:
+            v = self.f.variables[var]
+            attrs = self._attributes(var)
 
             # ------------------------
             # Auxilliary Coord Checks
             # ------------------------
-            if hasattr(self.f.variables[var], 'coordinates'):
+            if 'coordinates' in attrs:
                 # Check syntax of 'coordinates' attribute
-                if not self.parseBlankSeparatedList(self.f.variables[var].coordinates):
+                coordinates = self.splitBlankSeparatedList(attrs['coordinates'])
+                if coordinates is None:
                     self._add_error("Invalid syntax for 'coordinates' attribute", var, code="5.3")
                 else:
-                    coordinates=self.f.variables[var].coordinates.split()
                     for dataVar in coordinates:
-                        if dataVar in variables:
+                        if dataVar in variableSet:
                             self._add_debug(dataVar)
 
                             # Has Auxillary Coordinate already been identified and checked?
                             if dataVar not in auxCoordVars:
                                 auxCoordVars.append(dataVar)
+                                dataVarDimensions = self.f.variables[dataVar].dimensions
 
                                 # Is the auxillary coordinate var actually a label?
-                                if self.getTypeCode(self.f.variables[dataVar]) == 'S':
+                                if self.varTypeCode(dataVar) == 'S':
                                     # Label variable
-                                    num_dimensions = len(self.f.variables[dataVar].dimensions)
+                                    num_dimensions = len(dataVarDimensions)
                                     if self.version < vn1_4:
                                         if not num_dimensions == 2:
                                             self._add_error("Label variable must have 2 dimensions only",
@@ -1110,7 +1648,7 @@ class CFChecker(object):
                                                             dataVar, code="6.1")
 
                                     if num_dimensions == 2:
-                                        if self.f.variables[dataVar].dimensions[0] not in self.f.variables[var].dimensions:
+                                        if dataVarDimensions[0] not in v.dimensions:
                                             if self.version >= vn1_6 and hasattr(self.f, 'featureType'):
                                                 # This file contains Discrete Sampling Geometries
                                                 self._add_info("File contains a Discrete Sampling Geometry. Skipping check on dimensions",
@@ -1127,11 +1665,12 @@ class CFChecker(object):
                                     # A ragged array is identified by the presence of either the attribute sample_dimension
                                     # or instance_dimension. Need to check that the sample dimension is the dimension of
                                     # the variable to which the aux coord var is attached.
-                                    self._add_debug("Not a label variable. Dimensions are: %s" % list(map(str, self.f.variables[dataVar].dimensions)),
-                                                    dataVar)
+                                    if self.debug:
+                                        self._add_debug("Not a label variable. Dimensions are: %s" %
+                                                        list(dataVarDimensions), dataVar)
 
-                                    for dim in self.f.variables[dataVar].dimensions:
-                                        if dim not in self.f.variables[var].dimensions:
+                                    for dim in dataVarDimensions:
+                                        if dim not in v.dimensions:
                                             if self.version >= vn1_6 and hasattr(self.f, 'featureType'):
                                                 # This file contains Discrete Sampling Geometries
                                                 self._add_info("File contains a Discrete Sampling Geometry. Skipping check on dimensions",
@@ -1143,7 +1682,7 @@ class CFChecker(object):
                                                                 code="5")
                                             break
 
-                        elif dataVar not in allVariables:
+                        elif dataVar not in self.f.variables:
                             self._add_error("coordinates attribute referencing non-existent variable",
                                             dataVar,
                                             code="5")
@@ -1151,27 +1690,30 @@ class CFChecker(object):
             # -------------------------
             # Boundary Variable Checks
             # -------------------------
-            if hasattr(self.f.variables[var], 'bounds'):
-                bounds=self.f.variables[var].bounds
+            if 'bounds' in attrs:
+                bounds=attrs['bounds']
                 # Check syntax of 'bounds' attribute
-                if not re.search("^[a-zA-Z0-9_]*$",bounds):
+                if not _VALID_NAME_RE.search(bounds):
                     self._add_error("Invalid syntax for 'bounds' attribute",
                                     var,
                                     code="7.1")
                 else:
-                    if bounds in variables:
+                    if bounds in variableSet:
                         boundaryVars.append(bounds)
+                        boundsVar = self.f.variables[bounds]
+                        boundsAttrs = self._attributes(bounds)
 
                         if not self.isNumeric(bounds):
                             self._add_error("boundary variable with non-numeric data type", var, code="7.1")
-                        if len(self.f.variables[var].shape) + 1 == len(self.f.variables[bounds].shape):
-                            if var in axes:
+                        boundsDimensions = boundsVar.dimensions
+                        if len(v.dimensions) + 1 == len(boundsDimensions):
+                            if var in self.f.dimensions:
                                 varDimensions=[var]
                             else:
-                                varDimensions=self.f.variables[var].dimensions
+                                varDimensions=v.dimensions
 
                             for dim in varDimensions:
-                                if dim not in self.f.variables[bounds].dimensions:
+                                if dim not in boundsDimensions:
                                     self._add_error("Incorrect dimensions for boundary variable: %s" % bounds,
                                                     bounds,
                                                     code="7.1")
@@ -1180,20 +1722,16 @@ class CFChecker(object):
                                             bounds,
                                             code="7.1")
 
-                        l = ['units', 'standard_name']
-                        if self.version >= vn1_7:
-                            l[len(l):] = ['axis', 'positive', 'calendar', 'leap_month', 'leap_year', 'month_lengths']
-                        for x in l:
-                            if hasattr(self.f.variables[bounds], x):
-                                if self.version >= vn1_7:
-                                    self._add_warn("Boundary var %s should not have attribute %s" % (bounds, x),
-                                                   bounds, code="7.1")
-                                if (hasattr(self.f.variables[var], x)
-                                    and self.f.variables[bounds].getncattr(x) != self.f.variables[var].getncattr(x)):
-                                    self._add_error("Boundary var %s has inconsistent %s to %s" % (bounds, x, var),
-                                                    bounds, code="7.1")
-
-                        if hasattr(self.f.variables[bounds], 'bounds'):
+                        # Only the attributes the boundary variable actually has, in order
+                        for x in [x for x in boundsAttributes if x in boundsAttrs]:
+                            if self.version >= vn1_7:
+                                self._add_warn("Boundary var %s should not have attribute %s" % (bounds, x),
+                                               bounds, code="7.1")
+                            if x in attrs and boundsAttrs[x] != attrs[x]:
+                                self._add_error("Boundary var %s has inconsistent %s to %s" % (bounds, x, var),
+                                                bounds, code="7.1")
+
+                        if 'bounds' in boundsAttrs:
                             self._add_error("Boundary var {} must not have attribute bounds".format(bounds),
                                             bounds, code="7.1")
 
@@ -1204,63 +1742,93 @@ class CFChecker(object):
                 # Check that points specified by a coordinate or auxilliary coordinate
                 # variable should lie within, or on the boundary, of the cells specified by
                 # the associated boundary variable.
-                if bounds in variables:
+                if bounds in variableSet:
                     # Is boundary variable 2 dimensional?  If so can check that points
                     # lie within, or on the boundary.
-                    if len(self.f.variables[bounds].dimensions) <= 2:
-                        varData = self.f.variables[var][:]
-                        boundsData = self.f.variables[bounds][:]
-
-                        # Convert 1d array (scalar coordinate variable) to 2d to check cell boundaries
-                        if len(boundsData.shape) == 1:
-                            boundsData = [boundsData]
-
-                        for i, value in (enumerate(varData) if len(varData.shape) else enumerate([varData])):
-                            try:
-                                if not (boundsData[i][0] <= value <= boundsData[i][1]) \
-                                        and not (boundsData[i][0] >= value >= boundsData[i][1]):
-                                    self._add_warn("Data for variable %s lies outside cell boundaries" % var,
+                    boundsVar = self.f.variables[bounds]
+                    if numpy.dtype(v.dtype).kind not in 'iuf' or numpy.dtype(boundsVar.dtype).kind not in 'iuf':
+                        # Strings can't be compared with cell boundaries (a non-numeric boundary
+                        # variable has already been reported above)
+                        self._add_debug("Non-numeric data, not checking it lies within cell boundaries", var)
+                    elif len(boundsVar.dimensions) <= 2:
+                        if (not self.fullBoundsCheck and len(v.shape) == 1 and len(boundsVar.shape) == 2
+                                and boundsVar.shape[0] == v.shape[0] > _BOUNDS_SAMPLE_LIMIT):
+                            # Large coordinate: only read a sample of the points and their cells
+                            index = _bounds_sample(v.shape[0])
+                            varData = v[index]
+                            boundsData = boundsVar[index, :]
+                            self._add_info("Only {} of the {} points checked against their cell boundaries "
+                                           "(use --full_bounds_check to check them all)".format(len(index), v.shape[0]),
+                                           var, code="7.1")
+                        else:
+                            varData = v[:]
+                            boundsData = boundsVar[:]
+
+                        if (len(varData.shape) == 1 and len(boundsData.shape) == 2
+                                and boundsData.shape[0] == varData.shape[0] and boundsData.shape[1] >= 2
+                                and varData.dtype.kind in 'iuf' and boundsData.dtype.kind in 'iuf'
+                                and not numpy.ma.is_masked(varData) and not numpy.ma.is_masked(boundsData)):
+                            # One cell per point: compare them all in one go
+                            values = numpy.ma.getdata(varData)
+                            lower = numpy.ma.getdata(boundsData)[:, 0]
+                            upper = numpy.ma.getdata(boundsData)[:, 1]
+                            inside = ((lower <= values) & (values <= upper)) | ((lower >= values) & (values >= upper))
+                            if not inside.all():
+                                self._add_warn("Data for variable %s lies outside cell boundaries" % var,
+                                               var,
+                                               code="7.1")
+                        else:
+                            # Convert 1d array (scalar coordinate variable) to 2d to check cell boundaries
+                            if len(boundsData.shape) == 1:
+                                boundsData = [boundsData]
+
+                            for i, value in (enumerate(varData) if len(varData.shape) else enumerate([varData])):
+                                try:
+                                    if not (boundsData[i][0] <= value <= boundsData[i][1]) \
+                                            and not (boundsData[i][0] >= value >= boundsData[i][1]):
+                                        self._add_warn("Data for variable %s lies outside cell boundaries" % var,
+                                                       var,
+                                                       code="7.1")
+                                        break
+                                except IndexError as e:
+                                    self._add_warn("Failed to check data lies within/on bounds for variable %s. Problem with bounds variable: %s" % (var, bounds),
                                                    var,
                                                    code="7.1")
+                                    self._add_debug("%s" % e, bounds)
+                                    break
+                                except ValueError as e:
+                                    self._add_error("Problem with variable: {} \n(Python Error: {})".format(var, e),
+                                                    var,
+                                                    code="7.1")
                                     break
-                            except IndexError as e:
-                                self._add_warn("Failed to check data lies within/on bounds for variable %s. Problem with bounds variable: %s" % (var, bounds),
-                                               var,
-                                               code="7.1")
-                                self._add_debug("%s" % e, bounds)
-                                break
-                            except ValueError as e:
-                                self._add_error("Problem with variable: {} \n(Python Error: {})".format(var, e),
-                                                var,
-                                                code="7.1")
-                                break
 
             # ----------------------------
             # Climatology Variable Checks
             # ----------------------------
-            if hasattr(self.f.variables[var], 'climatology'):
-                climatology=self.f.variables[var].climatology
+            if 'climatology' in attrs:
+                climatology=attrs['climatology']
                 # Check syntax of 'climatology' attribute
-                if not re.search("^[a-zA-Z0-9_]*$", climatology):
+                if not _VALID_NAME_RE.search(climatology):
                     self._add_error("Invalid syntax for 'climatology' attribute", var, code="7.4")
                 else:
-                    if climatology in variables:
+                    if climatology in variableSet:
                         climatologyVars.append(climatology)
+                        climatologyAttrs = self._attributes(climatology)
                         if not self.isNumeric(climatology):
                             self._add_error("climatology variable with non-numeric data type", climatology, code="7.4")
 
-                        if hasattr(self.f.variables[climatology], 'units'):
-                            if self.f.variables[climatology].units != self.f.variables[var].units:
+                        if 'units' in climatologyAttrs:
+                            if climatologyAttrs['units'] != attrs['units']:
                                 self._add_error("Climatology variable has inconsistent units to %s" % var,
                                                 climatology, code="7.4")
 
-                        if hasattr(self.f.variables[climatology], 'standard_name'):
-                            if self.f.variables[climatology].standard_name != self.f.variables[var].standard_name:
+                        if 'standard_name' in climatologyAttrs:
+                            if climatologyAttrs['standard_name'] != attrs['standard_name']:
                                 self._add_error("Climatology variable has inconsistent std_name to %s" % var,
                                                 climatology, code="7.4")
 
-                        if hasattr(self.f.variables[climatology], 'calendar'):
-                            if self.f.variables[climatology].calendar != self.f.variables[var].calendar:
+                        if 'calendar' in climatologyAttrs:
+                            if climatologyAttrs['calendar'] != attrs['calendar']:
                                 self._add_error("Climatology variable has inconsistent calendar to %s" % var,
                                                 climatology, code="7.4")
                     else:
@@ -1271,12 +1839,12 @@ class CFChecker(object):
             # Geometry Container Variables
             # -----------------------------
             if self.version >= vn1_8:
-                if hasattr(self.f.variables[var], 'geometry'):
-                    geometry = self.f.variables[var].geometry
-                    if not re.search("^[a-zA-Z0-9_]*$", geometry):
+                if 'geometry' in attrs:
+                    geometry = attrs['geometry']
+                    if not _VALID_NAME_RE.search(geometry):
                         self._add_error("Invalid syntax for 'geometry' attribute", var, code="7.5")
                     else:
-                        if geometry in variables:
+                        if geometry in variableSet:
                             # geometryContainerVars.append(geometry)
                             # Add geometry and associated data variable to dictionary
                             if geometryContainerVars.get(geometry) is None:
@@ -1287,11 +1855,11 @@ class CFChecker(object):
                             self._add_error("Geometry attribute referencing non-existent variable",
                                             var, code="7.5")
 
-                if hasattr(self.f.variables[var], 'node_coordinates'):
-                    if self.parseBlankSeparatedList(self.f.variables[var].node_coordinates):
-                        node_coordinates = self.f.variables[var].node_coordinates.split()
+                if 'node_coordinates' in attrs:
+                    node_coordinates = self.splitBlankSeparatedList(attrs['node_coordinates'])
+                    if node_coordinates is not None:
                         for coord in node_coordinates:
-                            if coord in allVariables:
+                            if coord in self.f.variables:
                                 # Add coordinate to auxillary coordinate and node coordinate lists
                                 auxCoordVars.append(coord)
                                 nodeCoordinateVars.append(coord)
@@ -1299,13 +1867,13 @@ class CFChecker(object):
             # ----------------------
             # Grid_mapping variables
             # ----------------------
-            if hasattr(self.f.variables[var], 'grid_mapping'):
-                grid_mapping = self.f.variables[var].grid_mapping
+            if 'grid_mapping' in attrs:
+                grid_mapping = attrs['grid_mapping']
 
                 (grid_mapping_vars, coord_vars) = self.chkGridMappingAttribute(var, grid_mapping)
 
                 for gmv in grid_mapping_vars:
-                    if gmv in variables:
+                    if gmv in variableSet:
                         gridMappingVars.append(gmv)
                     else:
                         self._add_error("grid_mapping attribute referencing non-existent variable %s" % gmv,
@@ -1313,13 +1881,13 @@ class CFChecker(object):
 
                 for cv in coord_vars:
                     # cv must be the name of a coordinate variable or auxiliary coordinate variable
-                    if cv not in self.f.variables[var].dimensions and cv not in coordinates:
+                    if cv not in v.dimensions and cv not in coordinates:
                         self._add_error("{} must be the name of a coordinate variable or auxiliary "
                                         "coordinate variable of {}".format(cv, var),
                                         var,
                                         code="5.6")
 
-                    if cv not in allVariables:
+                    if cv not in self.f.variables:
                         self._add_error("grid_mapping attribute referencing non-existent coordinate variable {}".format(cv),
                                         var,
                                         code="5.6")
@@ -1332,32 +1900,21 @@ class CFChecker(object):
         return (coordVars, auxCoordVars, boundaryVars, climatologyVars,
                 geometryContainerVars, gridMappingVars, nodeCoordinateVars)
 
-    def unique(self, list):
-        """Get a unique values from list"""
-        x = numpy.array(list)
-        return numpy.unique(x).tolist()
+    def unique(self, values):
+        """Get the unique values from values, in the order first seen"""
+        return list(dict.fromkeys(values))
 
     def subst(self, s):
         """substitute tokens for WORD and SEP (space or end of string)"""
-        return s.replace('WORD', r'[A-Za-z0-9_]+').replace('SEP', r'(\s+|$)')
+        return _subst(s)
 
     def get_variable_attributes(self, varName):
-        """Get all attributes of this variable and store in a dictionary"""
-        variable = self.f.variables[varName]
-        attributes = {}
+        """Get all attributes of this variable in a dictionary (shared with the other checks,
+        so not to be modified)"""
+        attributes = self._attributes(varName)
 
-        for attr in map(str, variable.ncattrs()):
-            try:
-                attributes[attr] = variable.getncattr(attr)
-                if isinstance(attributes[attr], basestring):
-                    try:
-                        attributes[attr] = str(attributes[attr])
-                    except:
-                        attributes[attr] = attributes[attr].encode(errors='ignore')
-            except UnicodeDecodeError:
-                pass
-
-        self._add_debug("attributes - {}".format(attributes), varName)
+        if self.debug:
+            self._add_debug("attributes - {}".format(attributes), varName)
         return attributes
 
     def chkGeometryContainerVar(self, varName):
@@ -1374,37 +1931,45 @@ class CFChecker(object):
         interior_ring = attributes.get('interior_ring')
         grid_mapping = attributes.get('grid_mapping')
 
+        @functools.lru_cache(maxsize=None)
+        def node_counts():
+            """Number of nodes in each geometry, read when first needed by the checks below"""
+            return self.f.variables[node_count][:] if node_count in self.f.variables else None
+
         node_coord_axes = []
         node_coord_dimensions = []
 
         if node_coordinates is None:
             self._add_error("No node_coordinates attribute set", varName, code="7.5")
         else:
-            if not self.parseBlankSeparatedList(node_coordinates):
+            node_coordinate_list = self.splitBlankSeparatedList(node_coordinates)
+            if node_coordinate_list is None:
                   self._add_error("Invalid syntax for 'node_coordinates' attribute", varName, code="7.5")
             else:
-                for var in node_coordinates.split():
-                    if var not in list(map(str, self.f.variables)):
+                for var in node_coordinate_list:
+                    if var not in self.f.variables:
                         self._add_error("Node_coordinates attribute referencing non-existent variable: {}".format(var),
                                         varName,
                                         code="7.5")
                     else:
                         # Check node_coordinate variable has an axis attribute
-                        if hasattr(self.f.variables[var], 'axis'):
+                        axis = self._attributes(var).get('axis')
+                        if axis is not None:
                             # Keep details of axis
-                            node_coord_axes.append(self.f.variables[var].axis)
+                            node_coord_axes.append(axis)
                         else:
                             self._add_error("Node_coordinates variable '{}' must have an axis attribute ".format(var),
                                             varName,
                                             code="7.5")
 
-                        if len(self.f.variables[var].dimensions) != 1:
+                        var_dims = self.f.variables[var].dimensions
+                        if len(var_dims) != 1:
                             self._add_error("Node coordinate variable '{}' must only have a single dimension".format(var),
                                             var,
                                             code="7.5")
                         else:
-                            if self.f.variables[var].dimensions[0] not in node_coord_dimensions:
-                                node_coord_dimensions.append(self.f.variables[var].dimensions[0])
+                            if var_dims[0] not in node_coord_dimensions:
+                                node_coord_dimensions.append(var_dims[0])
 
                 if not self.uniqueList(node_coord_axes):
                     self._add_error("Multiple node coordinate variables with same value of axis attribute",
@@ -1420,7 +1985,7 @@ class CFChecker(object):
                 elif node_count is not None:
                     # Same single dimension on all node coordinate variables
                     d = self.f.dimensions[node_coord_dimensions[0]].size
-                    total_nodes = self.f.variables[node_count][:].sum()
+                    total_nodes = node_counts().sum()
                     if d != total_nodes:
                         self._add_error("Dimension '{}' must equal the total number of nodes "
                                         "in all the geometries".format(node_coord_dimensions[0]),
@@ -1434,14 +1999,16 @@ class CFChecker(object):
             valid_geometry_types=['point', 'line', 'polygon']
 
             if geometry_type in valid_geometry_types:
-                # Valid geometry_type
-                if geometry_type == 'line' and not numpy.all(self.f.variables[node_count][:] >= 2):
+                # Valid geometry_type.  Use the smallest node count rather than testing every one
+                counts = node_counts() if geometry_type != 'point' else None
+                min_nodes = counts.min() if counts is not None and counts.size else None
+                if geometry_type == 'line' and min_nodes is not None and min_nodes < 2:
                     # Each geometry must have a minimum of 2 nodes
                     self._add_error("For 'line' geometry_type, each geometry must have a minimum of two nodes",
                                     varName,
                                     code="7.5")
                   
-                elif geometry_type == 'polygon' and not numpy.all(self.f.variables[node_count][:] >= 3):
+                elif geometry_type == 'polygon' and min_nodes is not None and min_nodes < 3:
                     # Each geometry must have a minimum of 3 nodes
                     self._add_error("For 'polygon' geometry_type, each geometry must have a minimum of three nodes",
                                     varName,
@@ -1479,7 +2046,7 @@ class CFChecker(object):
                                     code="7.5")
 
         if part_node_count is not None and node_count is not None:
-            if self.f.variables[part_node_count][:].sum() != self.f.variables[node_count][:].sum():
+            if self.f.variables[part_node_count][:].sum() != node_counts().sum():
                 self._add_error("Sum of part_node_count values must equal sum of node_count values", varName, code="7.5")
               
         if interior_ring is not None and part_node_count is None:
@@ -1488,11 +2055,11 @@ class CFChecker(object):
         if interior_ring is not None:
             interior_ring_variable = self.f.variables[interior_ring]
           
-            for value in interior_ring_variable[:]:
-                if value != 0 and value != 1:
-                    self._add_error("Values of interior ring variable '{}' must be either 0 or 1".format(interior_ring),
-                                    interior_ring,
-                                    code="7.5")
+            values = interior_ring_variable[:]
+            if ((values != 0) & (values != 1)).any():
+                self._add_error("Values of interior ring variable '{}' must be either 0 or 1".format(interior_ring),
+                                interior_ring,
+                                code="7.5")
 
             if len(interior_ring_variable.dimensions) != 1:
                 self._add_error("Interior ring variable '{}' must only have 1 dimension".format(interior_ring),
@@ -1518,7 +2085,7 @@ class CFChecker(object):
         if grid_mapping is not None:
             # Associated data variable(s) must also carry a grid_mapping attribute
             for data_var in self.geometryContainerVars[varName]:
-                if not hasattr(self.f.variables[data_var], 'grid_mapping'):
+                if 'grid_mapping' not in self._attributes(data_var):
                     self._add_error('Variable {} must have a grid_mapping attribute'.format(data_var),
                                     data_var,
                                     code='7.5')
@@ -1526,30 +2093,30 @@ class CFChecker(object):
         if coordinates is not None:
             # Associated data variable(s) must also carry a coordinates attribute
             for data_var in self.geometryContainerVars[varName]:
-                if not hasattr(self.f.variables[data_var], 'coordinates'):
+                if 'coordinates' not in self._attributes(data_var):
                     self._add_error('Variable {} must have a coordinates attribute'.format(data_var),
                                     data_var,
                                     code='7.5')
 
     def chkNodesAttribute(self, varName):
         """Validate nodes attribute"""
-        var = self.f.variables[varName]
+        attrs = self._attributes(varName)
 
-        if hasattr(var, 'nodes'):
+        if 'nodes' in attrs:
             # Syntax: a string whose value is a single variable name
-            if not self.validName(var.nodes):
+            if not self.validName(attrs['nodes']):
                 self._add_error("'nodes' attribute must be a string whose value is a single variable name",
                                 varName,
                                 code='7.5')
             else:
                 # Check that variable is a node coordinate variable and exists in the file
-                node_coordinate = var.nodes
+                node_coordinate = attrs['nodes']
                 if node_coordinate not in self.nodeCoordinateVars:
                     self._add_error("Variable referenced by 'nodes' attribute not identified as a node coordinate variable",
                                     varName,
                                     code='7.5')
 
-                if node_coordinate not in list(map(str, self.f.variables)):
+                if node_coordinate not in self.f.variables:
                     self._add_error("'nodes' attribute referencing non-existent variable",
                                     varName,
                                     code='7.5')
@@ -1560,24 +2127,15 @@ class CFChecker(object):
         grid_mapping_vars = []
         coord_vars = []
 
-        if self.version < vn1_7:
-            # Syntax: a string whose value is a single variable name
-            pat_sole = self.subst('(?P<sole_mapping>WORD)$')
-            m = re.match(pat_sole, grid_mapping)
+        if self.version < vn1_7 or ':' not in grid_mapping:
+            # Syntax: a string whose value is a single variable name (the only form
+            # before CF-1.7, and the only one possible without a colon)
+            m = _GM_SOLE_RE.match(grid_mapping)
               
         else:
             # Syntax: a string whose value is a single variable name or of the form:
             # grid_mapping_var: coord_var [coord_var ...] [grid_mapping_var: coord_var [coord_var ...]]
-
-            pat_coord = self.subst('(?P<coord>WORD)SEP')
-            pat_coord_list = '({})+'.format(pat_coord)
-
-            pat_mapping = self.subst('(?P<mapping_name>WORD):SEP(?P<coord_list>{})'.format(pat_coord_list))
-            pat_mapping_list = '({})+'.format(pat_mapping)
-
-            pat_all = self.subst('((?P<sole_mapping>WORD)|(?P<mapping_list>{}))$'.format(pat_mapping_list))
-
-            m = re.match(pat_all, grid_mapping)
+            m = _GM_ALL_RE.match(grid_mapping)
 
         if not m:
             self._add_error("{} - Invalid syntax for 'grid_mapping' attribute".format(varName), varName, code="5.6")
@@ -1592,12 +2150,12 @@ class CFChecker(object):
         else:
             # Complex form, split into lists of grid_mapping_vars and coord_vars
             mapping_list = m.group('mapping_list')
-            for mapping in re.finditer(pat_mapping, mapping_list):
+            for mapping in _GM_MAPPING_RE.finditer(mapping_list):
                 mapping_name = mapping.group('mapping_name')
                 coord_list = mapping.group('coord_list')
 
                 grid_mapping_vars.append(mapping_name)
-                for coord in re.finditer(pat_coord, coord_list):
+                for coord in _GM_COORD_RE.finditer(coord_list):
                     coord_vars.append(coord.group('coord'))
 
         return list(map(str,grid_mapping_vars)), list(map(str,coord_vars))
@@ -1605,224 +2163,88 @@ class CFChecker(object):
     def validGridMappingAttributes(self):
         """Setup dictionary of valid grid mapping attributes and their types"""
 
-        self.grid_mapping_attrs = dict([('azimuth_of_central_line', 'N'),
-                                        ('crs_wkt', 'S'),
-                                        ('earth_radius', 'N'),
-                                        ('false_easting', 'N'),
-                                        ('false_northing', 'N'),
-                                        ('geographic_crs_name', 'S'),
-                                        ('geoid_name', 'S'),
-                                        ('geopotential_datum_name', 'S'),
-                                        ('grid_mapping_name', 'S'),
-                                        ('grid_north_pole_latitude', 'N'),
-                                        ('grid_north_pole_longitude', 'N'),
-                                        ('horizontal_datum_name', 'S'),
-                                        ('inverse_flattening', 'N'),
-                                        ('latitude_of_projection_origin', 'N'),
-                                        ('longitude_of_central_meridian', 'N'),
-                                        ('longitude_of_prime_meridian', 'N'),
-                                        ('longitude_of_projection_origin', 'N'),
-                                        ('north_pole_grid_longitude', 'N'),
-                                        ('perspective_point_height', 'N'),
-                                        ('prime_meridian_name', 'S'),
-                                        ('projected_crs_name', 'S'),
-                                        ('reference_ellipsoid_name', 'S'),
-                                        ('scale_factor_at_central_meridian', 'N'),
-                                        ('scale_factor_at_projection_origin', 'N'),
-                                        ('semi_major_axis', 'N'),
-                                        ('semi_minor_axis', 'N'),
-                                        ('standard_parallel', 'N'),
-                                        ('straight_vertical_longitude_from_pole', 'N'),
-                                        ('towgs84', 'N')])
+        self.grid_mapping_attrs = _GRID_MAPPING_ATTRS
         return
 
     def chkGridMappingVar(self, varName):
         """Section 5.6: Grid Mapping Variable Checks"""
-        var=self.f.variables[varName]
+        var = self.f.variables[varName]
+        attrs = self._attributes(varName)
       
-        if hasattr(var, 'grid_mapping_name'):
+        if 'grid_mapping_name' in attrs:
             # Check grid_mapping_name is valid
-            validNames = ['albers_conical_equal_area',
-                          'azimuthal_equidistant',
-                          'lambert_azimuthal_equal_area',
-                          'lambert_conformal_conic',
-                          'polar_stereographic',
-                          'rotated_latitude_longitude',
-                          'stereographic',
-                          'transverse_mercator']
-          
-            if self.version >= vn1_2:
-                # Extra grid_mapping_names at vn1.2
-                validNames[len(validNames):] = ['latitude_longitude', 'vertical_perspective']
-
-            if self.version >= vn1_4:
-                # Extra grid_mapping_names at vn1.4
-                validNames[len(validNames):] = ['lambert_cylindrical_equal_area', 'mercator', 'orthographic']
-
-            if self.version >= vn1_7:
-                # Extra grid_mapping_names at vn1.7
-                validNames[len(validNames):] = ['geostationary', 'oblique_mercator', 'sinusoidal']
-              
-            if var.grid_mapping_name not in validNames:
-                self._add_error("Invalid grid_mapping_name: %s" % var.grid_mapping_name,
+            if attrs['grid_mapping_name'] not in _grid_mapping_names_for(self.version):
+                self._add_error("Invalid grid_mapping_name: %s" % attrs['grid_mapping_name'],
                                 varName, code="5.6")
         else:
-            self._add_error("No grid_mapping_name attribute set: %s" % var.grid_mapping_name,
-                            varName, code="5.6")
+            self._add_error("No grid_mapping_name attribute set", varName, code="5.6")
               
         if len(var.dimensions) != 0:
             self._add_warn("A grid mapping variable should have 0 dimensions",
                            varName, code="5.6")
 
-        for attribute in map(str, var.ncattrs()):
+        for attribute, value in attrs.items():
 
             # Check type of attribute matches that specified in Appendix F: Table 1
-            attr_type = type(var.getncattr(attribute))
+            attr_type = type(value)
 
-            if is_str_or_basestring(var.getncattr(attribute)):
+            if isinstance(value, str):
                 attr_type = 'S'
           
-            elif (numpy.issubdtype(attr_type, numpy.integer) or
-                  numpy.issubdtype(attr_type, numpy.floating) or
-                  attr_type == numpy.ndarray):
+            elif _is_numeric_value(value) or attr_type == numpy.ndarray:
                 attr_type = 'N'
 
             else:
                 self._add_info("Invalid Type for attribute: %s %s" % (attribute, attr_type))
                 continue
           
-            if (attribute in list(self.grid_mapping_attrs.keys()) and
-                    attr_type != self.grid_mapping_attrs[attribute]):
+            expected_type = self.grid_mapping_attrs.get(attribute)
+            if expected_type is not None and attr_type != expected_type:
                 self._add_error("Attribute %s of incorrect data type (Appendix F)" % attribute,
                                 varName, code="5.6")
               
         if self.version >= vn1_7:
-            if hasattr(var, 'crs_wkt'):
+            if 'crs_wkt' in attrs:
                 msg = "CF checker currently does not verify the syntax of the crs_wkt attribute " \
                       "which must conform to the CRS WKT specification"
                 self._add_info(msg, varName, code="5.6")
 
             # If any of these attributes are present then they all must be
-            l = ['reference_ellipsoid_name', 'prime_meridian_name', 'horizontal_datum_name', 'geographic_crs_name']
-            if any(hasattr(var, x) for x in l) and not all(hasattr(var, x) for x in l):
+            present = sum(1 for x in _CRS_NAME_ATTRIBUTES if x in attrs)
+            if 0 < present < len(_CRS_NAME_ATTRIBUTES):
                 msg = "reference_ellipsoid_name, prime_meridian_name, horizontal_datum_name " \
                       "and geographic_crs_name must all be definied if any one is defined"
                 self._add_error(msg, varName, code="5.6")
 
-            if hasattr(var, 'projected_crs_name') and not hasattr(var, 'geographic_crs_name'):
+            if 'projected_crs_name' in attrs and 'geographic_crs_name' not in attrs:
                 self._add_error("projected_crs_name is defined therefore geographic_crs_name must be also",
                                 varName, code="5.6")
 
     def setUpFormulas(self):
         """Set up dictionary of all valid formulas"""
-        self.formulas = {}
-        self.alias = {}
-
-        self.alias['atmosphere_ln_pressure_coordinate'] = 'atmosphere_ln_pressure_coordinate'
-        self.alias['atmosphere_sigma_coordinate'] = 'sigma'
-        self.alias['sigma'] = 'sigma'
-        self.alias['atmosphere_hybrid_sigma_pressure_coordinate'] = 'hybrid_sigma_pressure'
-        self.alias['hybrid_sigma_pressure'] = 'hybrid_sigma_pressure'
-        self.alias['atmosphere_hybrid_height_coordinate'] = 'atmosphere_hybrid_height_coordinate'
-        self.alias['atmosphere_sleve_coordinate'] = 'atmosphere_sleve_coordinate'
-        self.alias['ocean_sigma_coordinate'] = 'ocean_sigma_coordinate'
-        self.alias['ocean_s_coordinate'] = 'ocean_s_coordinate'
-        self.alias['ocean_s_coordinate_g1'] = 'ocean_s_coordinate_g1'
-        self.alias['ocean_s_coordinate_g2'] = 'ocean_s_coordinate_g2'
-        self.alias['ocean_sigma_z_coordinate'] = 'ocean_sigma_z_coordinate'
-        self.alias['ocean_double_sigma_coordinate'] = 'ocean_double_sigma_coordinate'
-
-        self.formulas['atmosphere_ln_pressure_coordinate'] = ['p(k)=p0*exp(-lev(k))']
-        self.formulas['sigma'] = ['p(n,k,j,i)=ptop+sigma(k)*(ps(n,j,i)-ptop)']
-
-        self.formulas['hybrid_sigma_pressure'] = ['p(n,k,j,i)=a(k)*p0+b(k)*ps(n,j,i)',
-                                                  'p(n,k,j,i)=ap(k)+b(k)*ps(n,j,i)']
-
-        self.formulas['atmosphere_hybrid_height_coordinate'] = ['z(n,k,j,i)=a(k)+b(k)*orog(n,j,i)']
-
-        self.formulas['atmosphere_sleve_coordinate'] = ['z(n,k,j,i) = a(k)*ztop + b1(k)*zsurf1(n,j,i) + b2(k)*zsurf2(n,j,i)']
-
-        self.formulas['ocean_sigma_coordinate'] = ['z(n,k,j,i)=eta(n,j,i)+sigma(k)*(depth(j,i)+eta(n,j,i))']
-      
-        self.formulas['ocean_s_coordinate'] = ['z(n,k,j,i)=eta(n,j,i)*(1+s(k))+depth_c*s(k)+(depth(j,i)-depth_c)*C(k)',
-                                               'C(k)=(1-b)*sinh(a*s(k))/sinh(a)+b*[tanh(a*(s(k)+0.5))/(2*tanh(0.5*a))-0.5]']
-
-        self.formulas['ocean_s_coordinate_g1'] = ['z(n,k,j,i) = S(k,j,i) + eta(n,j,i) * (1 + S(k,j,i) / depth(j,i))',
-                                                  'z(n,k,j,i) = S(k,j,i) + eta(n,j,i) * (1 + S(k,j,i) / depth(j,i))']
-
-        self.formulas['ocean_s_coordinate_g2'] = ['z(n,k,j,i) = eta(n,j,i) + (eta(n,j,i) + depth(j,i)) * S(k,j,i)',
-                                                  'S(k,j,i) = (depth_c * s(k) + depth(j,i) * C(k)) / (depth_c + depth(j,i))']
-
-        self.formulas['ocean_sigma_z_coordinate'] = ['z(n,k,j,i)=eta(n,j,i)+sigma(k)*(min(depth_c,depth(j,i))+eta(n,j,i))',
-                                                     'z(n,k,j,i)=zlev(k)']
-
-        self.formulas['ocean_double_sigma_coordinate'] = ['z(k,j,i)=sigma(k)*f(j,i)',
-                                                          'z(k,j,i)=f(j,i)+(sigma(k)-1)*(depth(j,i)-f(j,i))',
-                                                          'f(j,i)=0.5*(z1+z2)+0.5*(z1-z2)*tanh(2*a/(z1-z2)*(depth(j,i)-href))']
-
-        # Set up nested dictionary of:
-        # 1) valid standard_names for variables named by the formula_terms attribute
-        # 2) computed_standard_names (csn) for the variable specifying the formula_terms attribute
-
-        self.ft_var_stdnames=defaultdict(dict)
-
-        self.ft_var_stdnames['atmosphere_ln_pressure_coordinate'] = {'p0': ['reference_air_pressure_for_atmosphere_vertical_coordinate'],
-                                                                     'csn': ['air_pressure']}
-
-        self.ft_var_stdnames['sigma'] = {'ptop': ['air_pressure_at_top_of_atmosphere_model'],
-                                         'ps': ['surface_air_pressure'],
-                                         'csn': ['air_pressure']}
-
-        self.ft_var_stdnames['hybrid_sigma_pressure'] = {'p0': ['reference_air_pressure_for_atmosphere_vertical_coordinate'],
-                                                         'ps': ['surface_air_pressure'],
-                                                         'csn': ['air_pressure']}
-
-        self.ft_var_stdnames['atmosphere_hybrid_height_coordinate'] = {'orog': ['surface_altitude', 'surface_height_above_geopotential_datum'],
-                                                                       'a': ['atmosphere_hybrid_height_coordinate'],
-                                                                       'csn': ['altitude', 'height_above_geopotential_datum']}
-
-        self.ft_var_stdnames['atmosphere_sleve_coordinate'] = {'ztop': ['altitude_at_top_of_atmosphere_model', 'height_above_geopotential_datum_at_top_of_atmosphere_model'],
-                                                               'csn': ['altitude', 'height_above_geopotential_datum']}
-
-        self.ft_var_stdnames['ocean_sigma_coordinate'] = {'eta': ['set'], 'depth': ['set'], 'csn': ['set']}
-        self.ft_var_stdnames['ocean_s_coordinate'] = {'eta': ['set'], 'depth': ['set'], 'csn': ['set']}
-        self.ft_var_stdnames['ocean_s_coordinate_g1'] = {'eta': ['set'], 'depth': ['set'], 'csn': ['set']}
-        self.ft_var_stdnames['ocean_s_coordinate_g2'] = {'eta': ['set'], 'depth': ['set'], 'csn': ['set']}
-        self.ft_var_stdnames['ocean_sigma_z_coordinate'] = {'eta': ['set'], 'depth': ['set'], 'zlev': ['set'], 'csn': ['set']}
-        self.ft_var_stdnames['ocean_double_sigma_coordinate'] = {'depth': ['set'], 'csn': ['set']}
-
-        self.ft_stdname_sets = defaultdict(dict)
-        self.ft_stdname_sets[0] = {'zlev': ['altitude'],
-                                   'eta': ['sea_surface_height_above_geoid'],
-                                   'depth': ['sea_floor_depth_below_geoid'],
-                                   'csn': ['altitude']}
-
-        self.ft_stdname_sets[1] = {'zlev': ['height_above_geopotential_datum'],
-                                   'eta': ['sea_surface_height_above_geopotential_datum'],
-                                   'depth': ['sea_floor_depth_below_geopotential_datum'],
-                                   'csn': ['height_above_geopotential_datum']}
-
-        self.ft_stdname_sets[2] ={'zlev': ['height_above_reference_ellipsoid'],
-                                  'eta': ['sea_surface_height_above_reference_ellipsoid'],
-                                  'depth': ['sea_floor_depth_below_reference_ellipsoid'],
-                                  'csn': ['height_above_reference_ellipsoid']}
-
-        self.ft_stdname_sets[3] = {'zlev': ['height_above_mean_sea_level'],
-                                   'eta': ['sea_surface_height_above_mean_ sea_level'],
-                                   'depth': ['sea_floor_depth_below_mean_ sea_level'],
-                                   'csn': ['height_above_mean_sea_level']}
+        self.formulas = _FORMULAS
+        self.formula_names = _FORMULA_NAMES
+        self.alias = _FORMULA_ALIASES
+        self.ft_var_stdnames = _FT_VAR_STDNAMES
+        self.ft_stdname_sets = _FT_STDNAME_SETS
 
     def parseBlankSeparatedList(self, list):
         """Parse blank separated list"""
-        if re.match("^[a-zA-Z0-9_ ]*$",list):
+        if _RE_BLANK_LIST.match(list):
             return 1
         else:
             return 0
 
+    def splitBlankSeparatedList(self, list):
+        """Split blank separated list into its words, or return None if its syntax is invalid"""
+        if _RE_BLANK_LIST.match(list):
+            return list.split()
+        return None
+
     def extendedBlankSeparatedList(self, list):
         """Check list is a blank separated list of words containing alphanumeric characters
         plus underscore '_', period '.', plus '+', hyphen '-', or "at" sign '@'."""
-        if re.match("^[a-zA-Z0-9_ @\-\+\.]*$", list):
+        if _RE_EXT_LIST.match(list):
             return 1
         else:
             return 0
@@ -1830,7 +2252,7 @@ class CFChecker(object):
     def commaOrBlankSeparatedList(self, list):
         """Check list is a blank or comma separated list of words containing alphanumeric
         characters plus underscore '_', period '.', plus '+', hyphen '-', or "at" sign '@'."""
-        if re.match("^[a-zA-Z0-9_ @\-\+\.,]*$", list):
+        if _RE_COMMA_OR_BLANK.match(list):
             return 1
         else:
             return 0
@@ -1852,24 +2274,17 @@ class CFChecker(object):
             except KeyError:
                 pass
 
-        if hasattr(self.f, 'Conventions'):
-            conventions = self.f.Conventions
+        conventions = getattr(self.f, 'Conventions', None)
+        if conventions is not None:
 
             # Conventions attribute can be a blank separated (or comma separated) list of conforming conventions
             if not self.commaOrBlankSeparatedList(conventions):
                 self._add_error("Conventions attribute must be a blank (or comma) separated list of convention names",
                                 code="2.6.1")
             else:
-                # Split string up into component parts
-                # If a comma is present we assume a comma separated list as names cannot contain commas
-                if re.match("^.*,.*$", conventions):
-                    conventionList = conventions.split(",")
-                else:
-                    conventionList = conventions.split()
-
                 found = 0
-                for convention in conventionList:
-                    if convention.strip() in list(map(str, cfVersions)):
+                for convention in _split_conventions(conventions):
+                    if convention in _CF_VERSION_STRS:
                         found = 1
                         break
 
@@ -1877,7 +2292,7 @@ class CFChecker(object):
                     self._add_error("This netCDF file does not appear to contain CF Convention data.",
                                     code="2.6.1")
                 else:
-                    if convention.strip() != str(self.version):
+                    if convention != str(self.version):
                         self._add_warn("Inconsistency - This netCDF file appears to contain %s data, "
                                        "but you've requested a validity check against %s" % (convention, self.version),
                                        code="2.6.1")
@@ -1885,38 +2300,39 @@ class CFChecker(object):
             self._add_warn("No 'Conventions' attribute present", code="2.6.1")
 
         # Discrete geometries
-        if self.version >= vn1_6 and hasattr(self.f, 'featureType'):
-            featureType = self.f.featureType
-
-            if not re.match('^(point|timeSeries|trajectory|profile|timeSeriesProfile|trajectoryProfile)$', featureType, re.I):
+        featureType = getattr(self.f, 'featureType', None) if self.version >= vn1_6 else None
+        if featureType is not None:
+            if featureType.lower() not in _FEATURE_TYPES:
                 self._add_error("Global attribute 'featureType' contains invalid value",
                                 code="9.4")
 
         # External variables
-        if self.version >= vn1_7 and hasattr(self.f, 'external_variables'):
-            external_vars = self.f.external_variables
-            if is_str_or_basestring(external_vars):
-                if not self.parseBlankSeparatedList(external_vars):
+        external_vars = getattr(self.f, 'external_variables', None) if self.version >= vn1_7 else None
+        if external_vars is not None:
+            if isinstance(external_vars, str):
+                # Split string up into component parts
+                external_vars_list = self.splitBlankSeparatedList(external_vars)
+                if external_vars_list is None:
                     self._add_error("external_variables attribute must be a blank separated list of variable names",
                                     code="2.6.3")
                 else:
-                    # Split string up into component parts
-                    external_vars_list = external_vars.split()
                     for var in external_vars_list:
-                        if var.strip() in list(map(str, self.f.variables)):
+                        if var.strip() in self.f.variables:
                             self._add_error("Variable %s named as an external variable must not be present in this file" % var,
                                             code="2.6.3")
 
         # Global attributes that must be of type string
-        str_global_attrs = ['title', 'history', 'institution', 'source', 'references', 'comment']
-        if self.version >= vn1_6:
-            str_global_attrs.append('featureType')
         if self.version >= vn1_7:
-            str_global_attrs.append('external_variables')
+            str_global_attrs = _STR_GLOBAL_ATTRS_1_7
+        elif self.version >= vn1_6:
+            str_global_attrs = _STR_GLOBAL_ATTRS_1_6
+        else:
+            str_global_attrs = _STR_GLOBAL_ATTRS
 
         for attribute in str_global_attrs:
-            if hasattr(self.f, attribute):
-                if isnt_str_or_basestring(self.f.getncattr(attribute)):
+            value = getattr(self.f, attribute, None)
+            if value is not None:
+                if not isinstance(value, str):
                     self._add_error("Global attribute %s must be of type 'String'" % attribute,
                                     code="2.6.2")
 
@@ -1925,10 +2341,10 @@ class CFChecker(object):
         else a valid version based on Conventions else an empty version (for auto version)"""
         rc = CFVersion()
 
-        if "Conventions" in list(map(str, self.f.ncattrs())):
+        if "Conventions" in self.f.ncattrs():
             value = self.f.getncattr('Conventions')
 
-            if is_str_or_basestring(value):
+            if isinstance(value, str):
                 try:
                     conventions = str(value)
                 except UnicodeEncodeError:
@@ -1936,21 +2352,14 @@ class CFChecker(object):
             else:
                 conventions = value
 
-            # Split string up into component parts
-            # If a comma is present we assume a comma separated list as names cannot contain commas
-            if re.match("^.*,.*$", conventions):
-                conventionList = conventions.split(",")
-            else:
-                conventionList = conventions.split()
-
             found = 0
             coards = 0
-            for convention in conventionList:
-                if convention.strip() in list(map(str, cfVersions)):
+            for convention in _split_conventions(conventions):
+                if convention in _CF_VERSION_STRS:
                     found = 1
-                    rc = CFVersion(convention.strip())
+                    rc = CFVersion(convention)
                     break
-                elif convention.strip() == 'COARDS':
+                elif convention == 'COARDS':
                     coards = 1
 
             if not found and coards:
@@ -1963,8 +2372,7 @@ class CFChecker(object):
         """ Check for valid name.  They should begin with a
         letter and be composed of letters, digits and underscores."""
 
-        nameSyntax = re.compile('^[a-zA-Z][a-zA-Z0-9_]*$')
-        if not nameSyntax.match(name):
+        if not _NAME_SYNTAX_RE.match(name):
             return 0
 
         return 1
@@ -1980,8 +2388,7 @@ class CFChecker(object):
         trailingVars = []
     
         if len(list(dimensions)) > 1:
-            order = ['T', 'Z', 'Y', 'X']
-            axesFound = [0, 0, 0, 0]    # Holding array to record whether a dimension with an axis value has been found.
+            axesFound = 0    # Bit mask recording whether a dimension with each axis value (see _AXIS_POS) has been found.
             i = -1
             lastPos = -1
 
@@ -1998,24 +2405,27 @@ class CFChecker(object):
                                code='2.3')
                 i = i+1
                 try:
-                    if hasattr(self.f.variables[dim], 'axis'):
-                        pos = order.index(self.f.variables[dim].axis)
+                    dimAttrs = self._attributes(dim)
+                    if 'axis' in dimAttrs:
+                        axis = dimAttrs['axis']
+                        pos = _AXIS_POS.get(axis) if isinstance(axis, str) else None
+                        if pos is None: raise ValueError
 
                         # Is there already a dimension with this axis attribute specified.
-                        if axesFound[pos] == 1:
+                        if axesFound & (1 << pos):
                             self._add_error("Variable has more than 1 coordinate variable with same axis value",
                                             varName)
                         else:
-                            axesFound[pos] = 1
-                    elif hasattr(self.f.variables[dim], 'units') and self.f.variables[dim].units != "":
+                            axesFound |= 1 << pos
+                    elif 'units' in dimAttrs and dimAttrs['units'] != "":
                         # Determine interpretation of variable by units attribute
-                        if hasattr(self.f.variables[dim], 'positive'):
-                            interp = self.getInterpretation(self.f.variables[dim].units, self.f.variables[dim].positive)
+                        if 'positive' in dimAttrs:
+                            interp = self.getInterpretation(dimAttrs['units'], dimAttrs['positive'])
                         else:
-                            interp = self.getInterpretation(self.f.variables[dim].units)
+                            interp = self.getInterpretation(dimAttrs['units'])
 
                         if not interp: raise ValueError
-                        pos = order.index(interp)
+                        pos = _AXIS_POS[interp]
                     else:
                         # No axis or units attribute so can't determine interpretation of variable
                         raise ValueError
@@ -2041,7 +2451,7 @@ class CFChecker(object):
             # This check should only be applied for COARDS conformance.
             if self.coards:
                 validTrailing = self.boundsVars[:]
-                validTrailing[len(validTrailing):] = self.climatologyVars[:]
+                validTrailing.extend(self.climatologyVars)
                 if lastNonST > firstST and firstST != -1:
                     if len(trailingVars) == 1:
                         if varName not in validTrailing:
@@ -2051,7 +2461,6 @@ class CFChecker(object):
                         self._add_warn("dimensions %s should appear to left of space/time dimensions" % nonSpaceDimensions,
                                        varName, code="2.4")
 
-            sorted(dimensions)
             if not self.uniqueList(dimensions):
                 self._add_error("variable has repeated dimensions", varName, code="2.4")
 
@@ -2059,7 +2468,7 @@ class CFChecker(object):
         """
         Get the type, as a 1-character code
         """
-        if isinstance(obj, netCDF4.Variable):
+        if type(obj) is netCDF4.Variable:
             # Variable object
             if isinstance(obj.datatype, netCDF4.VLType):
                 # VLEN types not supported
@@ -2071,43 +2480,57 @@ class CFChecker(object):
                 self._add_warn("Problem getting typecode: {}".format(e), obj.name)
         else:
             # Attribute object
-            if isinstance(obj, bytes):
-                # Bytestring
+            if type(obj) is bytes:
+                # Bytestring (numpy.bytes_ has typecode 'S' anyway)
                 typecode='S'
             else:
                 typecode = obj.dtype.char
           
         return typecode
 
+    def varTypeCode(self, varName):
+        """
+        Get the type of variable varName as a 1-character code (see getTypeCode).
+        This is only worked out once per file for each variable.
+        """
+        typecode = self._typecode_cache.get(varName)
+        if typecode is None:
+            typecode = self._typecode_cache[varName] = self.getTypeCode(self.f.variables[varName])
+        return typecode
+
     def chkAttribute(self, attribute, varName, allCoordVars, boundsVars, geometryContainerVars):
         """Check the syntax of the attribute name, that the attribute
         is of the correct type and that it is attached to the right
         kind of variable."""
         var = self.f.variables[varName]
+        attrs = self._attributes(varName)
 
-        # https://www.unidata.ucar.edu/software/netcdf/docs/file_format_specifications.html
-        reserved_attributes = ["_FillValue", "_Encoding", "_Unsigned"]
-
-        if not self.validName(attribute) and attribute not in reserved_attributes:
+        if not self.validName(attribute) and attribute not in _RESERVED_ATTRIBUTES:
             self._add_error("Invalid attribute name: {}".format(attribute),
                             varName)
             return
 
-        try:
-            value = var.getncattr(attribute)
-        except KeyError as e:
-            self._add_error("{} - {}".format(attribute, e), varName, code="2.2")
-            if attribute in self.AttrList:
-                # This is a standard attribute so inform user no further checks being made on it
-                self._add_info("No further checks made on attribute: {}".format(attribute), varName)
-            return
+        if attribute in attrs:
+            value = attrs[attribute]
+        else:
+            # Attribute could not be read with the others, so get the reason
+            try:
+                value = var.getncattr(attribute)
+            except KeyError as e:
+                self._add_error("{} - {}".format(attribute, e), varName, code="2.2")
+                if attribute in self.AttrList:
+                    # This is a standard attribute so inform user no further checks being made on it
+                    self._add_info("No further checks made on attribute: {}".format(attribute), varName)
+                return
 
-        self._add_debug("chkAttribute: Checking attribute - {}".format(attribute), varName)
+        if self.debug:
+            self._add_debug("chkAttribute: Checking attribute - {}".format(attribute), varName)
  
         # ------------------------------------------------------------
         # Attribute of wrong 'type' in the sense numeric/non-numeric
         # ------------------------------------------------------------
-        if attribute in self.AttrList:
+        spec = self.AttrList.get(attribute)
+        if spec is not None:
             # Standard Attribute, therefore check type
 
             attrType = type(value)
@@ -2116,9 +2539,9 @@ class CFChecker(object):
                 # Bytestring
                 value = value.decode('utf-8')
 
-            if is_str_or_basestring(value):
+            if isinstance(value, str):
                 attrType = 'S'
-            elif numpy.issubdtype(attrType, numpy.integer) or numpy.issubdtype(attrType, numpy.floating):
+            elif _is_numeric_value(value):
                 attrType = 'N'
             elif attrType == numpy.ndarray:
                 attrType = 'N'
@@ -2130,73 +2553,57 @@ class CFChecker(object):
             # If attrType = 'NoneType' then it has been automatically created e.g. missing_value
             typeError = 0
             if attrType != 'NoneType':
-                if self.AttrList[attribute][0] == 'D':
+                if spec[0] == 'D':
                     # Special case for 'D' as these attributes will always be caught
                     # by one of the above cases.
                     # Attributes of type 'D' should be the same type as the data variable
                     # they are attached to.
                     if attrType == 'S':
                         # Note: A string is an array of chars
-                        if self.getTypeCode(var) != 'S':
+                        if self.varTypeCode(varName) != 'S':
                             typeError = 1
                     else:
-                        if self.getTypeCode(var) != self.getTypeCode(var.getncattr(attribute)):
+                        if self.varTypeCode(varName) != self.getTypeCode(value):
                                 typeError = 1
 
-                elif self.AttrList[attribute][0] != attrType:
+                elif spec[0] != attrType:
                     typeError = 1
 
                 if typeError:
-
-                    attrLookup = {"D": "Data Variable",
-                                  "N": "Numeric",
-                                  "S": "String"}
-
                     self._add_error("Attribute %s of incorrect type (expecting '%s' type, got '%s' type)" %
                                     (attribute,
-                                     attrLookup[self.AttrList[attribute][0]],
-                                     attrLookup[attrType]),
+                                     _ATTR_TYPE_NAMES[spec[0]],
+                                     _ATTR_TYPE_NAMES[attrType]),
                                     varName)
 
             # Attribute attached to the wrong kind of variable
-            uses = self.AttrList[attribute][1]
-            usesLen = len(uses)
-            i = 1
-            for use in uses:
-                if use == "C" and varName in allCoordVars:
-                    # Valid association
-                    break
-                elif use == "C" and self.version >= vn1_7 and attribute == "formula_terms" and varName in boundsVars:
-                    # Allow for formula_terms attribute in boundary variables
-                    # Valid association
-                    break
-                elif use == "D" and varName not in allCoordVars:
-                    # Valid association
-                    break
-                elif use == "M" and varName in geometryContainerVars.keys():
-                    # Variable is a geometry container variable - valid association
-                    break
-                elif i == usesLen:
-                    if attribute == "missing_value":
-                        # Special case since missing_value attribute is present for all
-                        # variables whether set explicitly or not. Is this a cdms thing?
-                        # Using var.missing_value is null then missing_value not set in the file
-                        if var.missing_value:
-                            self._add_warn("attribute %s attached to wrong kind of variable" % attribute,
-                                           varName)
-                    else:
-                        self._add_info("attribute %s is being used in a non-standard way" % attribute,
+            uses = spec[1]
+            isCoord = varName in allCoordVars
+            validUse = (("C" in uses and isCoord) or
+                        # Allow for formula_terms attribute in boundary variables
+                        ("C" in uses and self.version >= vn1_7 and attribute == "formula_terms" and
+                         varName in boundsVars) or
+                        ("D" in uses and not isCoord) or
+                        # Variable is a geometry container variable
+                        ("M" in uses and varName in geometryContainerVars))
+            if uses and not validUse:
+                if attribute == "missing_value":
+                    # Special case since missing_value attribute is present for all
+                    # variables whether set explicitly or not. Is this a cdms thing?
+                    # Using var.missing_value is null then missing_value not set in the file
+                    if value:
+                        self._add_warn("attribute %s attached to wrong kind of variable" % attribute,
                                        varName)
                 else:
-                    i = i+1
+                    self._add_info("attribute %s is being used in a non-standard way" % attribute,
+                                   varName)
 
             # Check no time variable attributes. E.g. calendar, month_lengths etc.
-            TimeAttributes = ['calendar', 'month_lengths', 'leap_year', 'leap_month', 'climatology']
-            if attribute in TimeAttributes:
+            if attribute in _TIME_ATTRIBUTES:
 
-                if hasattr(var, 'units'):
-                    varUnits = Units(var.units)
-                    secsSinceEpoch = Units('seconds since 1970-01-01')
+                if 'units' in attrs:
+                    varUnits = _units(attrs['units'])
+                    secsSinceEpoch = _units('seconds since 1970-01-01')
 
                     if not varUnits.equivalent(secsSinceEpoch):
                         self._add_error("Attribute %s may only be attached to time coordinate variable" % attribute,
@@ -2207,10 +2614,10 @@ class CFChecker(object):
 
     def chkCFRole(self, varName):
         """Validate cf_role attribute"""
-        var = self.f.variables[varName]
+        attrs = self._attributes(varName)
 
-        if hasattr(var, 'cf_role'):
-            cf_role = var.cf_role
+        if 'cf_role' in attrs:
+            cf_role = attrs['cf_role']
 
             # Keep a tally of how many variables have the cf_role attribute set
             self.cf_roleCount = self.cf_roleCount + 1
@@ -2220,22 +2627,22 @@ class CFChecker(object):
 
     def chkRaggedArray(self, varName):
         """Validate count/index variable"""
-        var=self.f.variables[varName]
+        attrs = self._attributes(varName)
   
-        if hasattr(var, 'sample_dimension'):
+        if 'sample_dimension' in attrs:
 
             self._add_debug("is a count variable (Discrete Geometries)", varName)
             self.raggedArrayFlag = 1
           
-            if self.getTypeCode(var) != 'i':
+            if self.varTypeCode(varName) != 'i':
                 self._add_error("count variable must be of type integer", varName, code="9.3")
 
-        if hasattr(var, 'instance_dimension'):
+        if 'instance_dimension' in attrs:
 
             self._add_debug("is an index variable (Discrete Geometries)", varName)
             self.raggedArrayFlag = 1
 
-            if self.getTypeCode(var) != 'i':
+            if self.varTypeCode(varName) != 'i':
                 self._add_error("index variable must be of type integer", varName, code="9.3")
 
     def isValidCellMethodTypeValue(self, type, value, varName):
@@ -2258,8 +2665,9 @@ class CFChecker(object):
                     self._add_error("%s is not allowed a leading dimension of more than one." % value,
                                     varName)
 
-            if hasattr(self.f.variables[value], 'standard_name'):
-                if self.f.variables[value].standard_name != 'area_type':
+            valueAttrs = self._attributes(value)
+            if 'standard_name' in valueAttrs:
+                if valueAttrs['standard_name'] != 'area_type':
                    rc = 0
                   
         # Is type a valid area_type according to the area_type table
@@ -2275,39 +2683,25 @@ class CFChecker(object):
         """
         varDimensions = {}
         var = self.f.variables[varName]
+        attrs = self._attributes(varName)
     
-        if hasattr(var, 'cell_methods'):
-            cellMethods = var.cell_methods
+        if 'cell_methods' in attrs:
+            cellMethods = attrs['cell_methods']
 
     #        cellMethods="lat: area: maximum (interval: 1 hours interval: 3 hours comment: fred)"
 
-            pr1 = re.compile(r'^'
-                             r'(\s*\S+\s*:\s*(\S+\s*:\s*)*'
-                             r'([a-z_]+)'
-                             r'(\s+where\s+\S+(\s+over\s+\S+)?)?'
-                             r'(\s+(over|within)\s+(days|years))?\s*'
-                             r'(\((interval:\s+\d+\s+\S+\s*)*(comment: .+)?.*\))?)'
-                             r'+$')
-
             # Validate the entire string
-            m = pr1.match(cellMethods)
+            m = _CM_VALIDATE_RE.match(cellMethods)
             if not m:
                 self._add_error("Invalid syntax for cell_methods attribute", varName, code="7.3")
 
             # Grab each word-list
             # dim1: [dim2: [dim3: ...]] method [where type1 [over type2]] [within|over days|years] [(comment)]
-            pr2 = re.compile(r'(?P<dimensions>\s*\S+\s*:\s*(\S+\s*:\s*)*'
-                             r'(?P<method>[a-z_]+)'
-                             r'(?:\s+where\s+(?P<type1>\S+)(?:\s+over\s+(?P<type2>\S+))?)?'
-                             r'(?:\s+(?:over|within)\s+(?:days|years))?\s*)'
-                             r'(?P<comment>\([^)]+\))?')
-
-            substr_iter = pr2.finditer(cellMethods)
+            substr_iter = _CM_SUBSTR_RE.finditer(cellMethods)
 
             # Validate each substring
             for s in substr_iter:
-                if not re.match(r'point|sum|maximum|median|mid_range|minimum|mean|mode|standard_deviation|variance',
-                                s.group('method')):
+                if not _METHOD_RE.match(s.group('method')):
                     self._add_error("Invalid cell_method: %s" %s.group('method'),
                                     varName, code="7.3")
 
@@ -2323,58 +2717,52 @@ class CFChecker(object):
                                             varName, code="7.3")
 
                 # Validate dim and check that it only appears once unless it is 'time'
-                allDims = re.findall(r'\S+\s*:',s.group('dimensions'))
-                dc = 0          # Number of dims
-
-                for part in allDims:
-                    dims = re.split(':',part)
-
-                    for d in dims:
-                        if d:
-                            dc = dc+1
-                            if d not in var.dimensions and d not in list(self.std_name_dh.dict.keys()):
-                                if self.version >= vn1_4:
-                                    # Extra constraints at CF-1.4 and above
-                                    if d != "area":
-                                        self._add_error("Invalid 'name' in cell_methods attribute: %s" % d,
-                                                        varName,
-                                                        code="7.3")
-                                else:
-                                    self._add_error("Invalid 'name' in cell_methods attribute: %s" % d,
-                                                    varName,
-                                                    code="7.3")
-                            else:
-                                # dim is a variable dimension
-                                if d != "time" and d in varDimensions:
-                                    self._add_error("Multiple cell_methods entries for dimension: %s" % d,
-                                                    varName,
-                                                    code="7.3")
-                                else:
-                                    varDimensions[d] = 1
-
-                                if self.version >= vn1_4:
-                                    # If dim is a coordinate variable and cell_method is not 'point' check
-                                    # if the coordinate variable has either bounds or climatology attributes
-                                    if d in self.coordVars and s.group('method') != 'point':
-                                        if not hasattr(self.f.variables[d], 'bounds') \
-                                                and not hasattr(self.f.variables[d], 'climatology'):
-                                            self._add_warn("Coordinate variable {} should have bounds or "
-                                                           "climatology attribute".format(d),
-                                                           varName,
-                                                           code="7.3")
+                dims = _DIM_RE.findall(s.group('dimensions'))
+                dc = len(dims)  # Number of dims
+
+                for d in dims:
+                    if d not in var.dimensions and d not in self.std_name_dh.dict:
+                        if self.version >= vn1_4:
+                            # Extra constraints at CF-1.4 and above
+                            if d != "area":
+                                self._add_error("Invalid 'name' in cell_methods attribute: %s" % d,
+                                                varName,
+                                                code="7.3")
+                        else:
+                            self._add_error("Invalid 'name' in cell_methods attribute: %s" % d,
+                                            varName,
+                                            code="7.3")
+                    else:
+                        # dim is a variable dimension
+                        if d != "time" and d in varDimensions:
+                            self._add_error("Multiple cell_methods entries for dimension: %s" % d,
+                                            varName,
+                                            code="7.3")
+                        else:
+                            varDimensions[d] = 1
+
+                        if self.version >= vn1_4:
+                            # If dim is a coordinate variable and cell_method is not 'point' check
+                            # if the coordinate variable has either bounds or climatology attributes
+                            if d in self.coordVars and s.group('method') != 'point':
+                                dAttrs = self._attributes(d)
+                                if 'bounds' not in dAttrs and 'climatology' not in dAttrs:
+                                    self._add_warn("Coordinate variable {} should have bounds or "
+                                                   "climatology attribute".format(d),
+                                                   varName,
+                                                   code="7.3")
                                                 
                 # Validate the comment associated with this method, if present
                 comment = s.group('comment')
-                if comment:
-                    getIntervals = re.compile(r'(?P<interval>interval:\s+\d+\s+(?P<unit>\S+)\s*)')
-                    allIntervals = getIntervals.finditer(comment)
+                if comment and 'interval:' in comment:
+                    allIntervals = _CM_INTERVAL_RE.finditer(comment)
 
                     # There must be zero, one or exactly as many interval clauses as there are dims
                     i = 0   # Number of intervals present
                     for m in allIntervals:
                         i = i+1
                         unit = m.group('unit')
-                        if not Units(unit).isvalid:
+                        if not _units(unit).isvalid:
                             self._add_error("Invalid unit %s in cell_methods comment" % unit, varName, code="7.3")
 
                     if i > 1 and i != dc:
@@ -2388,10 +2776,11 @@ class CFChecker(object):
         2) Reference valid variable
         3) Valid measure"""
         var = self.f.variables[varName]
+        attrs = self._attributes(varName)
     
-        if hasattr(var, 'cell_measures'):
-            cellMeasures = var.cell_measures
-            if not re.search("^([a-zA-Z0-9]+: +([a-zA-Z0-9_ ]+:?)*( +[a-zA-Z0-9_]+)?)$", cellMeasures):
+        if 'cell_measures' in attrs:
+            cellMeasures = attrs['cell_measures']
+            if not _CELL_MEASURES_RE.search(cellMeasures):
                 self._add_error("Invalid cell_measures syntax", varName, code="7.2")
             else:
                 # Need to validate the measure + name
@@ -2431,14 +2820,14 @@ class CFChecker(object):
                                         self._add_error("Dimensions of %s must be same or a subset of %s" % (variable, list(map(str, var.dimensions))),
                                                         varName, code="7.2")
 
-                            measure = re.sub(':', '', measure)
-                            if not re.match("^(area|volume)$", measure):
+                            measure = measure.replace(':', '')
+                            if measure not in ('area', 'volume'):
                                 self._add_error("Invalid measure in attribute cell_measures", varName, code="7.2")
 
-                            if measure == "area" and Units(self.f.variables[variable].units) != Units('m2'):
+                            if measure == "area" and _units(self.f.variables[variable].units) != _units('m2'):
                                 self._add_error("Must have square meters for area measure", varName, code="7.2")
 
-                            if measure == "volume" and Units(self.f.variables[variable].units) != Units('m3'):
+                            if measure == "volume" and _units(self.f.variables[variable].units) != _units('m3'):
                                 self._add_error("Must have cubic meters for volume measure", varName, code="7.2")
 
                 except StopIteration:
@@ -2452,8 +2841,9 @@ class CFChecker(object):
         3) Invalid formula_terms syntax
         4) Var referenced, not declared"""
         var = self.f.variables[varName]
+        attrs = self._attributes(varName)
     
-        if hasattr(var, 'formula_terms'):
+        if 'formula_terms' in attrs:
 
             if self.version >= vn1_7:
                 # CF conventions document reorganised - section no. has changed
@@ -2462,6 +2852,7 @@ class CFChecker(object):
                 scode = "4.3.2"
 
             bounds_parent = None
+            parentAttrs = {}
             if varName not in allCoordVars:
                 if self.version < vn1_7:
                     self._add_error("formula_terms attribute only allowed on coordinate variables", varName, code=scode)
@@ -2471,30 +2862,30 @@ class CFChecker(object):
                                         "boundary variables", varName, code=scode)
                     else:
                         for var_name, var_data in self.f.variables.items():
-                            if hasattr(var_data, 'bounds'):
-                                if var_data.bounds == varName:
-                                    bounds_parent = var_data
+                            if self._attributes(var_name).get('bounds') == varName:
+                                bounds_parent = var_data
+                                parentAttrs = self._attributes(var_name)
 
             # Check for consistency between bounds and parent coordinate variable
             if bounds_parent:
                 # bounds_parent will only be set for CF-1.7 & greater
                 for attr_common in ['units', 'standard_name', 'axis', 'positive', 'calendar',
                                     'leap_month', 'leap_year', 'month_lengths']:
-                    if hasattr(var, attr_common) and hasattr(bounds_parent, attr_common):
+                    if attr_common in attrs and attr_common in parentAttrs:
                         self._add_warn("Duplicate entries of variable attribute " + attr_common +
                                        " in coordinate and associated boundary variable", varName, code="7.1")
-                        if var.getncattr(attr_common) != bounds_parent.getncattr(attr_common):
+                        if attrs[attr_common] != parentAttrs[attr_common]:
                             self._add_error("Variable attribute " + attr_common +
                                             " does not agree between coordinate and associated boundary variable",
                                             varName, code='7.1')
 
             # Get standard_name to determine which formula is to be used
-            if not hasattr(var, 'standard_name') and not hasattr(bounds_parent, 'standard_name'):
+            if 'standard_name' not in attrs and 'standard_name' not in parentAttrs:
                 self._add_error("Cannot get formula definition as no standard_name", varName, code=scode)
                 # No sense in carrying on as can't validate formula_terms without valid standard name
                 return
 
-            if hasattr(var, 'standard_name'):
+            if 'standard_name' in attrs:
                 (stdName, modifier) = self.getStdName(var)
             else:
                 (stdName, modifier) = self.getStdName(bounds_parent)
@@ -2509,11 +2900,11 @@ class CFChecker(object):
             if self.version >= vn1_7:
                 # Check computed_standard_name is valid
                 setname = None
-                if hasattr(var, 'computed_standard_name'):
-                    csn = var.computed_standard_name
+                if 'computed_standard_name' in attrs:
+                    csn = attrs['computed_standard_name']
                     if self.ft_var_stdnames[index]['csn'][0] == 'set':
                         # Check which set
-                        for key in list(self.ft_stdname_sets.keys()):
+                        for key in self.ft_stdname_sets:
                             if csn in self.ft_stdname_sets[key]['csn']:
                                 # Found
                                 setname = key
@@ -2521,79 +2912,71 @@ class CFChecker(object):
                     elif csn not in self.ft_var_stdnames[index]['csn']:
                         self._add_error("Invalid computed_standard_name: %s" % csn, varName, code=scode)
 
-            formulaTerms = var.formula_terms
-            if not re.search("^([a-zA-Z0-9_]+: +[a-zA-Z0-9_]+( +)?)*$",formulaTerms):
+            formulaTerms = attrs['formula_terms']
+            if not _FT_RE.search(formulaTerms):
                 self._add_error("Invalid formula_terms syntax", varName, code=scode)
             else:
+                # Anything not part of a 'term: var' pair, e.g. where there is no space between a
+                # variable and the next term, is a syntax error that the pattern above allows
+                unpaired = _FT_PAIR_RE.sub(' ', formulaTerms).split()
+                if unpaired:
+                    self._add_error("Invalid formula_terms syntax: unexpected '{}'".format(' '.join(unpaired)),
+                                    varName, code=scode)
+
                 # Need to validate the term & var
-                iter_obj=iter(formulaTerms.split())
-                while True:
-                    try:
-                        term = next(iter_obj)
-                        term=re.sub(':', '', term)
-
-                        ftvar = next(iter_obj)
-
-                        # Term - Should be present in formula
-                        found = 'false'
-                        for formula in self.formulas[index]:
-                            if re.search(term,formula):
-                                found = 'true'
-                                break
-
-                        if found == 'false':
-                            self._add_error("Formula term {} not present in formula for {}".format(term, stdName),
-                                            varName, code=scode)
-
-                        # Variable - should be declared in netCDF file
-                        if ftvar not in list(self.f.variables.keys()):
-                            self._add_error("%s is not declared as a variable" % ftvar, varName, code=scode)
-                        elif ftvar == varName:
-                            # var is the variable specifying the formula_terms attribute
-                            pass
-                        else:
-                            if self.version >= vn1_7:
-                                # Check that standard_name of formula term is consistent with that
-                                # of the coordinate variable
-                                if hasattr(self.f.variables[ftvar], 'standard_name'):
-                                    try:
-                                        valid_stdnames = self.ft_var_stdnames[index][term]
-                                    except KeyError:
-                                        # No standard_name specified for this formula_term
-                                        continue
-
-                                    if valid_stdnames[0] == 'set':
-                                        if setname is None:
-                                            for key in list(self.ft_stdname_sets.keys()):
-                                                if self.f.variables[ftvar].standard_name in self.ft_stdname_sets[key][term]:
-                                                    # Found
-                                                    if not setname:
-                                                        setname = key
-                                                    elif setname != key:
-                                                        # standard_names of formula_terms vars are inconsistent
-                                                        self._add_error("Standard names of formula_terms variables "
-                                                                        "are inconsistent/invalid", varName, code=scode)
-                                                        break
-                                        else:
-                                            if not self.f.variables[ftvar].standard_name in self.ft_stdname_sets[setname][term]:
-                                                self._add_error("Standard names of formula_terms variables are "
-                                                                "inconsistent/invalid", varName, code=scode)
-
-                                    elif self.f.variables[ftvar].standard_name not in valid_stdnames:
-                                        self._add_error("Standard name of variable {} inconsistent with "
-                                                        "that of {}".format(ftvar, varName),
-                                                        varName, code=scode)
-
-                    except StopIteration:
-                        break
+                for term, ftvar in _FT_PAIR_RE.findall(formulaTerms):
+                    # Term - Should be present in formula
+                    if term not in self.formula_names[index]:
+                        self._add_error("Formula term {} not present in formula for {}".format(term, stdName),
+                                        varName, code=scode)
+
+                    # Variable - should be declared in netCDF file
+                    if ftvar not in self.f.variables:
+                        self._add_error("%s is not declared as a variable" % ftvar, varName, code=scode)
+                    elif ftvar == varName:
+                        # var is the variable specifying the formula_terms attribute
+                        pass
+                    else:
+                        if self.version >= vn1_7:
+                            # Check that standard_name of formula term is consistent with that
+                            # of the coordinate variable
+                            ftvarStdName = self._attributes(ftvar).get('standard_name')
+                            if ftvarStdName is not None:
+                                try:
+                                    valid_stdnames = self.ft_var_stdnames[index][term]
+                                except KeyError:
+                                    # No standard_name specified for this formula_term
+                                    continue
+
+                                if valid_stdnames[0] == 'set':
+                                    if setname is None:
+                                        for key, stdnameSet in self.ft_stdname_sets.items():
+                                            if ftvarStdName in stdnameSet[term]:
+                                                # Found
+                                                if not setname:
+                                                    setname = key
+                                                elif setname != key:
+                                                    # standard_names of formula_terms vars are inconsistent
+                                                    self._add_error("Standard names of formula_terms variables "
+                                                                    "are inconsistent/invalid", varName, code=scode)
+                                                    break
+                                    else:
+                                        if not ftvarStdName in self.ft_stdname_sets[setname][term]:
+                                            self._add_error("Standard names of formula_terms variables are "
+                                                            "inconsistent/invalid", varName, code=scode)
+
+                                elif ftvarStdName not in valid_stdnames:
+                                    self._add_error("Standard name of variable {} inconsistent with "
+                                                    "that of {}".format(ftvar, varName),
+                                                    varName, code=scode)
 
             # Check conformity of formula_terms in boundary coordinate variable
-            if hasattr(var, 'bounds') and self.version >= vn1_7:
-                var_bounds = self.f.variables[var.bounds]
-                if not hasattr(var_bounds, 'formula_terms'):
+            if 'bounds' in attrs and self.version >= vn1_7:
+                boundsAttrs = self._attributes(attrs['bounds'])
+                if 'formula_terms' not in boundsAttrs:
                     self._add_error("formula_terms attribute not present in boundary variable", varName, code=7.1)
                 else:
-                    formulaTerms_bounds = var_bounds.formula_terms
+                    formulaTerms_bounds = boundsAttrs['formula_terms']
                     ft_dict = {}
                     for nft, ft in enumerate([formulaTerms, formulaTerms_bounds]):
                         ft_dict[nft] = {}
@@ -2620,12 +3003,13 @@ class CFChecker(object):
                                                 varName, code=7.1)
 
                         for dim_term in term_var_dim:
-                            if hasattr(self.f.variables[dim_term], 'units'):
-                                if hasattr(self.f.variables[dim_term], 'positive'):
-                                    term_interp = self.getInterpretation(self.f.variables[dim_term].units,
-                                                                         self.f.variables[dim_term].positive)
+                            dimTermAttrs = self._attributes(dim_term)
+                            if 'units' in dimTermAttrs:
+                                if 'positive' in dimTermAttrs:
+                                    term_interp = self.getInterpretation(dimTermAttrs['units'],
+                                                                         dimTermAttrs['positive'])
                                 else:
-                                    term_interp = self.getInterpretation(self.f.variables[dim_term].units)
+                                    term_interp = self.getInterpretation(dimTermAttrs['units'])
                             else:
                                 # Unable to determine interpretation as no units attribute
                                 term_interp = None
@@ -2659,6 +3043,7 @@ class CFChecker(object):
         """Check units attribute"""
 
         var = self.f.variables[varName]
+        attrs = self._attributes(varName)
 
         if self.badc:
             # If unit is a BADC unit then no need to check via udunits
@@ -2666,11 +3051,11 @@ class CFChecker(object):
                 return
 
         # Test for blank since coordinate variables have 'units' defined even if not specifically defined in the file
-        if hasattr(var, 'units') and var.units != '':
+        if 'units' in attrs and attrs['units'] != '':
             # Type of units is a string
-            units = var.units
+            units = attrs['units']
 
-            if isnt_str_or_basestring(units):
+            if not isinstance(units, str):
                 self._add_error("units attribute must be of type 'String'", varName, code="3.1")
                 # units not a string so no point carrying out further tests
                 return
@@ -2689,9 +3074,9 @@ class CFChecker(object):
             else:
                 # units must be recognizable by udunits package
                 try:
-                    varUnit = Units(units)
+                    varUnit = _units(units)
                 except TypeError:
-                    varUnit = Units('error')
+                    varUnit = _units('error')
 
                 if not varUnit.isvalid:
                     self._add_error("Invalid units: %s" % units,  varName, code="3.1")
@@ -2700,7 +3085,7 @@ class CFChecker(object):
 
                 # units of a variable that specifies a standard_name must
                 # be consistent with units given in standard_name table
-                if hasattr(var, 'standard_name'):
+                if 'standard_name' in attrs:
                     (stdName,modifier) = self.getStdName(var)
 
                     # Is the Standard Name modifier number_of_observations being used.
@@ -2711,23 +3096,26 @@ class CFChecker(object):
                                             "units must be set to 1.",
                                             varName, code="3.3")
                   
-                    elif stdName in list(self.std_name_dh.dict.keys()):
+                    elif stdName in self.std_name_dh.dict:
                         # Get canonical units from standard name table
                         stdNameUnits = self.std_name_dh.dict[stdName]
 
-                        canonicalUnit = Units(stdNameUnits)
+                        canonicalUnit = _units(stdNameUnits)
                         # To compare units we need to remove the reference time from the variable units
-                        if re.search("since", units):
+                        if "since" in units:
                             # unit attribute contains a reference time - remove it
-                            varUnit = Units(units.split()[0])
+                            varUnit = _units(units.split()[0])
 
                         # If variable has cell_methods=variance we need to square standard_name table units
-                        if hasattr(var, 'cell_methods'):
+                        if 'cell_methods' in attrs:
                             # Remove comments from the cell_methods string - no need to search these
-                            getComments = re.compile(r'\([^)]+\)')
-                            noComments = getComments.sub('%5A', var.cell_methods)
+                            cellMethods = attrs['cell_methods']
+                            if '(' in cellMethods:
+                                noComments = _CM_COMMENT_RE.sub('%5A', cellMethods)
+                            else:
+                                noComments = cellMethods
 
-                            if re.search(r'(\s+|:)variance', noComments):
+                            if _VARIANCE_RE.search(noComments):
                                 # Variance method so standard_name units need to be squared.
                                 unit1 = canonicalUnit
                                 canonicalUnit = unit1 * unit1
@@ -2745,12 +3133,12 @@ class CFChecker(object):
                 # Label variables do not require units attribute
                 try:
                     if self.f.variables[varName].dtype.char != 'S':
-                        if hasattr(var, 'axis'):
-                            if not var.axis == 'Z':
+                        if 'axis' in attrs:
+                            if not attrs['axis'] == 'Z':
                                 self._add_warn("units attribute should be present", varName, code="3.1")
-                        elif not hasattr(var,'positive') \
-                                and not hasattr(var, 'formula_terms') \
-                                and not hasattr(var, 'compress'):
+                        elif 'positive' not in attrs \
+                                and 'formula_terms' not in attrs \
+                                and 'compress' not in attrs:
                             self._add_warn("units attribute should be present", varName, code="3.1")
                 except:
                     pass
@@ -2762,8 +3150,8 @@ class CFChecker(object):
 
                 dimensions = self.f.variables[varName].dimensions
 
-                if not (hasattr(var, 'flag_values')
-                        or hasattr(var, 'flag_masks')) \
+                if not ('flag_values' in attrs
+                        or 'flag_masks' in attrs) \
                         and len(dimensions) != 0:
                     try:
                         if self.f.variables[varName].dtype.char != 'S':
@@ -2779,29 +3167,29 @@ class CFChecker(object):
                                        code="2.2")
 
     def chkBADCUnits(self, var):
-        """Check units allowed by BADC"""
-        units_lines = open("/usr/local/cf-checker/lib/badc_units.txt").readlines()
-      
+        """Check units allowed by BADC.  var is the netCDF variable (or its name)"""
+        varName = var if isinstance(var, str) else var.name
+        units = self._attributes(varName).get('units')
+
         # units must be recognizable by the BADC units file
-        for line in units_lines:
-            if hasattr(var, 'units') and var.attributes['units'] in string.split(line):
-                self._add_info("Valid units in BADC list: %s" % var.attributes['units'], var.id)
-                return 1
+        if isinstance(units, str) and units in _badc_units():
+            self._add_info("Valid units in BADC list: %s" % units, varName)
+            return 1
         return 0
 
     def chkValidMinMaxRange(self, varName):
         """Check that valid_range and valid_min/valid_max are not both specified"""
-        var = self.f.variables[varName]
+        attrs = self._attributes(varName)
     
-        if hasattr(var, 'valid_range'):
-            if hasattr(var, 'valid_min') or hasattr(var, 'valid_max'):
+        if 'valid_range' in attrs:
+            if 'valid_min' in attrs or 'valid_max' in attrs:
                 self._add_error("Illegal use of valid_range and valid_min/valid_max", varName, code="2.5.1")
 
     def chkComputedStandardName(self, varName):
         """Check if var computed_standard_name attribute that it also has formula_terms attribute"""
-        var= self.f.variables[varName]
+        attrs = self._attributes(varName)
       
-        if hasattr(var, 'computed_standard_name') and not hasattr(var, 'formula_terms'):
+        if 'computed_standard_name' in attrs and 'formula_terms' not in attrs:
             self._add_error("computed_standard_name attribute is only allowed on a coordinate variable "
                             "which has a formula_terms attribute",
                             varName, code="4.3.3")
@@ -2815,24 +3203,25 @@ class CFChecker(object):
         4) is valid if valid_range/valid_min/valid_max are specified
         """
         var = self.f.variables[varName]
+        attrs = self._attributes(varName)
 
-        if hasattr(var, 'actual_range'):
-            actual_range = var.actual_range
+        if 'actual_range' in attrs:
+            actual_range = attrs['actual_range']
 
             if len(actual_range) != 2:
                 self._add_error("actual_range attribute must contain only 2 elements",
                                 varName, code="2.5.1")
 
-            actual_range_type = var.actual_range.dtype.char
+            actual_range_type = actual_range.dtype.char
 
             # actual_range must be of same type as scale_factor/add_offset, if present otherwise the associated variable
-            if hasattr(var, 'scale_factor') or hasattr(var, 'add_offset'):
+            if 'scale_factor' in attrs or 'add_offset' in attrs:
 
-                if hasattr(var, 'scale_factor') and actual_range_type != var.scale_factor.dtype.char:
+                if 'scale_factor' in attrs and actual_range_type != attrs['scale_factor'].dtype.char:
                         self._add_error("actual_range attribute must be of same type as scale_factor",
                                         varName, code="2.5.1")
 
-                if hasattr(var, 'add_offset') and actual_range_type != var.add_offset.dtype.char:
+                if 'add_offset' in attrs and actual_range_type != attrs['add_offset'].dtype.char:
                         self._add_error("actual_range attribute must be of same type as add_offset",
                                         varName, code="2.5.1")
             else:
@@ -2843,18 +3232,12 @@ class CFChecker(object):
             # actual_range values must lie within valid_range, if specified
             min_v = None
             max_v = None
-            if hasattr(var, 'valid_range'):
-                min_v = var.valid_range[0]
-                max_v = var.valid_range[1]
-            elif hasattr(var, 'valid_min') or hasattr(var, 'valid_max'):
-                try:
-                    min_v = var.valid_min
-                except AttributeError:
-                    pass
-                try:
-                    max_v = var.valid_max
-                except AttributeError:
-                    pass
+            if 'valid_range' in attrs:
+                min_v = attrs['valid_range'][0]
+                max_v = attrs['valid_range'][1]
+            else:
+                min_v = attrs.get('valid_min')
+                max_v = attrs.get('valid_max')
 
             if min_v and max_v:
                 if not ((min_v <= actual_range[0] <= max_v) and (min_v <= actual_range[1] <= max_v)):
@@ -2869,26 +3252,19 @@ class CFChecker(object):
                 self._add_error("actual_range values must be less than or equal to %s (valid_max)" % max_v,
                                 varName, code="2.5.1")
 
-            varData = self.f.variables[varName][:]
             # Note: scale_factor & add_offset is automatically applied to data values.
-            if varData.count() == 0:
+            dataRange = _data_range(var)
+            if dataRange is None:
                 # All data values equal the missing value
                 self._add_error("There must be no actual_range attribute when all data values equal the missing value",
                                 varName, code="2.5.1")
             else:
                 # Data values present
-                missing_value = None
-          
-                if hasattr(var, '_FillValue'):
-                    missing_value = var._FillValue
-                elif hasattr(var, 'missing_value'):
-                    missing_value = var.missing_value
+                missing_value = attrs.get('_FillValue', attrs.get('missing_value'))
 
                 if missing_value:
-                    # Find minimum and maximum data value.
-                    # varData doesn't include values that are missing data
-                    min_dv=varData.min()
-                    max_dv=varData.max()
+                    # Minimum and maximum data value, not including values that are missing data
+                    min_dv, max_dv = dataRange
 
                     if min_dv and actual_range[0] != min_dv:
                         self._add_error("First element of actual_range must equal minimum data value of variable "
@@ -2905,13 +3281,14 @@ class CFChecker(object):
         3) type of missing_value
         """
         var = self.f.variables[varName]
+        attrs = self._attributes(varName)
 
-        if hasattr(var, '_FillValue'):
-            fillValue = var._FillValue
+        if '_FillValue' in attrs:
+            fillValue = attrs['_FillValue']
 
-            if hasattr(var, 'valid_range'):
+            if 'valid_range' in attrs:
                 # Check _FillValue is outside valid_range
-                validRange = var.valid_range
+                validRange = attrs['valid_range']
                 if validRange[0] < fillValue < validRange[1]:
                     self._add_warn("_FillValue should be outside valid_range", varName, code="2.5.1")
 
@@ -2922,11 +3299,11 @@ class CFChecker(object):
                 self._add_error("Climatology Variable {} must not have _FillValue attribute".format(varName),
                                 varName, code="7.4")
 
-        if hasattr(var, 'missing_value'):
-            missingValue = var.missing_value
+        if 'missing_value' in attrs:
+            missingValue = attrs['missing_value']
             try:
                 if missingValue:
-                    if hasattr(var, '_FillValue'):
+                    if '_FillValue' in attrs:
 
                         if isinstance(fillValue, bytes):
                             fillValue = fillValue.decode('utf-8')
@@ -2951,9 +3328,10 @@ class CFChecker(object):
     def chkAxisAttribute(self, varName):
         """Check validity of axis attribute"""
         var = self.f.variables[varName]
+        attrs = self._attributes(varName)
       
-        if hasattr(var, 'axis'):
-            if not re.match('^(X|Y|Z|T)$', var.axis, re.I):
+        if 'axis' in attrs:
+            if not _AXIS_RE.match(attrs['axis']):
                 self._add_error("Invalid value for axis attribute", varName, code="4")
                 return
 
@@ -2965,77 +3343,75 @@ class CFChecker(object):
           
             # Check that axis attribute is consistent with the coordinate type
             # deduced from units and positive.
-            if hasattr(var, 'units'):
-                if hasattr(var, 'positive'):
-                    interp = self.getInterpretation(var.units,var.positive)
+            if 'units' in attrs:
+                if 'positive' in attrs:
+                    interp = self.getInterpretation(attrs['units'],attrs['positive'])
                 else:
-                    interp = self.getInterpretation(var.units)
+                    interp = self.getInterpretation(attrs['units'])
             else:
                 # Variable does not have a units attribute so a consistency check cannot be made
                 interp = None
 
             if interp != None:
                 # It was possible to deduce axis interpretation from units/positive
-                if interp != var.axis:
+                if interp != attrs['axis']:
                     self._add_error("axis attribute inconsistent with coordinate type as deduced from "
                                     "units and/or positive",
                                     varName, code="4")
                     return
 
     def chkPositiveAttribute(self, varName):
-        var = self.f.variables[varName]
-        if hasattr(var, 'positive'):
-            if not re.match('^(down|up)$', var.positive, re.I):
+        attrs = self._attributes(varName)
+        if 'positive' in attrs:
+            if not _POSITIVE_RE.match(attrs['positive']):
                 self._add_error("Invalid value for positive attribute", varName, code="4.3")
 
     def chkTimeVariableAttributes(self, varName):
-        var = self.f.variables[varName]
+        attrs = self._attributes(varName)
 
-        if hasattr(var, 'calendar'):
-            if not re.match('(gregorian|standard|proleptic_gregorian|noleap|365_day|all_leap|'
-                            '366_day|360_day|julian|none)', var.calendar, re.I):
+        if 'calendar' in attrs:
+            if not _CALENDAR_RE.match(attrs['calendar']):
                 # Non-standardized calendar so month_lengths should be present
-                if not hasattr(var, 'month_lengths'):
+                if 'month_lengths' not in attrs:
                     self._add_error("Non-standard calendar, so month_lengths attribute must be present",
                                     varName,
                                     code="4.4.1")
             else:
-                if hasattr(var, 'month_lengths') or \
-                   hasattr(var, 'leap_year') or \
-                   hasattr(var, 'leap_month'):
+                if 'month_lengths' in attrs or \
+                   'leap_year' in attrs or \
+                   'leap_month' in attrs:
                     self._add_error("The attributes 'month_lengths', 'leap_year' and 'leap_month' must not appear "
                                     "when 'calendar' is present.",
                                     varName,
                                     code="4.4.1")
 
-        if not hasattr(var, 'calendar') and not hasattr(var, 'month_lengths'):
+        if 'calendar' not in attrs and 'month_lengths' not in attrs:
             self._add_warn("Use of the calendar and/or month_lengths attributes is recommended for time "
                            "coordinate variables", varName, code="4.4.1")
 
-        if hasattr(var, 'month_lengths'):
-            if len(var.month_lengths) != 12 and \
-               self.getTypeCode(var.month_lengths) != 'i':
+        if 'month_lengths' in attrs:
+            if len(attrs['month_lengths']) != 12 and \
+               self.getTypeCode(attrs['month_lengths']) != 'i':
                 self._add_error("Attribute 'month_lengths' should be an integer array of size 12",
                                 varName, code="4.4.1")
 
-        if hasattr(var, 'leap_year'):
-            if self.getTypeCode(var.leap_year) != 'i' and \
-               len(var.leap_year) != 1:
+        if 'leap_year' in attrs:
+            if self.getTypeCode(attrs['leap_year']) != 'i' and \
+               len(attrs['leap_year']) != 1:
                 self._add_error("leap_year should be a scalar value", varName, code="4.4.1")
 
-        if hasattr(var, 'leap_month'):
-            if not re.match("^(1|2|3|4|5|6|7|8|9|10|11|12)$",
-                            str(var.leap_month[0])):
+        if 'leap_month' in attrs:
+            if not _MONTH_RE.match(str(attrs['leap_month'][0])):
                 self._add_error("leap_month should be between 1 and 12", varName, code="4.4.1")
 
-            if not hasattr(var, 'leap_year'):
+            if 'leap_year' not in attrs:
                 self._add_warn("leap_month is ignored as leap_year NOT specified", varName, code="4.4.1")
 
         # Time units must contain a reference time
         try:
-            varUnits = Units(var.units)
+            varUnits = _units(attrs['units'])
         except TypeError:
-            varUnits = Units('error')
+            varUnits = _units('error')
 
         if not varUnits.isreftime:
             self._add_error("Invalid units and/or reference time", varName, code="4.4")
@@ -3043,19 +3419,19 @@ class CFChecker(object):
     def chkDescription(self, varName):
         """Check 1) standard_name & long_name attributes are present
                  2) for a valid standard_name as listed in the standard name table."""
-        var = self.f.variables[varName]
+        attrs = self._attributes(varName)
 
-        if not hasattr(var, 'standard_name') and \
-           not hasattr(var, 'long_name'):
+        if 'standard_name' not in attrs and \
+           'long_name' not in attrs:
 
             exceptions = self.boundsVars + self.climatologyVars + self.gridMappingVars + \
-                         list(map(str, self.geometryContainerVars.keys()))
+                         list(self.geometryContainerVars)
             if varName not in exceptions:
                 self._add_warn("No standard_name or long_name attribute specified", varName, code="3")
               
-        if hasattr(var, 'standard_name'):
+        if 'standard_name' in attrs:
             # Check if valid by the standard_name table and allowed modifiers
-            std_name = var.standard_name
+            std_name = attrs['standard_name']
 
             # standard_name attribute can comprise a standard_name only or a standard_name
             # followed by a modifier (E.g. atmosphere_cloud_liquid_water_content status_flag)
@@ -3069,7 +3445,7 @@ class CFChecker(object):
             else:
                 # Validate standard_name
                 name = std_name_el[0]
-                if not name in list(self.std_name_dh.dict.keys()):
+                if name not in self.std_name_dh.dict:
                     if check_derived_name(name):
                         self._add_error("Invalid standard_name: %s" % name, varName, code="3.3")
 
@@ -3092,11 +3468,11 @@ class CFChecker(object):
                         # Not a char variable so getStringValue couldn't be applied
 
                         # Does variable have flag_meanings attribute
-                        if hasattr(var, 'flag_meanings'):
+                        if 'flag_meanings' in attrs:
                             # Check values are from the region names permitted list
-                            meanings = var.flag_meanings
+                            meanings = attrs['flag_meanings']
 
-                            if is_str_or_basestring(meanings):
+                            if isinstance(meanings, str):
                                 region_names = meanings.split()
                                 for region in region_names:
                                     if not region in list(self.region_name_lh.list):
@@ -3127,11 +3503,11 @@ class CFChecker(object):
 
                     if len(area_types) == 1 and area_types[0] == None:
                         # Not a char variable
-                        if hasattr(var, 'flag_meanings'):
+                        if 'flag_meanings' in attrs:
                             # Check values are from the region names permitted list
-                            meanings = var.flag_meanings
+                            meanings = attrs['flag_meanings']
 
-                            if is_str_or_basestring(meanings):
+                            if isinstance(meanings, str):
                                 area_types = meanings.split()
                                 for area in area_types:
                                     if not area in list(self.area_type_lh.list):
@@ -3152,10 +3528,10 @@ class CFChecker(object):
                     else:
                         self._add_error("No area types specified", varName, code="3.3")
 
-                if hasattr(var, 'positive'):
+                if 'positive' in attrs:
                     # Check that positive attribute is consistent with sign implied by standard_name
-                    if (re.match("height", name, re.I) and not re.match("up", var.positive, re.I)) or \
-                            (re.match("depth", name, re.I) and not re.match("down", var.positive, re.I)):
+                    if (_HEIGHT_RE.match(name) and not _UP_RE.match(attrs['positive'])) or \
+                            (_DEPTH_RE.match(name) and not _DOWN_RE.match(attrs['positive'])):
                         self._add_warn("Positive attribute inconsistent with sign conventions implied by "
                                        "the standard_name", varName, code="4.3")
 
@@ -3189,13 +3565,14 @@ class CFChecker(object):
     def chkCompressAttr(self, varName):
         """Check Compress Attribute"""
         var = self.f.variables[varName]
-        if hasattr(var, 'compress'):
-            compress = var.compress
+        attrs = self._attributes(varName)
+        if 'compress' in attrs:
+            compress = attrs['compress']
 
             if var.dtype.char != 'i':
                 self._add_error("compress attribute can only be attached to variable of type int.", varName, code="8.2")
                 return
-            if not re.search("^[a-zA-Z0-9_ ]*$",compress):
+            if not _RE_BLANK_LIST.search(compress):
                 self._add_error("Invalid syntax for 'compress' attribute", varName, code="8.2")
             else:
                 dimensions = compress.split()
@@ -3219,16 +3596,17 @@ class CFChecker(object):
 
     def chkPackedData(self, varName):
         var = self.f.variables[varName]
-        if hasattr(var, 'scale_factor') and hasattr(var, 'add_offset'):
-            if var.scale_factor.dtype.char != var.add_offset.dtype.char:
+        attrs = self._attributes(varName)
+        if 'scale_factor' in attrs and 'add_offset' in attrs:
+            if attrs['scale_factor'].dtype.char != attrs['add_offset'].dtype.char:
                 self._add_error("scale_factor and add_offset must be the same numeric data type", varName, code="8.1")
                 # No point running rest of packed data tests
                 return
 
-        if hasattr(var, 'scale_factor'):
-            type = var.scale_factor.dtype.char
-        elif hasattr(var, 'add_offset'):
-            type = var.add_offset.dtype.char
+        if 'scale_factor' in attrs:
+            type = attrs['scale_factor'].dtype.char
+        elif 'add_offset' in attrs:
+            type = attrs['add_offset'].dtype.char
         else:
             # No packed Data attributes present
             return
@@ -3249,18 +3627,19 @@ class CFChecker(object):
 
     def chkFlags(self, varName):
         var = self.f.variables[varName]
+        attrs = self._attributes(varName)
 
-        if hasattr(var, 'flag_meanings'):
+        if 'flag_meanings' in attrs:
             # Flag to indicate whether one of flag_values or flag_masks present
             values_or_masks = 0
-            meanings = var.flag_meanings
+            meanings = attrs['flag_meanings']
 
             if not self.extendedBlankSeparatedList(meanings):
                 self._add_error("Invalid syntax for 'flag_meanings' attribute", varName, code="3.5")
           
-            if hasattr(var, 'flag_values'):
+            if 'flag_values' in attrs:
                 values_or_masks = 1
-                values = var.flag_values
+                values = attrs['flag_values']
               
                 retcode = self.equalNumOfValues(values,meanings)
                 if retcode == -1:
@@ -3270,7 +3649,7 @@ class CFChecker(object):
                                     "in flag_meanings", varName, code="3.5")
                   
                 # flag_values values must be mutually exclusive
-                if is_str_or_basestring(values):
+                if isinstance(values, str):
                     values = values.split()
 
                 try:
@@ -3281,9 +3660,9 @@ class CFChecker(object):
                 if not self.uniqueList(iterator):
                     self._add_error("flag_values attribute must contain a list of unique values", varName, code="3.5")
                   
-            if hasattr(var, 'flag_masks'):
+            if 'flag_masks' in attrs:
                 values_or_masks = 1
-                masks = var.flag_masks
+                masks = attrs['flag_masks']
 
                 retcode = self.equalNumOfValues(masks,meanings)
                 if retcode == -1:
@@ -3304,7 +3683,7 @@ class CFChecker(object):
                       
             # Doesn't make sense to do bitwise comparison for char variable
             if var.dtype.char != 'c':
-                if hasattr(var, 'flag_values') and hasattr(var, 'flag_masks'):
+                if 'flag_values' in attrs and 'flag_masks' in attrs:
                     # Both flag_values and flag_masks present
                     # Do a bitwise AND of each flag_value and its corresponding flag_mask value,
                     # the result must be equal to the flag_values entry
@@ -3325,17 +3704,17 @@ class CFChecker(object):
                                 varName,
                                 code="3.5")
 
-            if hasattr(var, 'flag_values') and not hasattr(var, 'flag_meanings'):
+            if 'flag_values' in attrs and 'flag_meanings' not in attrs:
                 self._add_error("flag_meanings attribute is missing", varName, code="3.5")
 
     def equalNumOfValues(self, arg1, arg2):
         """ Check that arg1 and arg2 contain the same number elements."""
 
         # Determine if args are strings. Strings need to be split up into elements.
-        if isinstance(arg1, basestring):
+        if isinstance(arg1, str):
             arg1 = arg1.split()
 
-        if isinstance(arg2, basestring):
+        if isinstance(arg2, str):
             arg2 = arg2.split()
 
         if numpy.size(arg1) != numpy.size(arg2):
@@ -3399,6 +3778,8 @@ def getargs(arglist):
     coards = None
     version = newest_version
     debug = False
+    fullBoundsCheck = False
+    workers = None
 
     # cacheTables : introduced to enable caching of CF standard name, area type and region name tables.
     cacheTables = False
@@ -3421,7 +3802,8 @@ def getargs(arglist):
         (opts, args) = getopt(arglist[1:], 'a:bcdhlnr:s:t:v:x',
                            ['area_types=', 'badc', 'coards', 'debug', 'help', 'uploader',
                             'noname', 'region_names=', 'cf_standard_names=',
-                            'cache_time_days=', 'version=', 'cache_tables', 'cache_dir='])
+                            'cache_time_days=', 'version=', 'cache_tables', 'cache_dir=',
+                            'full_bounds_check', 'workers='])
     except GetoptError:
         stderr.write('%s\n' % __doc__)
         exit(1)
@@ -3441,6 +3823,9 @@ def getargs(arglist):
         if a in ('-d', '--debug'):
             debug = True
             continue
+        if a == '--full_bounds_check':
+            fullBoundsCheck = True
+            continue
         if a in ('-h', '--help'):
             print(__doc__)
             exit(0)
@@ -3476,19 +3861,68 @@ def getargs(arglist):
         if a in ('-x', '--cache_tables'):
             cacheTables = True
             continue
+        if a == '--workers':
+            try:
+                workers = int(v)
+            except ValueError:
+                workers = 0
+            if workers < 1:
+                stderr.write('ERROR in command line: --workers must be a positive integer\n')
+                exit(1)
+            continue
             
     if len(args) == 0:
         stderr.write('ERROR in command line\n\nusage:\n%s\n' % __doc__)
         exit(1)
 
     return badc, coards, debug, uploader, useFileName, regionnames, standardname, areatypes, cacheDir, cacheTables, \
-           cacheTime, version, args
+           cacheTime, version, fullBoundsCheck, workers, args
+
+
+# CFChecker instance used by each worker process when checking several files at once
+_worker_inst = None
+
+
+def _init_worker(kwargs):
+    global _worker_inst
+    _worker_inst = CFChecker(**kwargs)
+
+
+def _worker_check_file(file):
+    """Check file in a worker process, returning its results, the messages printed and
+    the captured output so that the parent process can report them in order."""
+    from contextlib import redirect_stdout
+    from io import StringIO
+
+    nmessages = len(_worker_inst.all_messages)
+    out = StringIO()
+    try:
+        with redirect_stdout(out):
+            try:
+                _worker_inst.checker(file)
+            except FatalCheckerError:
+                print("Checking of file %s aborted due to error" % file)
+    except Exception as e:
+        # Passed back with the error so that the parent process can still print it
+        e.checker_output = out.getvalue()
+        raise
+    finally:
+        # The parent process keeps the results and messages, so the worker need not
+        results = _worker_inst.all_results.pop(file, None)
+        messages = _worker_inst.all_messages[nmessages:]
+        del _worker_inst.all_messages[nmessages:]
+
+    return results, messages, out.getvalue()
 
 
 def main():
 
+    if Units is None:
+        sys.stderr.write("ERROR: cfunits could not be loaded ({}); it is needed to check units\n".format(_CFUNITS_ERROR))
+        sys.exit(1)
+
     (badc, coards, debug, uploader, useFileName, regionnames, standardName, areaTypes, cacheDir, cacheTables, cacheTime,
-     version, files) = getargs(sys.argv)
+     version, fullBoundsCheck, workers, files) = getargs(sys.argv)
     
     inst = CFChecker(uploader=uploader,
                      useFileName=useFileName,
@@ -3501,12 +3935,9 @@ def main():
                      cacheTables=cacheTables,
                      cacheTime=cacheTime,
                      version=version,
-                     debug=debug)
-    for file in files:
-        try:
-            inst.checker(file)
-        except FatalCheckerError:
-            print("Checking of file %s aborted due to error" % file)
+                     debug=debug,
+                     fullBoundsCheck=fullBoundsCheck)
+    inst.check_files(files, workers=workers)
 
     totals = inst.get_total_counts()
 
@@ -0,0 +1,83 @@
+"""
+Tests of the check that coordinate values lie within their cell boundaries, for
+coordinates long enough that only a sample of their points is checked by default.
+Run with:  python -m unittest discover -s test_files -t test_files
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import netCDF4
+import numpy
+
+from cfchecker import cfchecks
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+REGION_TABLE = """<?xml version="1.0"?>
+<standardized_region_list>
+  <version_number>1</version_number>
+  <date>1 January 2020</date>
+  <entry id="global"/>
+</standardized_region_list>
+"""
+
+
+class BoundsSampleTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.regions = os.path.join(self.tmpdir, 'region.xml')
+        with open(self.regions, 'w') as f:
+            f.write(REGION_TABLE)
+
+        # One point, which is not in the sample, lies outside its cell
+        n = cfchecks._BOUNDS_SAMPLE_LIMIT + 1
+        sample = set(cfchecks._bounds_sample(n))
+        self.outside = next(i for i in range(n // 2, n) if i not in sample)
+
+        self.file = os.path.join(self.tmpdir, 'long_coordinate.nc')
+        with netCDF4.Dataset(self.file, 'w') as f:
+            f.Conventions = 'CF-1.7'
+            f.createDimension('time', n)
+            f.createDimension('nv', 2)
+            time = f.createVariable('time', 'f8', ('time',))
+            time.standard_name = 'time'
+            time.units = 'days since 2000-01-01'
+            time.bounds = 'time_bnds'
+            bnds = f.createVariable('time_bnds', 'f8', ('time', 'nv'))
+            values = numpy.arange(n, dtype='f8')
+            time[:] = values
+            bounds = numpy.column_stack((values - 0.5, values + 0.5))
+            bounds[self.outside] += 10
+            bnds[:] = bounds
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def check(self, **kwargs):
+        inst = cfchecks.CFChecker(cfStandardNamesXML=os.path.join(here, 'cf-standard-name-table.xml'),
+                                  cfAreaTypesXML=os.path.join(here, 'area-type-table.xml'),
+                                  cfRegionNamesXML=self.regions,
+                                  version=cfchecks.CFVersion(), silent=True, **kwargs)
+        inst.checker(self.file)
+        return inst.all_messages
+
+    def test_sampled_by_default(self):
+        messages = self.check()
+        self.assertIn("INFO: (7.1): variable time: Only {} of the {} points checked against their cell boundaries "
+                      "(use --full_bounds_check to check them all)".format(
+                          len(cfchecks._bounds_sample(cfchecks._BOUNDS_SAMPLE_LIMIT + 1)),
+                          cfchecks._BOUNDS_SAMPLE_LIMIT + 1),
+                      messages)
+        self.assertNotIn("WARN: (7.1): variable time: Data for variable time lies outside cell boundaries", messages)
+
+    def test_full_bounds_check(self):
+        messages = self.check(fullBoundsCheck=True)
+        self.assertIn("WARN: (7.1): variable time: Data for variable time lies outside cell boundaries", messages)
+        self.assertFalse([m for m in messages if m.startswith("INFO: (7.1): variable time: Only ")])
+
+
+if __name__ == '__main__':
+    unittest.main()
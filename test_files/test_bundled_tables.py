@@ -0,0 +1,78 @@
+"""
+Tests of the snapshots of the CF tables that may be shipped in cfchecker/data
+(built by python -m cfchecker.build_tables).
+Run with:  python -m unittest discover -s test_files -t test_files
+"""
+import os
+import pathlib
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import mock
+
+from cfchecker import build_tables, cfchecks
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+
+def shipped():
+    """Whether this installation of cfchecker includes a standard name table snapshot"""
+    return cfchecks.bundled_table(cfchecks.STANDARDNAME) is not None
+
+
+class BundledTablesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.tmpdir, 'data'))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def package_data(self):
+        """Use the temporary directory in place of the installed cfchecker package"""
+        return mock.patch('importlib.resources.files', return_value=pathlib.Path(self.tmpdir))
+
+    @unittest.skipUnless(shipped(), "no table snapshots in this installation")
+    def test_shipped_snapshot_loads(self):
+        table = cfchecks.ConstructDict()
+        table.parse(cfchecks.STANDARDNAME)
+        self.assertEqual(table.dict['air_temperature'], 'K')
+        self.assertTrue(table.version_number)
+
+    def test_built_snapshot_loads(self):
+        with redirect_stdout(StringIO()):
+            build_tables.build(os.path.join(here, 'cf-standard-name-table.xml'), cfchecks.STANDARDNAME,
+                               cfchecks.ConstructDict(), os.path.join(self.tmpdir, 'data'))
+            build_tables.build(os.path.join(here, 'area-type-table.xml'), cfchecks.AREATYPES,
+                               cfchecks.ConstructList(), os.path.join(self.tmpdir, 'data'))
+
+        with self.package_data():
+            stdNames = cfchecks.ConstructDict()
+            stdNames.parse(cfchecks.STANDARDNAME)
+            areaTypes = cfchecks.ConstructList()
+            areaTypes.parse(cfchecks.AREATYPES)
+
+        self.assertEqual(stdNames.dict['air_temperature'], 'K')
+        self.assertEqual(stdNames.version_number, '25')
+        self.assertIn('land', areaTypes.list)
+        self.assertEqual(areaTypes.version_number, '2')
+
+    def test_missing_snapshot(self):
+        with self.package_data():
+            self.assertIsNone(cfchecks.bundled_table(cfchecks.STANDARDNAME))
+
+    def test_unreadable_snapshot(self):
+        with open(os.path.join(self.tmpdir, 'data', cfchecks.BUNDLED_TABLES[cfchecks.STANDARDNAME]), 'wb') as f:
+            f.write(b'not a pickle')
+        with self.package_data():
+            self.assertIsNone(cfchecks.bundled_table(cfchecks.STANDARDNAME))
+
+    def test_only_default_tables_bundled(self):
+        self.assertIsNone(cfchecks.bundled_table(os.path.join(here, 'cf-standard-name-table.xml')))
+
+
+if __name__ == '__main__':
+    unittest.main()
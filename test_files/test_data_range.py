@@ -0,0 +1,67 @@
+"""
+Tests of the data range used to check actual_range, which is found by reading the
+variable in blocks along its first dimension.
+Run with:  python -m unittest discover -s test_files -t test_files
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import netCDF4
+import numpy
+
+from cfchecker import cfchecks
+
+
+class DataRangeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.file = os.path.join(self.tmpdir, 'data_range.nc')
+        with netCDF4.Dataset(self.file, 'w') as f:
+            f.createDimension('time', 10)
+            f.createDimension('lat', 3)
+            data = f.createVariable('data', 'f4', ('time', 'lat'), fill_value=-999.)
+            values = numpy.arange(30, dtype='f4').reshape(10, 3)
+            values[0] = -999.
+            values[4, 1] = -999.
+            values[9, 2] = -999.
+            data[:] = values
+            missing = f.createVariable('missing', 'f4', ('time', 'lat'), fill_value=-999.)
+            missing[:] = -999.
+            scaled = f.createVariable('scaled', 'i2', ('time',))
+            scaled.scale_factor = numpy.float32(0.5)
+            scaled.add_offset = numpy.float32(100.)
+            scaled[:] = numpy.arange(10) * 0.5 + 100.
+            scalar = f.createVariable('scalar', 'f8', ())
+            scalar[...] = 7.
+            f.createDimension('empty', None)
+            f.createVariable('empty', 'f4', ('empty',))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def data_range(self, varName, blockSize=cfchecks._RANGE_BLOCK_SIZE):
+        with netCDF4.Dataset(self.file) as f, mock.patch.object(cfchecks, '_RANGE_BLOCK_SIZE', blockSize):
+            return cfchecks._data_range(f.variables[varName])
+
+    def test_blocks_match_whole_variable(self):
+        # 4 values at a time is one row of 3 per block
+        for blockSize in (4, 7, 1000):
+            self.assertEqual(self.data_range('data', blockSize), (3, 28))
+
+    def test_all_missing(self):
+        self.assertIsNone(self.data_range('missing', 4))
+        self.assertIsNone(self.data_range('empty'))
+
+    def test_scaled(self):
+        self.assertEqual(self.data_range('scaled', 3), (100., 104.5))
+
+    def test_scalar(self):
+        self.assertEqual(self.data_range('scalar'), (7., 7.))
+
+
+if __name__ == '__main__':
+    unittest.main()
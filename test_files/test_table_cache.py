@@ -0,0 +1,158 @@
+"""
+Tests of the caching of parsed CF tables in pickle files (cfchecks -x).
+Run with:  python -m unittest discover -s test_files -t test_files
+"""
+import os
+import pickle
+import shutil
+import tempfile
+import time
+import unittest
+
+from cfchecker import cfchecks
+
+STANDARD_NAME_TABLE = """<?xml version="1.0"?>
+<standard_name_table>
+  <version_number>1</version_number>
+  <last_modified>2020-01-01T00:00:00Z</last_modified>
+  <entry id="air_temperature">
+    <canonical_units>K</canonical_units>
+  </entry>
+  <entry id="air_pressure">
+    <canonical_units>Pa</canonical_units>
+  </entry>
+  <alias id="air_temperature_alias">
+    <entry_id>air_temperature</entry_id>
+  </alias>
+</standard_name_table>
+"""
+
+AREA_TYPE_TABLE = """<?xml version="1.0"?>
+<area_type_table>
+  <version_number>1</version_number>
+  <date>1 January 2020</date>
+  <entry id="land"/>
+  <entry id="sea"/>
+</area_type_table>
+"""
+
+
+class TableCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.cacheDir = os.path.join(self.tmpdir, 'cache')
+        os.mkdir(self.cacheDir)
+        self.stdNames = self.write_table('standard_names.xml', STANDARD_NAME_TABLE)
+        self.areaTypes = self.write_table('area_types.xml', AREA_TYPE_TABLE)
+        # Make sure the tables are older than any cache file written by the tests
+        past = time.time() - 24 * 3600
+        for table in (self.stdNames, self.areaTypes):
+            os.utime(table, (past, past))
+        cfchecks._TABLE_CACHE.clear()
+
+    def tearDown(self):
+        cfchecks._TABLE_CACHE.clear()
+        shutil.rmtree(self.tmpdir)
+
+    def write_table(self, name, content):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def construct(self, cls, source, shelveFile, cacheTime=3600):
+        return cls(useShelve=True, shelveFile=shelveFile, cacheTime=cacheTime, cacheDir=self.cacheDir,
+                   source=source)
+
+    def cache(self, source, shelveFile):
+        return cfchecks.cache_file(self.cacheDir, shelveFile, source) + '.pkl'
+
+    def test_cache_written_and_read_back(self):
+        table = self.construct(cfchecks.ConstructDict, self.stdNames, 'cfexpr_cache')
+        self.assertFalse(table.current)
+        table.parse(self.stdNames)
+        table.close()
+        self.assertTrue(os.path.exists(self.cache(self.stdNames, 'cfexpr_cache')))
+
+        cached = self.construct(cfchecks.ConstructDict, self.stdNames, 'cfexpr_cache')
+        self.assertTrue(cached.current)
+        self.assertEqual(cached.dict, {'air_temperature': 'K', 'air_pressure': 'Pa',
+                                       'air_temperature_alias': 'K'})
+        self.assertEqual(cached.version_number, '1')
+        self.assertEqual(cached.last_modified, '2020-01-01T00:00:00Z')
+
+    def test_list_cache_written_and_read_back(self):
+        table = self.construct(cfchecks.ConstructList, self.areaTypes, 'cfarea_cache')
+        table.parse(self.areaTypes)
+        table.close()
+
+        cached = self.construct(cfchecks.ConstructList, self.areaTypes, 'cfarea_cache')
+        self.assertTrue(cached.current)
+        self.assertEqual(cached.list, frozenset(['land', 'sea']))
+        self.assertEqual(cached.last_modified, '1 January 2020')
+
+    def test_cache_file_names_depend_on_source(self):
+        self.assertNotEqual(self.cache(self.stdNames, 'cfexpr_cache'),
+                            self.cache(self.stdNames + '.other', 'cfexpr_cache'))
+        self.assertEqual(self.cache(self.stdNames, 'cfexpr_cache'),
+                         self.cache(self.stdNames, 'cfexpr_cache'))
+
+    def test_stale_cache_parsed_again(self):
+        table = self.construct(cfchecks.ConstructDict, self.stdNames, 'cfexpr_cache')
+        table.parse(self.stdNames)
+        table.close()
+
+        # Make the cache file look two hours old
+        cacheFile = self.cache(self.stdNames, 'cfexpr_cache')
+        with open(cacheFile, 'rb') as f:
+            data = pickle.load(f)
+        data['__ctime__'] -= 7200
+        with open(cacheFile, 'wb') as f:
+            pickle.dump(data, f)
+
+        self.assertTrue(self.construct(cfchecks.ConstructDict, self.stdNames, 'cfexpr_cache',
+                                       cacheTime=3 * 3600).current)
+        self.assertFalse(self.construct(cfchecks.ConstructDict, self.stdNames, 'cfexpr_cache',
+                                        cacheTime=3600).current)
+
+    def test_cache_older_than_local_table_parsed_again(self):
+        table = self.construct(cfchecks.ConstructDict, self.stdNames, 'cfexpr_cache')
+        table.parse(self.stdNames)
+        table.close()
+
+        future = time.time() + 60
+        os.utime(self.stdNames, (future, future))
+        self.assertFalse(self.construct(cfchecks.ConstructDict, self.stdNames, 'cfexpr_cache').current)
+
+    def test_get_table_uses_cache_from_previous_run(self):
+        def get_table():
+            inst = cfchecks.CFChecker(cacheTables=True, cacheDir=self.cacheDir, cacheTime=3600, silent=True)
+            return inst._get_table(cfchecks.ConstructDict, self.stdNames, 'cfexpr_cache')
+
+        self.assertIn('air_temperature', get_table().dict)
+
+        # Change the entries in the cache file, so that it shows if the next run reads it
+        cacheFile = self.cache(self.stdNames, 'cfexpr_cache')
+        with open(cacheFile, 'rb') as f:
+            data = pickle.load(f)
+        data['entries'] = {'cached_name': '1'}
+        with open(cacheFile, 'wb') as f:
+            pickle.dump(data, f)
+
+        # A new run (the in-process table cache is cleared) reads the cache file
+        cfchecks._TABLE_CACHE.clear()
+        self.assertEqual(get_table().dict, {'cached_name': '1'})
+
+        # ...unless it has expired, when the table is parsed and the cache rewritten
+        data['__ctime__'] -= 7200
+        with open(cacheFile, 'wb') as f:
+            pickle.dump(data, f)
+        cfchecks._TABLE_CACHE.clear()
+        self.assertIn('air_temperature', get_table().dict)
+        with open(cacheFile, 'rb') as f:
+            self.assertIn('air_temperature', pickle.load(f)['entries'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Tests that the CF tables are parsed the same with lxml and with the ElementTree
+parser used when lxml is not installed.
+Run with:  python -m unittest discover -s test_files -t test_files
+"""
+import os
+import unittest
+from unittest import mock
+from xml.etree import ElementTree
+
+from cfchecker import cfchecks
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+STANDARD_NAMES = os.path.join(here, 'cf-standard-name-table.xml')
+AREA_TYPES = os.path.join(here, 'area-type-table.xml')
+
+try:
+    import lxml.etree
+except ImportError:
+    lxml = None
+
+
+def without_lxml():
+    """Parse as cfchecks does when lxml can't be imported"""
+    return mock.patch.multiple(cfchecks, _LXML=False, etree=ElementTree)
+
+
+def with_lxml():
+    return mock.patch.multiple(cfchecks, _LXML=True, etree=lxml.etree)
+
+
+def as_url():
+    """Read local tables through the incremental parsing used for tables given as URLs"""
+    return mock.patch.object(cfchecks, 'open_table', lambda source: open(source[len('http://'):], 'rb'))
+
+
+def parse(cls, source):
+    table = cls()
+    table.parse(source, bundled=False)
+    entries = table.dict if cls is cfchecks.ConstructDict else table.list
+    return entries, table.version_number, table.last_modified
+
+
+@unittest.skipIf(lxml is None, "lxml is not installed")
+class TableParsersTest(unittest.TestCase):
+
+    def compare(self, cls, source):
+        with with_lxml():
+            expected = parse(cls, source)
+        with without_lxml():
+            self.assertEqual(parse(cls, source), expected)
+        return expected
+
+    def test_standard_names(self):
+        entries, version, last_modified = self.compare(cfchecks.ConstructDict, STANDARD_NAMES)
+        self.assertEqual(entries['air_temperature'], 'K')
+        # An alias
+        self.assertEqual(entries['aerosol_angstrom_exponent'], entries['angstrom_exponent_of_ambient_aerosol_in_air'])
+        self.assertEqual(version, '25')
+        self.assertEqual(last_modified, '2013-07-05T05:40:30Z')
+
+    def test_area_types(self):
+        entries, version, last_modified = self.compare(cfchecks.ConstructList, AREA_TYPES)
+        self.assertIn('land', entries)
+        self.assertEqual(version, '2')
+        self.assertEqual(last_modified, '10 July 2013')
+
+    def test_standard_names_from_url(self):
+        with as_url():
+            entries = self.compare(cfchecks.ConstructDict, 'http://' + STANDARD_NAMES)
+        self.assertEqual(entries, parse(cfchecks.ConstructDict, STANDARD_NAMES))
+
+    def test_area_types_from_url(self):
+        with as_url():
+            entries = self.compare(cfchecks.ConstructList, 'http://' + AREA_TYPES)
+        self.assertEqual(entries, parse(cfchecks.ConstructList, AREA_TYPES))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -53,6 +53,17 @@ do
   fi
 done
 
+# Unit tests (test_*.py)
+python -m unittest discover -s . -t . > $outdir/unittests.out 2>&1
+if test $? == 0
+then
+  echo unittests: Success
+  rm $outdir/unittests.out
+else
+  echo unittests: Failed
+  failed=`expr $failed + 1`
+fi
+
 # Print Test Results Summary
 echo ""
 if [[ $failed != 0 ]]